@@ -1,6 +1,6 @@
 """Builders for Kubernetes resources."""
 
-from .provider import create_provider_from_spec
+from .provider import create_provider_from_spec, get_cached_provider_client
 
-__all__ = ["create_provider_from_spec"]
+__all__ = ["create_provider_from_spec", "get_cached_provider_client"]
 
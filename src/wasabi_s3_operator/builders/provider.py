@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import threading
 from typing import Any
 
-from kubernetes import client, config
-
 from ..services.aws.client import AWSProvider
+from ..utils.k8s import get_core_api
 from ..utils.secrets import get_secret_value
 
+# Provider clients keyed by Provider UID -> (resourceVersion, client)
+_provider_clients: dict[str, tuple[str, AWSProvider]] = {}
+_provider_clients_lock = threading.Lock()
+
 
 def create_provider_from_spec(
     spec: dict[str, Any],
@@ -26,13 +30,7 @@ def create_provider_from_spec(
     Raises:
         ValueError: If configuration is invalid
     """
-    # Get Kubernetes API client
-    try:
-        config.load_incluster_config()
-    except config.ConfigException:
-        config.load_kube_config()
-
-    api = client.CoreV1Api()
+    api = get_core_api()
 
     namespace = meta.get("namespace", "default")
 
@@ -92,3 +90,49 @@ def create_provider_from_spec(
     else:
         raise ValueError(f"Unsupported provider type: {provider_type}. Only 'wasabi' is supported.")
 
+
+
+def get_cached_provider_client(
+    spec: dict[str, Any],
+    meta: dict[str, Any],
+) -> AWSProvider:
+    """Get a provider client, reusing the one built for the same Provider revision.
+
+    Clients are cached per Provider UID and rebuilt whenever the Provider's
+    resourceVersion changes. Objects without a UID or resourceVersion are
+    never cached.
+
+    Args:
+        spec: Provider CRD spec
+        meta: Provider resource metadata
+
+    Returns:
+        Configured S3 provider instance
+    """
+    uid = meta.get("uid")
+    resource_version = meta.get("resourceVersion")
+    if not uid or not resource_version:
+        return create_provider_from_spec(spec, meta)
+
+    with _provider_clients_lock:
+        cached = _provider_clients.get(uid)
+    if cached is not None and cached[0] == resource_version:
+        return cached[1]
+
+    provider = create_provider_from_spec(spec, meta)
+    with _provider_clients_lock:
+        _provider_clients[uid] = (resource_version, provider)
+    return provider
+
+
+def invalidate_provider_client(uid: str | None = None) -> None:
+    """Drop cached provider clients.
+
+    Args:
+        uid: Provider UID to drop (if None, clears all)
+    """
+    with _provider_clients_lock:
+        if uid is None:
+            _provider_clients.clear()
+        else:
+            _provider_clients.pop(uid, None)
@@ -19,6 +19,7 @@ LABEL_BUCKET_NAME = f"{API_GROUP}/bucket-name"
 
 # Annotations
 ANNOTATION_OWNER_UID = f"{API_GROUP}/owner-uid"
+ANNOTATION_ACCESS_KEY_CREATING = f"{API_GROUP}/access-key-creating"
 
 # Finalizers
 FINALIZER = f"{API_GROUP}/finalizer"
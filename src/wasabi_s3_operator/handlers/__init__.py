@@ -5,6 +5,7 @@ from . import access_key  # noqa: F401
 from . import bucket  # noqa: F401
 from . import bucket_policy  # noqa: F401
 from . import iampolicy  # noqa: F401
+from . import indexes  # noqa: F401
 from . import provider  # noqa: F401
 from . import user  # noqa: F401
 
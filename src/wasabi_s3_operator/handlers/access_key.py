@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -9,12 +12,13 @@ import kopf
 from kubernetes import client
 
 from .. import metrics
-from ..builders.provider import create_provider_from_spec
-from ..constants import API_GROUP_VERSION, KIND_ACCESS_KEY
+from ..builders.provider import get_cached_provider_client
+from ..constants import ANNOTATION_ACCESS_KEY_CREATING, API_GROUP_VERSION, COND_READY, KIND_ACCESS_KEY
 from ..handlers.shared import get_provider_with_cache, get_user_with_cache, get_k8s_client
 from ..tracing import trace_span
 from ..utils.access_keys import create_access_key_secret, update_access_key_secret
 from ..utils.conditions import (
+    Conditions,
     set_creation_failed_condition,
     set_provider_not_ready_condition,
     set_ready_condition,
@@ -26,14 +30,116 @@ from ..utils.events import (
     emit_access_key_rotated,
     emit_validate_succeeded,
 )
+from ..utils.k8s import get_core_api
 from ..utils.secrets import (
     cleanup_expired_previous_secrets,
     create_previous_secret,
     list_previous_secrets,
     read_secret_data,
 )
+from ..utils.timestamps import ISO_FORMAT, now_iso, parse_iso
 from .base import BaseHandler
 
+# Seconds an access-key creation claim blocks other reconciles of the same AccessKey
+_CREATION_CLAIM_TTL_SECONDS = 60
+
+# Background pool for deleting expired previous keys and their secrets
+_cleanup_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="accesskey-cleanup")
+
+# Minimum seconds between expired-key cleanups of one AccessKey
+_CLEANUP_INTERVAL_SECONDS = int(os.getenv("ACCESS_KEY_CLEANUP_INTERVAL_SECONDS", "3600"))
+
+# Upper bound on concurrent secret reads / IAM deletes within one cleanup
+_MAX_PARALLEL_KEY_DELETES = 8
+
+# AccessKey UIDs with a cleanup queued or running
+_cleanup_inflight: set[str] = set()
+_cleanup_inflight_lock = threading.Lock()
+
+# Finish time of the last successful cleanup by AccessKey UID, copied into
+# status.lastCleanupTime by the next reconcile (guarded by _cleanup_inflight_lock)
+_cleanup_completed: dict[str, str] = {}
+
+# Pre-bound reconcile counters
+_RECONCILE_FAILED = metrics.reconcile_total.labels(kind=KIND_ACCESS_KEY, result="failed")
+_RECONCILE_SUCCESS = metrics.reconcile_total.labels(kind=KIND_ACCESS_KEY, result="success")
+
+# Static part of the owner reference placed on credential secrets
+_ACCESS_KEY_OWNER_TEMPLATE = {"apiVersion": API_GROUP_VERSION, "kind": KIND_ACCESS_KEY, "controller": True}
+
+
+def _owner_references(name: str, meta: dict[str, Any]) -> list[dict[str, Any]]:
+    """Build the owner references pointing a secret at its AccessKey."""
+    return [{**_ACCESS_KEY_OWNER_TEMPLATE, "name": name, "uid": meta.get("uid")}]
+
+
+def _patch_failure(patch: kopf.Patch, meta: dict[str, Any], conditions: Conditions) -> None:
+    """Count a failed reconcile and record its conditions in the status."""
+    _RECONCILE_FAILED.inc()
+    patch.status.update({
+        "conditions": conditions.to_list(),
+        "observedGeneration": meta.get("generation", 0),
+    })
+
+def _cleanup_key(meta: dict[str, Any]) -> str:
+    """Key identifying an AccessKey's background cleanup."""
+    return meta.get("uid") or f"{meta.get('namespace', 'default')}/{meta.get('name', 'unknown')}"
+
+
+def _cleanup_due(status: dict[str, Any], now: datetime, key: str | None = None) -> bool:
+    """Check whether expired previous keys should be cleaned up again.
+
+    Only successful cleanups count: a cleanup that finished since the last
+    status write is looked up by ``key``, and a failed one records nothing.
+
+    Args:
+        status: AccessKey status
+        now: Current time of this reconcile
+        key: Cleanup key from ``_cleanup_key``
+
+    Returns:
+        True if the last successful cleanup is unknown, unparseable, or older
+        than ``_CLEANUP_INTERVAL_SECONDS``
+    """
+    with _cleanup_inflight_lock:
+        last_cleanup = _cleanup_completed.get(key) if key else None
+    last_cleanup = last_cleanup or status.get("lastCleanupTime")
+    if not last_cleanup:
+        return True
+    try:
+        return now.timestamp() - parse_iso(last_cleanup) >= _CLEANUP_INTERVAL_SECONDS
+    except ValueError:
+        return True
+
+
+# Parsed nextRotateTime by AccessKey uid, as (raw string, datetime)
+_next_rotate_times: dict[str, tuple[str, datetime]] = {}
+
+
+def _parse_next_rotate_time(uid: str | None, value: str) -> datetime:
+    """Parse a nextRotateTime status value, reusing the last result per uid.
+
+    ``fromisoformat`` only runs when the stored string changes, i.e. once
+    per rotation rather than on every reconcile.
+
+    Args:
+        uid: AccessKey UID (parsing is not cached when missing)
+        value: nextRotateTime status value
+
+    Returns:
+        Timezone-aware datetime
+
+    Raises:
+        ValueError: If the value is not an ISO 8601 timestamp
+    """
+    cached = _next_rotate_times.get(uid) if uid else None
+    if cached is not None and cached[0] == value:
+        return cached[1]
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if uid:
+        _next_rotate_times[uid] = (value, parsed)
+    return parsed
+
 
 class AccessKeyHandler(BaseHandler):
     """Handler for AccessKey resources."""
@@ -48,6 +154,8 @@ class AccessKeyHandler(BaseHandler):
         meta: dict[str, Any],
         status: dict[str, Any],
         patch: kopf.Patch,
+        provider_index: kopf.Index | None = None,
+        user_index: kopf.Index | None = None,
     ) -> None:
         """Reconcile AccessKey resource."""
         namespace = meta.get("namespace", "default")
@@ -67,13 +175,7 @@ class AccessKeyHandler(BaseHandler):
             provider_ns = provider_ref.get("namespace", namespace)
 
             try:
-                provider_obj = api.get_namespaced_custom_object(
-                    group="s3.cloud37.dev",
-                    version="v1alpha1",
-                    namespace=provider_ns,
-                    plural="providers",
-                    name=provider_name,
-                )
+                provider_obj = get_provider_with_cache(api, provider_name, provider_ns, namespace, provider_index)
             except client.exceptions.ApiException as e:
                 if e.status == 404:
                     error_msg = f"Provider {provider_name} not found in namespace {provider_ns}"
@@ -83,19 +185,12 @@ class AccessKeyHandler(BaseHandler):
 
             # Check if provider is ready
             provider_status = provider_obj.get("status", {})
-            provider_conditions = provider_status.get("conditions", [])
-            provider_ready = any(
-                cond.get("type") == "Ready" and cond.get("status") == "True" for cond in provider_conditions
-            )
+            provider_ready = Conditions(provider_status.get("conditions")).is_true(COND_READY)
 
             if not provider_ready:
                 error_msg = f"Provider {provider_name} is not ready"
                 self.handle_provider_not_ready(meta, status, patch, provider_name, error_msg)
 
-            # Create provider client
-            provider_spec = provider_obj.get("spec", {})
-            provider_client = create_provider_from_spec(provider_spec, provider_obj.get("metadata", {}))
-
             # Validate userRef
             user_ref = spec.get("userRef", {})
             user_name = user_ref.get("name")
@@ -103,44 +198,33 @@ class AccessKeyHandler(BaseHandler):
             if not user_name:
                 error_msg = "userRef.name is required for creating access keys"
                 emit_validate_failed(meta, error_msg)
-                metrics.reconcile_total.labels(kind=KIND_ACCESS_KEY, result="failed").inc()
+                _RECONCILE_FAILED.inc()
                 raise ValueError(error_msg)
 
             # Get user
             try:
                 user_ns = user_ref.get("namespace", namespace)
-                user_obj = get_user_with_cache(api, user_name, user_ns)
+                user_obj = get_user_with_cache(api, user_name, user_ns, user_index)
             except client.exceptions.ApiException as e:
                 if e.status == 404:
                     error_msg = f"User {user_name} not found in namespace {user_ns}"
                     self.log_error(meta, error_msg, reason="UserNotFound", user_name=user_name, user_ns=user_ns)
-                    conditions = status.get("conditions", [])
+                    conditions = Conditions(status.get("conditions"))
                     conditions = set_provider_not_ready_condition(conditions, error_msg)
-                    metrics.reconcile_total.labels(kind=KIND_ACCESS_KEY, result="failed").inc()
-                    patch.status.update({
-                        "conditions": conditions,
-                        "observedGeneration": meta.get("generation", 0),
-                    })
+                    _patch_failure(patch, meta, conditions)
                     return
                 raise
 
             # Check if user is ready
             user_status = user_obj.get("status", {})
-            user_conditions = user_status.get("conditions", [])
-            user_ready = any(
-                cond.get("type") == "Ready" and cond.get("status") == "True" for cond in user_conditions
-            )
+            user_ready = Conditions(user_status.get("conditions")).is_true(COND_READY)
 
             if not user_ready:
                 error_msg = f"User {user_name} is not ready"
                 self.log_warning(meta, error_msg, reason="UserNotReady", user_name=user_name)
-                conditions = status.get("conditions", [])
+                conditions = Conditions(status.get("conditions"))
                 conditions = set_provider_not_ready_condition(conditions, error_msg)
-                metrics.reconcile_total.labels(kind=KIND_ACCESS_KEY, result="failed").inc()
-                patch.status.update({
-                    "conditions": conditions,
-                    "observedGeneration": meta.get("generation", 0),
-                })
+                _patch_failure(patch, meta, conditions)
                 raise kopf.TemporaryError(error_msg)
 
             # Get IAM user name
@@ -152,19 +236,22 @@ class AccessKeyHandler(BaseHandler):
 
             # Check existing key and rotation
             existing_key_id = status.get("accessKeyId")
-            conditions = status.get("conditions", [])
+            conditions = Conditions(status.get("conditions"))
             rotate_config = spec.get("rotate", {})
             rotation_enabled = rotate_config.get("enabled", False)
             rotation_interval_days = rotate_config.get("intervalDays", 90)
             retention_days = rotate_config.get("previousKeysRetentionDays", 7)
 
+            # Single clock read shared by the rotation check and status timestamps
+            now = datetime.now(timezone.utc)
+
             needs_rotation = False
             if rotation_enabled and existing_key_id:
                 next_rotate_time_str = status.get("nextRotateTime")
                 if next_rotate_time_str:
                     try:
-                        next_rotate_time = datetime.fromisoformat(next_rotate_time_str.replace('Z', '+00:00'))
-                        if datetime.now(timezone.utc) >= next_rotate_time:
+                        next_rotate_time = _parse_next_rotate_time(meta.get("uid"), next_rotate_time_str)
+                        if now >= next_rotate_time:
                             needs_rotation = True
                             self.log_info(meta, f"Access key {existing_key_id} needs rotation",
                                          reason="RotationNeeded", access_key_id=existing_key_id)
@@ -172,22 +259,81 @@ class AccessKeyHandler(BaseHandler):
                         self.log_warning(meta, f"Failed to parse nextRotateTime: {e}",
                                        reason="ParseError", error=str(e))
 
+            # Expired-key cleanup runs at most once per _CLEANUP_INTERVAL_SECONDS
+            cleanup_due = rotation_enabled and bool(existing_key_id) and _cleanup_due(status, now, _cleanup_key(meta))
+
+            # Steady-state reconciles (key exists, nothing to rotate or clean
+            # up) make no provider calls, so skip building the client
+            provider_client = None
+            if not existing_key_id or needs_rotation or cleanup_due:
+                provider_spec = provider_obj.get("spec", {})
+                provider_client = get_cached_provider_client(provider_spec, provider_obj.get("metadata", {}))
+
             if not existing_key_id:
-                self._create_access_key(
-                    provider_client, iam_user_name, name, namespace, meta, status, patch,
-                    rotation_enabled, rotation_interval_days, conditions
-                )
+                self._claim_key_creation(api, meta, now)
+                try:
+                    self._create_access_key(
+                        provider_client, iam_user_name, name, namespace, meta, status, patch,
+                        rotation_enabled, rotation_interval_days, conditions, now
+                    )
+                finally:
+                    # Release the claim together with the status write
+                    patch.meta.annotations[ANNOTATION_ACCESS_KEY_CREATING] = None
             elif needs_rotation:
                 self._rotate_access_key(
                     provider_client, iam_user_name, existing_key_id, name, namespace, meta, status, patch,
-                    rotation_interval_days, conditions
+                    rotation_interval_days, conditions, now
                 )
             else:
                 self._maintain_access_key(
                     provider_client, iam_user_name, existing_key_id, name, namespace, meta, status, patch,
-                    rotation_enabled, retention_days, conditions
+                    rotation_enabled, retention_days, conditions, cleanup_due, now
                 )
 
+    def _claim_key_creation(self, api: Any, meta: dict[str, Any], now: datetime) -> None:
+        """Claim the right to create the IAM access key for this AccessKey.
+
+        Writes a timestamp annotation with a resourceVersion precondition, so
+        of two reconciles racing on the same object (or a retry racing with a
+        slow status write) only one reaches ``create_access_key``. A claim
+        younger than ``_CREATION_CLAIM_TTL_SECONDS`` defers the caller.
+
+        Args:
+            api: Kubernetes CustomObjectsApi instance
+            meta: Kubernetes resource metadata
+            now: Current time of this reconcile
+
+        Raises:
+            kopf.TemporaryError: If another reconcile holds or wins the claim
+        """
+        claimed_at = meta.get("annotations", {}).get(ANNOTATION_ACCESS_KEY_CREATING)
+        if claimed_at:
+            try:
+                fresh = now.timestamp() - parse_iso(claimed_at) < _CREATION_CLAIM_TTL_SECONDS
+            except ValueError:
+                fresh = False
+            if fresh:
+                raise kopf.TemporaryError("Access key creation already in progress", delay=30)
+
+        try:
+            api.patch_namespaced_custom_object(
+                group="s3.cloud37.dev",
+                version="v1alpha1",
+                namespace=meta.get("namespace", "default"),
+                plural="accesskeys",
+                name=meta.get("name"),
+                body={
+                    "metadata": {
+                        "resourceVersion": meta.get("resourceVersion"),
+                        "annotations": {ANNOTATION_ACCESS_KEY_CREATING: now.strftime(ISO_FORMAT)},
+                    }
+                },
+            )
+        except client.exceptions.ApiException as e:
+            if e.status == 409:
+                raise kopf.TemporaryError("AccessKey changed while claiming key creation", delay=5) from e
+            raise
+
     def _create_access_key(
         self,
         provider_client: Any,
@@ -199,7 +345,8 @@ class AccessKeyHandler(BaseHandler):
         patch: kopf.Patch,
         rotation_enabled: bool,
         rotation_interval_days: int,
-        conditions: list[dict[str, Any]],
+        conditions: Conditions,
+        now: datetime,
     ) -> None:
         """Create a new access key."""
         with trace_span("create_access_key", kind=KIND_ACCESS_KEY):
@@ -210,7 +357,7 @@ class AccessKeyHandler(BaseHandler):
 
                 # Create Kubernetes secret
                 secret_name = f"{name}-credentials"
-                core_api = client.CoreV1Api()
+                core_api = get_core_api()
                 try:
                     create_access_key_secret(
                         core_api,
@@ -218,15 +365,7 @@ class AccessKeyHandler(BaseHandler):
                         secret_name,
                         access_key_id,
                         secret_access_key,
-                        owner_references=[
-                            {
-                                "apiVersion": "s3.cloud37.dev/v1alpha1",
-                                "kind": "AccessKey",
-                                "name": name,
-                                "uid": meta.get("uid"),
-                                "controller": True,
-                            }
-                        ],
+                        owner_references=_owner_references(name, meta),
                     )
                     emit_access_key_created(meta, access_key_id)
                     self.log_info(meta, f"Created access key {access_key_id} for user {iam_user_name}",
@@ -239,35 +378,32 @@ class AccessKeyHandler(BaseHandler):
                         raise
 
                 # Calculate next rotation time
-                last_rotate_time = datetime.now(timezone.utc).isoformat()
+                last_rotate_time = now.isoformat()
                 next_rotate_time = None
                 if rotation_enabled:
-                    next_rotate_time = (datetime.now(timezone.utc) + timedelta(days=rotation_interval_days)).isoformat()
+                    next_rotate_time = (now + timedelta(days=rotation_interval_days)).isoformat()
 
                 conditions = set_ready_condition(conditions, True, f"Access key {access_key_id} created for user {iam_user_name}")
 
                 status_update = {
                     "observedGeneration": meta.get("generation", 0),
                     "accessKeyId": access_key_id,
+                    "iamUserName": iam_user_name,
                     "created": True,
-                    "conditions": conditions,
+                    "conditions": conditions.to_list(),
                 }
 
                 if rotation_enabled:
                     status_update["lastRotateTime"] = last_rotate_time
                     status_update["nextRotateTime"] = next_rotate_time
 
-                metrics.reconcile_total.labels(kind=KIND_ACCESS_KEY, result="success").inc()
+                _RECONCILE_SUCCESS.inc()
                 patch.status.update(status_update)
             except Exception as e:
                 error_msg = f"Failed to create access key: {str(e)}"
                 self.log_error(meta, error_msg, error=e, reason="CreationFailed", iam_user_name=iam_user_name)
                 conditions = set_creation_failed_condition(conditions, error_msg)
-                metrics.reconcile_total.labels(kind=KIND_ACCESS_KEY, result="failed").inc()
-                patch.status.update({
-                    "conditions": conditions,
-                    "observedGeneration": meta.get("generation", 0),
-                })
+                _patch_failure(patch, meta, conditions)
 
     def _rotate_access_key(
         self,
@@ -280,7 +416,8 @@ class AccessKeyHandler(BaseHandler):
         status: dict[str, Any],
         patch: kopf.Patch,
         rotation_interval_days: int,
-        conditions: list[dict[str, Any]],
+        conditions: Conditions,
+        now: datetime,
     ) -> None:
         """Rotate an existing access key."""
         with trace_span("rotate_access_key", kind=KIND_ACCESS_KEY):
@@ -290,7 +427,7 @@ class AccessKeyHandler(BaseHandler):
 
                 # Read current secret
                 secret_name = f"{name}-credentials"
-                core_api = client.CoreV1Api()
+                core_api = get_core_api()
                 old_secret_data = read_secret_data(core_api, namespace, secret_name)
                 old_access_key_id = old_secret_data.get("access-key-id")
                 old_secret_access_key = old_secret_data.get("secret-access-key")
@@ -307,9 +444,8 @@ class AccessKeyHandler(BaseHandler):
                              reason="NewAccessKeyCreated", access_key_id=new_access_key_id, iam_user_name=iam_user_name)
 
                 # Create previous secret
-                rotated_at = datetime.now(timezone.utc).isoformat()
-                timestamp_str = rotated_at.replace("-", "").replace(":", "").replace(".", "").split("+")[0].split("T")
-                timestamp_str = "".join(timestamp_str)[:14]
+                rotated_at = now.isoformat()
+                timestamp_str = now.strftime("%Y%m%d%H%M%S")
                 previous_secret_name = f"{name}-credentials-previous-{timestamp_str}"
 
                 create_previous_secret(
@@ -320,15 +456,7 @@ class AccessKeyHandler(BaseHandler):
                     old_secret_access_key,
                     rotated_at,
                     name,
-                    owner_references=[
-                        {
-                            "apiVersion": "s3.cloud37.dev/v1alpha1",
-                            "kind": "AccessKey",
-                            "name": name,
-                            "uid": meta.get("uid"),
-                            "controller": True,
-                        }
-                    ],
+                    owner_references=_owner_references(name, meta),
                 )
                 self.log_info(meta, f"Created previous secret {previous_secret_name}",
                              reason="PreviousSecretCreated", previous_secret_name=previous_secret_name)
@@ -346,7 +474,7 @@ class AccessKeyHandler(BaseHandler):
 
                 # Calculate next rotation time
                 last_rotate_time = rotated_at
-                next_rotate_time = (datetime.now(timezone.utc) + timedelta(days=rotation_interval_days)).isoformat()
+                next_rotate_time = (now + timedelta(days=rotation_interval_days)).isoformat()
 
                 emit_access_key_rotated(meta, new_access_key_id)
                 conditions = set_ready_condition(conditions, True, f"Access key rotated to {new_access_key_id}")
@@ -354,23 +482,20 @@ class AccessKeyHandler(BaseHandler):
                 status_update = {
                     "observedGeneration": meta.get("generation", 0),
                     "accessKeyId": new_access_key_id,
+                    "iamUserName": iam_user_name,
                     "created": True,
                     "lastRotateTime": last_rotate_time,
                     "nextRotateTime": next_rotate_time,
-                    "conditions": conditions,
+                    "conditions": conditions.to_list(),
                 }
 
-                metrics.reconcile_total.labels(kind=KIND_ACCESS_KEY, result="success").inc()
+                _RECONCILE_SUCCESS.inc()
                 patch.status.update(status_update)
             except Exception as e:
                 error_msg = f"Failed to rotate access key: {str(e)}"
                 self.log_error(meta, error_msg, error=e, reason="RotationFailed", access_key_id=existing_key_id, iam_user_name=iam_user_name)
                 conditions = set_rotation_failed_condition(conditions, error_msg)
-                metrics.reconcile_total.labels(kind=KIND_ACCESS_KEY, result="failed").inc()
-                patch.status.update({
-                    "conditions": conditions,
-                    "observedGeneration": meta.get("generation", 0),
-                })
+                _patch_failure(patch, meta, conditions)
 
     def _maintain_access_key(
         self,
@@ -384,64 +509,37 @@ class AccessKeyHandler(BaseHandler):
         patch: kopf.Patch,
         rotation_enabled: bool,
         retention_days: int,
-        conditions: list[dict[str, Any]],
+        conditions: Conditions,
+        cleanup_due: bool,
+        now: datetime,
     ) -> None:
         """Maintain existing access key (cleanup expired secrets)."""
         self.log_info(meta, f"Access key {existing_key_id} already exists",
                      reason="AccessKeyExists", access_key_id=existing_key_id)
 
-        if rotation_enabled:
-            core_api = client.CoreV1Api()
-            try:
-                expired_secrets = list_previous_secrets(
-                    core_api,
-                    namespace,
-                    name,
-                    include_expired=True,
-                    retention_days=retention_days,
-                )
-                expired_secrets = [s for s in expired_secrets if s.get("is_expired", False)]
-
-                # Delete expired access keys from Wasabi
-                for secret_info in expired_secrets:
-                    try:
-                        secret_data = read_secret_data(core_api, namespace, secret_info["name"])
-                        expired_key_id = secret_data.get("access-key-id")
-
-                        if expired_key_id:
-                            try:
-                                provider_client.delete_access_key(iam_user_name, expired_key_id)
-                                self.log_info(meta, f"Deleted expired access key {expired_key_id} from Wasabi",
-                                             reason="ExpiredKeyDeleted", access_key_id=expired_key_id)
-                            except Exception as e:
-                                self.log_warning(meta, f"Failed to delete expired access key {expired_key_id} from Wasabi: {e}",
-                                               reason="ExpiredKeyDeleteFailed", access_key_id=expired_key_id, error=str(e))
-                    except Exception as e:
-                        self.log_warning(meta, f"Failed to read secret {secret_info['name']} for cleanup: {e}",
-                                       reason="SecretReadFailed", secret_name=secret_info['name'], error=str(e))
-
-                # Cleanup expired secrets
-                deleted_secrets = cleanup_expired_previous_secrets(
-                    core_api,
-                    namespace,
-                    name,
-                    retention_days,
-                )
-
-                if deleted_secrets:
-                    self.log_info(meta, f"Deleted {len(deleted_secrets)} expired previous secrets: {deleted_secrets}",
-                                 reason="ExpiredSecretsDeleted", count=len(deleted_secrets))
-            except Exception as e:
-                self.log_warning(meta, f"Failed to cleanup expired previous secrets: {e}",
-                               reason="CleanupFailed", error=str(e))
+        uid = _cleanup_key(meta)
+        with _cleanup_inflight_lock:
+            last_cleanup = _cleanup_completed.get(uid)
+            schedule = cleanup_due and uid not in _cleanup_inflight
+            if schedule:
+                _cleanup_inflight.add(uid)
+
+        # Expired-key cleanup needs one API call per previous secret, so it
+        # runs in the background; one cleanup per AccessKey at a time
+        if schedule:
+            _cleanup_executor.submit(
+                self._cleanup_expired_keys,
+                uid, provider_client, iam_user_name, name, namespace, meta, retention_days,
+            )
 
         conditions = set_ready_condition(conditions, True, f"Access key {existing_key_id} is ready")
 
         status_update = {
             "observedGeneration": meta.get("generation", 0),
             "accessKeyId": existing_key_id,
+            "iamUserName": iam_user_name,
             "created": True,
-            "conditions": conditions,
+            "conditions": conditions.to_list(),
         }
 
         if rotation_enabled:
@@ -449,9 +547,105 @@ class AccessKeyHandler(BaseHandler):
                 status_update["lastRotateTime"] = status.get("lastRotateTime")
             if status.get("nextRotateTime"):
                 status_update["nextRotateTime"] = status.get("nextRotateTime")
+            # Recorded once a background cleanup has succeeded, so a failed
+            # one is scheduled again by the next reconcile
+            if last_cleanup:
+                status_update["lastCleanupTime"] = last_cleanup
+
+        _RECONCILE_SUCCESS.inc()
+        # Merge-patch only the fields that changed; steady-state reconciles write nothing
+        delta = {key: value for key, value in status_update.items() if status.get(key) != value}
+        if delta:
+            patch.status.update(delta)
+
+    def _cleanup_expired_keys(
+        self,
+        uid: str,
+        provider_client: Any,
+        iam_user_name: str,
+        name: str,
+        namespace: str,
+        meta: dict[str, Any],
+        retention_days: int,
+    ) -> None:
+        """Delete expired previous access keys and their secrets.
+
+        Runs on ``_cleanup_executor``. A successful run records its finish
+        time for ``lastCleanupTime``; a failed run is logged and records
+        nothing, so the next reconcile schedules it again.
+        """
+        core_api = get_core_api()
+        try:
+            expired_secrets = list_previous_secrets(
+                core_api,
+                namespace,
+                name,
+                include_expired=True,
+                retention_days=retention_days,
+            )
+            expired_secrets = [s for s in expired_secrets if s.get("is_expired", False)]
+
+            # Delete expired access keys from Wasabi; each secret read and IAM
+            # delete is an independent round-trip, so fan them out
+            if expired_secrets:
+                with ThreadPoolExecutor(
+                    max_workers=min(_MAX_PARALLEL_KEY_DELETES, len(expired_secrets)),
+                    thread_name_prefix="accesskey-delete",
+                ) as executor:
+                    for secret_info in expired_secrets:
+                        executor.submit(
+                            self._delete_expired_key,
+                            core_api, provider_client, iam_user_name, namespace, meta, secret_info["name"],
+                        )
+
+            # Cleanup expired secrets
+            # Reuse the label-selected list above instead of listing again
+            deleted_secrets = cleanup_expired_previous_secrets(
+                core_api,
+                namespace,
+                name,
+                retention_days,
+                expired_secrets=expired_secrets,
+            )
+
+            if deleted_secrets:
+                self.log_info(meta, f"Deleted {len(deleted_secrets)} expired previous secrets: {deleted_secrets}",
+                             reason="ExpiredSecretsDeleted", count=len(deleted_secrets))
+        except Exception as e:
+            self.log_warning(meta, f"Failed to cleanup expired previous secrets: {e}",
+                           reason="CleanupFailed", error=str(e))
+        else:
+            with _cleanup_inflight_lock:
+                _cleanup_completed[uid] = now_iso()
+        finally:
+            with _cleanup_inflight_lock:
+                _cleanup_inflight.discard(uid)
+
+    def _delete_expired_key(
+        self,
+        core_api: Any,
+        provider_client: Any,
+        iam_user_name: str,
+        namespace: str,
+        meta: dict[str, Any],
+        secret_name: str,
+    ) -> None:
+        """Delete the IAM access key stored in an expired previous secret."""
+        try:
+            secret_data = read_secret_data(core_api, namespace, secret_name)
+            expired_key_id = secret_data.get("access-key-id")
 
-        metrics.reconcile_total.labels(kind=KIND_ACCESS_KEY, result="success").inc()
-        patch.status.update(status_update)
+            if expired_key_id:
+                try:
+                    provider_client.delete_access_key(iam_user_name, expired_key_id)
+                    self.log_info(meta, f"Deleted expired access key {expired_key_id} from Wasabi",
+                                 reason="ExpiredKeyDeleted", access_key_id=expired_key_id)
+                except Exception as e:
+                    self.log_warning(meta, f"Failed to delete expired access key {expired_key_id} from Wasabi: {e}",
+                                   reason="ExpiredKeyDeleteFailed", access_key_id=expired_key_id, error=str(e))
+        except Exception as e:
+            self.log_warning(meta, f"Failed to read secret {secret_name} for cleanup: {e}",
+                           reason="SecretReadFailed", secret_name=secret_name, error=str(e))
 
     def delete(
         self,
@@ -459,11 +653,16 @@ class AccessKeyHandler(BaseHandler):
         meta: dict[str, Any],
         status: dict[str, Any],
         patch: kopf.Patch,
+        provider_index: kopf.Index | None = None,
+        user_index: kopf.Index | None = None,
     ) -> None:
         """Handle AccessKey resource deletion."""
         name = meta.get("name", "unknown")
         namespace = meta.get("namespace", "default")
         access_key_id = status.get("accessKeyId")
+        _next_rotate_times.pop(meta.get("uid"), None)
+        with _cleanup_inflight_lock:
+            _cleanup_completed.pop(_cleanup_key(meta), None)
 
         self.log_info(meta, f"AccessKey {name} is being deleted", event="deletion", reason="Deletion", access_key_id=access_key_id or "unknown")
 
@@ -477,36 +676,15 @@ class AccessKeyHandler(BaseHandler):
                     provider_ns = provider_ref.get("namespace", namespace)
 
                     try:
-                        provider_obj = get_provider_with_cache(api, provider_name, provider_ns, namespace)
+                        provider_obj = get_provider_with_cache(api, provider_name, provider_ns, namespace, provider_index)
                         provider_spec = provider_obj.get("spec", {})
-                        provider_client = create_provider_from_spec(provider_spec, provider_obj.get("metadata", {}))
-
-                        user_ref = spec.get("userRef", {})
-                        user_name = user_ref.get("name")
-
-                        if user_name:
-                            user_ns = user_ref.get("namespace", namespace)
-                            try:
-                                user_obj = get_user_with_cache(api, user_name, user_ns)
-                                user_spec = user_obj.get("spec", {})
-                                iam_user_name = user_spec.get("name")
-
-                                if iam_user_name:
-                                    provider_client.delete_access_key(iam_user_name, access_key_id)
-                                    self.log_info(meta, f"Deleted access key {access_key_id} for user {iam_user_name}",
-                                                 reason="AccessKeyDeleted", access_key_id=access_key_id, iam_user_name=iam_user_name)
-                                else:
-                                    self.log_warning(meta, f"User {user_name} does not have IAM user name in spec",
-                                                    reason="InvalidUserSpec", user_name=user_name)
-                            except client.exceptions.ApiException as e:
-                                if e.status == 404:
-                                    self.log_warning(meta, f"User {user_name} not found, cannot delete access key",
-                                                   reason="UserNotFound", user_name=user_name)
-                                else:
-                                    raise
-                        else:
-                            self.log_warning(meta, f"AccessKey {name} does not have userRef, cannot delete access key",
-                                           reason="MissingUserRef", name=name)
+                        provider_client = get_cached_provider_client(provider_spec, provider_obj.get("metadata", {}))
+
+                        iam_user_name = self._resolve_iam_user_name(api, spec, meta, status, namespace, user_index)
+                        if iam_user_name:
+                            provider_client.delete_access_key(iam_user_name, access_key_id)
+                            self.log_info(meta, f"Deleted access key {access_key_id} for user {iam_user_name}",
+                                         reason="AccessKeyDeleted", access_key_id=access_key_id, iam_user_name=iam_user_name)
                     except client.exceptions.ApiException as e:
                         if e.status == 404:
                             self.log_warning(meta, f"Provider {provider_name} not found, cannot delete access key",
@@ -519,6 +697,51 @@ class AccessKeyHandler(BaseHandler):
 
         self.remove_finalizer(meta, patch)
 
+    def _resolve_iam_user_name(
+        self,
+        api: Any,
+        spec: dict[str, Any],
+        meta: dict[str, Any],
+        status: dict[str, Any],
+        namespace: str,
+        user_index: kopf.Index | None = None,
+    ) -> str | None:
+        """Resolve the IAM user owning the key, preferring the name recorded in status.
+
+        Falls back to reading the referenced User for AccessKeys reconciled
+        before ``iamUserName`` was recorded.
+
+        Returns:
+            IAM user name, or None if it cannot be resolved
+        """
+        iam_user_name = status.get("iamUserName")
+        if iam_user_name:
+            return iam_user_name
+
+        name = meta.get("name", "unknown")
+        user_ref = spec.get("userRef", {})
+        user_name = user_ref.get("name")
+        if not user_name:
+            self.log_warning(meta, f"AccessKey {name} does not have userRef, cannot delete access key",
+                           reason="MissingUserRef", name=name)
+            return None
+
+        user_ns = user_ref.get("namespace", namespace)
+        try:
+            user_obj = get_user_with_cache(api, user_name, user_ns, user_index)
+        except client.exceptions.ApiException as e:
+            if e.status == 404:
+                self.log_warning(meta, f"User {user_name} not found, cannot delete access key",
+                               reason="UserNotFound", user_name=user_name)
+                return None
+            raise
+
+        iam_user_name = user_obj.get("spec", {}).get("name")
+        if not iam_user_name:
+            self.log_warning(meta, f"User {user_name} does not have IAM user name in spec",
+                            reason="InvalidUserSpec", user_name=user_name)
+        return iam_user_name
+
 
 # Global handler instance
 _handler = AccessKeyHandler()
@@ -536,7 +759,14 @@ def handle_access_key(
 ) -> None:
     """Handle AccessKey resource reconciliation."""
     _handler.ensure_finalizer(meta, patch)
-    _handler.reconcile_with_metrics(meta, lambda: _handler.reconcile(spec, meta, status, patch))
+    _handler.reconcile_with_metrics(
+        meta,
+        lambda: _handler.reconcile(
+            spec, meta, status, patch,
+            provider_index=kwargs.get("provider_index"),
+            user_index=kwargs.get("user_index"),
+        ),
+    )
 
 
 @kopf.on.delete(API_GROUP_VERSION, KIND_ACCESS_KEY)
@@ -548,4 +778,8 @@ def handle_access_key_delete(
     **kwargs: Any,
 ) -> None:
     """Handle AccessKey resource deletion."""
-    _handler.delete(spec, meta, status, patch)
+    _handler.delete(
+        spec, meta, status, patch,
+        provider_index=kwargs.get("provider_index"),
+        user_index=kwargs.get("user_index"),
+    )
@@ -10,10 +10,22 @@ from typing import Any, Callable
 import kopf
 
 from .. import metrics
-from ..constants import FINALIZER
+from ..constants import COND_READY, FINALIZER
 from ..logging import log_resource_event
+from ..utils.conditions import Conditions, set_provider_not_ready_condition
 from ..utils.errors import sanitize_exception
-from ..utils.events import emit_reconcile_failed, emit_reconcile_started
+from ..utils.events import (
+    batched_events,
+    emit_reconcile_failed,
+    emit_reconcile_started,
+    emit_validate_failed,
+)
+from ..utils.locks import KeyedLock
+from ..utils.timestamps import parse_iso
+
+# Serializes reconciles of the same resource; kopf runs timers independently
+# of event handlers, so a drift check can otherwise overlap an update
+_resource_locks = KeyedLock()
 
 
 class BaseHandler:
@@ -27,6 +39,28 @@ class BaseHandler:
         """
         self.kind = kind
         self.logger = logging.getLogger(__name__)
+        # Metric children for this kind, bound on first use
+        self._metric_children: dict[tuple[Any, ...], Any] = {}
+
+    def _labels(self, metric: Any, **labels: str) -> Any:
+        """Get a metric child labelled with this handler's kind.
+
+        The child is bound with ``metric.labels()`` once per label set and
+        reused afterwards, so hot paths skip the label validation and lookup.
+
+        Args:
+            metric: Prometheus metric with a ``kind`` label
+            **labels: Remaining label values
+
+        Returns:
+            Bound metric child
+        """
+        key = (metric, *labels.values())
+        child = self._metric_children.get(key)
+        if child is None:
+            child = metric.labels(kind=self.kind, **labels)
+            self._metric_children[key] = child
+        return child
 
     def _get_resource_context(self, meta: dict[str, Any]) -> dict[str, Any]:
         """Extract common resource context from metadata.
@@ -145,6 +179,31 @@ class BaseHandler:
             **log_data,
         )
 
+    def fail_reconcile(
+        self,
+        meta: dict[str, Any],
+        patch: kopf.Patch,
+        conditions: list[dict[str, Any]],
+        error_msg: str,
+    ) -> None:
+        """Record a failed reconciliation.
+
+        Emits a ReconcileFailed event, counts the failure and patches the
+        already-updated conditions into the resource status.
+
+        Args:
+            meta: Kubernetes resource metadata
+            patch: Kopf patch object
+            conditions: Updated conditions list to store in status
+            error_msg: Error message for the event
+        """
+        emit_reconcile_failed(meta, error_msg)
+        self._labels(metrics.reconcile_total, result="failed").inc()
+        patch.status.update({
+            "conditions": conditions,
+            "observedGeneration": meta.get("generation", 0),
+        })
+
     def handle_provider_not_found(
         self,
         meta: dict[str, Any],
@@ -164,17 +223,9 @@ class BaseHandler:
             provider_ns: Namespace of the provider
             error_msg: Error message
         """
-        from ..utils.conditions import set_provider_not_ready_condition
-        
         self.log_error(meta, error_msg, reason="ProviderNotFound")
-        conditions = status.get("conditions", [])
-        conditions = set_provider_not_ready_condition(conditions, error_msg)
-        emit_reconcile_failed(meta, error_msg)
-        metrics.reconcile_total.labels(kind=self.kind, result="failed").inc()
-        patch.status.update({
-            "conditions": conditions,
-            "observedGeneration": meta.get("generation", 0),
-        })
+        conditions = set_provider_not_ready_condition(Conditions(status.get("conditions")), error_msg)
+        self.fail_reconcile(meta, patch, conditions.to_list(), error_msg)
 
     def handle_provider_not_ready(
         self,
@@ -196,17 +247,9 @@ class BaseHandler:
         Raises:
             kopf.TemporaryError: Always raises to trigger retry
         """
-        from ..utils.conditions import set_provider_not_ready_condition
-        
         self.log_warning(meta, error_msg, reason="ProviderNotReady", provider=provider_name)
-        conditions = status.get("conditions", [])
-        conditions = set_provider_not_ready_condition(conditions, error_msg)
-        emit_reconcile_failed(meta, error_msg)
-        metrics.reconcile_total.labels(kind=self.kind, result="failed").inc()
-        patch.status.update({
-            "conditions": conditions,
-            "observedGeneration": meta.get("generation", 0),
-        })
+        conditions = set_provider_not_ready_condition(Conditions(status.get("conditions")), error_msg)
+        self.fail_reconcile(meta, patch, conditions.to_list(), error_msg)
         raise kopf.TemporaryError(error_msg)
 
     def handle_validation_error(
@@ -223,11 +266,9 @@ class BaseHandler:
         Raises:
             ValueError: Always raises with the error message
         """
-        from ..utils.events import emit_validate_failed
-        
         self.log_error(meta, error_msg, reason="ValidationFailed")
         emit_validate_failed(meta, error_msg)
-        metrics.reconcile_total.labels(kind=self.kind, result="failed").inc()
+        self._labels(metrics.reconcile_total, result="failed").inc()
         raise ValueError(error_msg)
 
     def handle_reconciliation_error(
@@ -254,17 +295,16 @@ class BaseHandler:
         
         self.log_error(meta, f"Reconciliation failed: {sanitized_error}", error=error, reason="ReconciliationFailed")
         emit_reconcile_failed(meta, f"Reconciliation failed: {sanitized_error}")
-        metrics.error_total.labels(kind=self.kind, error_type=error_type).inc()
-        metrics.reconcile_total.labels(kind=self.kind, result="failed").inc()
+        self._labels(metrics.error_total, error_type=error_type).inc()
+        self._labels(metrics.reconcile_total, result="failed").inc()
         
         status_update = {
             "observedGeneration": meta.get("generation", 0),
         }
         
         if condition_fn is not None and condition_msg is not None:
-            conditions = status.get("conditions", [])
-            conditions = condition_fn(conditions, condition_msg)
-            status_update["conditions"] = conditions
+            conditions = condition_fn(Conditions(status.get("conditions")), condition_msg)
+            status_update["conditions"] = conditions.to_list()
         
         patch.status.update(status_update)
 
@@ -282,6 +322,40 @@ class BaseHandler:
             finalizers.remove(FINALIZER)
             patch.metadata["finalizers"] = finalizers if finalizers else None
 
+    def drift_check_due(
+        self,
+        meta: dict[str, Any],
+        status: dict[str, Any],
+        interval: float,
+    ) -> bool:
+        """Check whether a timer tick needs to run a full reconcile.
+
+        A tick can be skipped when the current generation has been reconciled
+        to Ready and the last successful sync is younger than 90% of the drift
+        check interval (e.g. a create/update/resume just ran).
+
+        Args:
+            meta: Kubernetes resource metadata
+            status: Current resource status
+            interval: Drift check interval in seconds
+
+        Returns:
+            True if the drift check should run
+        """
+        if status.get("observedGeneration") != meta.get("generation", 0):
+            return True
+        if not Conditions(status.get("conditions")).is_true(COND_READY):
+            return True
+
+        last_sync_time = status.get("lastSyncTime")
+        if not last_sync_time:
+            return True
+        try:
+            age = time.time() - parse_iso(last_sync_time)
+        except ValueError:
+            return True
+        return age >= interval * 0.9
+
     def reconcile_with_metrics(
         self,
         meta: dict[str, Any],
@@ -293,25 +367,30 @@ class BaseHandler:
             meta: Kubernetes resource metadata
             reconcile_fn: Function to execute for reconciliation
         """
-        emit_reconcile_started(meta)
-        metrics.reconcile_total.labels(kind=self.kind, result="started").inc()
+        # One reconcile per resource at a time (timer ticks vs. change events);
+        # the events it emits are posted together once it finishes
+        with _resource_locks.hold((self.kind, meta.get("namespace"), meta.get("name"))), batched_events():
+            emit_reconcile_started(meta)
+            self._labels(metrics.reconcile_total, result="started").inc()
         
-        start_time = time.time()
-        try:
-            reconcile_fn()
-            metrics.reconcile_total.labels(kind=self.kind, result="success").inc()
-        except Exception as e:
-            sanitized_error = sanitize_exception(e)
-            error_type = type(e).__name__
-            metrics.error_total.labels(kind=self.kind, error_type=error_type).inc()
-            # Pass the exception to log_error (it will sanitize again internally, but that's acceptable for consistency)
-            self.log_error(meta, "Reconciliation failed", error=e, reason="ReconciliationFailed")
-            emit_reconcile_failed(meta, f"Reconciliation failed: {sanitized_error}")
-            metrics.reconcile_total.labels(kind=self.kind, result="error").inc()
-            raise
-        finally:
-            duration = time.time() - start_time
-            metrics.reconcile_duration_seconds.labels(kind=self.kind).observe(duration)
+            # Histogram.time() measures with a monotonic clock
+            with self._labels(metrics.reconcile_duration_seconds).time():
+                try:
+                    reconcile_fn()
+                    self._labels(metrics.reconcile_total, result="success").inc()
+                except kopf.TemporaryError:
+                    # A deliberate requeue (e.g. waiting on a dependency), not a failure
+                    self._labels(metrics.reconcile_total, result="requeued").inc()
+                    raise
+                except Exception as e:
+                    sanitized_error = sanitize_exception(e)
+                    error_type = type(e).__name__
+                    self._labels(metrics.error_total, error_type=error_type).inc()
+                    # Pass the exception to log_error (it will sanitize again internally, but that's acceptable for consistency)
+                    self.log_error(meta, "Reconciliation failed", error=e, reason="ReconciliationFailed")
+                    emit_reconcile_failed(meta, f"Reconciliation failed: {sanitized_error}")
+                    self._labels(metrics.reconcile_total, result="error").inc()
+                    raise
 
     def update_resource_status(
         self,
@@ -319,6 +398,7 @@ class BaseHandler:
         meta: dict[str, Any],
         ready: bool,
         status_data: dict[str, Any] | None = None,
+        status: dict[str, Any] | None = None,
     ) -> None:
         """Update resource status with common fields.
         
@@ -327,16 +407,21 @@ class BaseHandler:
             meta: Kubernetes resource metadata
             ready: Whether the resource is ready
             status_data: Additional status data to include
+            status: Current resource status; fields it already holds with the
+                same value (typically conditions) are left out of the patch
         """
         status_update = {
             "observedGeneration": meta.get("generation", 0),
             **(status_data or {}),
         }
+        if status is not None:
+            status_update = {key: value for key, value in status_update.items() if status.get(key) != value}
         
         if ready:
-            metrics.resource_status_total.labels(kind=self.kind, status="ready").inc()
+            self._labels(metrics.resource_status_total, status="ready").inc()
         else:
-            metrics.resource_status_total.labels(kind=self.kind, status="not_ready").inc()
+            self._labels(metrics.resource_status_total, status="not_ready").inc()
         
-        patch.status.update(status_update)
+        if status_update:
+            patch.status.update(status_update)
 
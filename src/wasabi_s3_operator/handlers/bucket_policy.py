@@ -2,21 +2,24 @@
 
 from __future__ import annotations
 
-import json
+import hashlib
 import os
-from datetime import datetime, timezone
+import threading
 from typing import Any
 
 import kopf
+import orjson
+from botocore.exceptions import ClientError
 from kubernetes import client
 
 from .. import metrics
-from ..builders.provider import create_provider_from_spec
-from ..constants import API_GROUP_VERSION, KIND_BUCKET_POLICY
-from ..handlers.shared import get_provider_with_cache, get_k8s_client
-from ..services.aws.client import AWSProvider
+from ..builders.provider import get_cached_provider_client
+from ..constants import API_GROUP_VERSION, COND_READY, KIND_BUCKET_POLICY
+from ..handlers.shared import get_from_index, get_k8s_client, get_provider_with_cache
+from ..services.s3 import S3Provider
 from ..tracing import trace_span
 from ..utils.conditions import (
+    Conditions,
     set_apply_failed_condition,
     set_bucket_not_ready_condition,
     set_ready_condition,
@@ -26,8 +29,48 @@ from ..utils.events import (
     emit_policy_failed,
     emit_validate_succeeded,
 )
+from ..utils.timestamps import now_iso
 from .base import BaseHandler
 
+# Seconds between timer-driven drift checks
+_DRIFT_CHECK_INTERVAL_SECONDS = int(os.getenv("DRIFT_CHECK_INTERVAL_SECONDS", "300"))
+
+# Pre-bound reconcile and drift counters
+_RECONCILE_FAILED = metrics.reconcile_total.labels(kind=KIND_BUCKET_POLICY, result="failed")
+_RECONCILE_SKIPPED = metrics.reconcile_total.labels(kind=KIND_BUCKET_POLICY, result="skipped")
+_POLICY_DRIFT_DETECTED = metrics.drift_detected_total.labels(kind=KIND_BUCKET_POLICY, resource_type="policy")
+
+# Digest of the desired (AWS-format) policy by BucketPolicy UID -> (generation, digest)
+_desired_policy_digests: dict[str, tuple[int, str]] = {}
+_desired_policy_digests_lock = threading.Lock()
+
+
+def _policy_digest(policy: dict[str, Any]) -> str:
+    """Digest a policy document independent of key order and whitespace."""
+    canonical = orjson.dumps(policy, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+
+def _desired_policy_digest(
+    meta: dict[str, Any],
+    provider_client: S3Provider,
+    policy: dict[str, Any],
+) -> str:
+    """Get the desired policy digest, recomputing only when the generation changes."""
+    uid = meta.get("uid")
+    generation = meta.get("generation", 0)
+    if uid:
+        with _desired_policy_digests_lock:
+            cached = _desired_policy_digests.get(uid)
+        if cached is not None and cached[0] == generation:
+            return cached[1]
+
+    digest = _policy_digest(provider_client.convert_policy(policy))
+    if uid:
+        with _desired_policy_digests_lock:
+            _desired_policy_digests[uid] = (generation, digest)
+    return digest
+
 
 class BucketPolicyHandler(BaseHandler):
     """Handler for BucketPolicy resources."""
@@ -42,6 +85,8 @@ class BucketPolicyHandler(BaseHandler):
         meta: dict[str, Any],
         status: dict[str, Any],
         patch: kopf.Patch,
+        bucket_index: kopf.Index | None = None,
+        provider_index: kopf.Index | None = None,
     ) -> None:
         """Reconcile BucketPolicy resource."""
         namespace = meta.get("namespace", "default")
@@ -67,101 +112,74 @@ class BucketPolicyHandler(BaseHandler):
             api = get_k8s_client()
             bucket_ns = bucket_ref.get("namespace", namespace)
 
+            # Status changes are accumulated here and written to the patch once
+            status_patch: dict[str, Any] = {}
+            ready = False
             try:
-                bucket_obj = api.get_namespaced_custom_object(
-                    group="s3.cloud37.dev",
-                    version="v1alpha1",
-                    namespace=bucket_ns,
-                    plural="buckets",
-                    name=bucket_name,
-                )
-            except client.exceptions.ApiException as e:
-                if e.status == 404:
-                    error_msg = f"Bucket {bucket_name} not found in namespace {bucket_ns}"
-                    self.log_error(meta, error_msg, reason="BucketNotFound", bucket_name=bucket_name, bucket_ns=bucket_ns)
-                    conditions = status.get("conditions", [])
-                    conditions = set_bucket_not_ready_condition(conditions, error_msg)
-                    metrics.reconcile_total.labels(kind=KIND_BUCKET_POLICY, result="failed").inc()
-                    patch.status.update({
-                        "conditions": conditions,
-                        "observedGeneration": meta.get("generation", 0),
-                    })
-                    return
-                raise
+                try:
+                    bucket_obj = self._get_bucket(api, bucket_ns, bucket_name, bucket_index)
+                except client.exceptions.ApiException as e:
+                    if e.status == 404:
+                        error_msg = f"Bucket {bucket_name} not found in namespace {bucket_ns}"
+                        self.log_error(meta, error_msg, reason="BucketNotFound", bucket_name=bucket_name, bucket_ns=bucket_ns)
+                        conditions = Conditions(status.get("conditions"))
+                        conditions = set_bucket_not_ready_condition(conditions, error_msg)
+                        _RECONCILE_FAILED.inc()
+                        status_patch["conditions"] = conditions.to_list()
+                        return
+                    raise
 
-            # Check if bucket is ready
-            bucket_status = bucket_obj.get("status", {})
-            bucket_conditions = bucket_status.get("conditions", [])
-            bucket_ready = any(
-                cond.get("type") == "Ready" and cond.get("status") == "True" for cond in bucket_conditions
-            )
+                # Check if bucket is ready
+                bucket_status = bucket_obj.get("status", {})
+                bucket_ready = Conditions(bucket_status.get("conditions")).is_true(COND_READY)
 
-            if not bucket_ready:
-                error_msg = f"Bucket {bucket_name} is not ready"
-                self.log_warning(meta, error_msg, reason="BucketNotReady", bucket_name=bucket_name)
-                conditions = status.get("conditions", [])
-                conditions = set_bucket_not_ready_condition(conditions, error_msg)
-                metrics.reconcile_total.labels(kind=KIND_BUCKET_POLICY, result="failed").inc()
-                patch.status.update({
-                    "conditions": conditions,
-                    "observedGeneration": meta.get("generation", 0),
-                })
-                raise kopf.TemporaryError(error_msg)
-
-            # Get bucket spec to find provider
-            bucket_spec = bucket_obj.get("spec", {})
-            provider_ref = bucket_spec.get("providerRef", {})
-            provider_name = provider_ref.get("name")
-
-            if not provider_name:
-                error_msg = "Bucket provider reference not found"
-                self.log_error(meta, error_msg, reason="ProviderRefNotFound", bucket_name=bucket_name)
-                conditions = status.get("conditions", [])
-                conditions = set_bucket_not_ready_condition(conditions, error_msg)
-                metrics.reconcile_total.labels(kind=KIND_BUCKET_POLICY, result="failed").inc()
-                patch.status.update({
-                    "conditions": conditions,
-                    "observedGeneration": meta.get("generation", 0),
-                })
-                return
+                if not bucket_ready:
+                    error_msg = f"Bucket {bucket_name} is not ready"
+                    self.log_warning(meta, error_msg, reason="BucketNotReady", bucket_name=bucket_name)
+                    conditions = Conditions(status.get("conditions"))
+                    conditions = set_bucket_not_ready_condition(conditions, error_msg)
+                    _RECONCILE_FAILED.inc()
+                    status_patch["conditions"] = conditions.to_list()
+                    raise kopf.TemporaryError(error_msg)
 
-            # Get provider
-            provider_ns = provider_ref.get("namespace", bucket_ns)
-            provider_obj = get_provider_with_cache(api, provider_name, provider_ns, bucket_ns)
+                # Get bucket spec to find provider
+                bucket_spec = bucket_obj.get("spec", {})
+                provider_ref = bucket_spec.get("providerRef", {})
+                provider_name = provider_ref.get("name")
 
-            # Create provider client
-            provider_spec = provider_obj.get("spec", {})
-            provider_client = create_provider_from_spec(provider_spec, provider_obj.get("metadata", {}))
+                if not provider_name:
+                    error_msg = "Bucket provider reference not found"
+                    self.log_error(meta, error_msg, reason="ProviderRefNotFound", bucket_name=bucket_name)
+                    conditions = Conditions(status.get("conditions"))
+                    conditions = set_bucket_not_ready_condition(conditions, error_msg)
+                    _RECONCILE_FAILED.inc()
+                    status_patch["conditions"] = conditions.to_list()
+                    return
 
-            # Apply policy
-            conditions = status.get("conditions", [])
+                # Get provider
+                provider_ns = provider_ref.get("namespace", bucket_ns)
+                provider_obj = get_provider_with_cache(api, provider_name, provider_ns, bucket_ns, provider_index)
 
-            with trace_span("apply_bucket_policy", kind=KIND_BUCKET_POLICY):
-                try:
-                    # Check if bucket exists
-                    if not provider_client.bucket_exists(bucket_name):
-                        error_msg = f"Bucket {bucket_name} does not exist in provider"
-                        self.log_error(meta, error_msg, reason="BucketNotExists", bucket_name=bucket_name)
-                        conditions = set_bucket_not_ready_condition(conditions, error_msg)
-                        metrics.reconcile_total.labels(kind=KIND_BUCKET_POLICY, result="failed").inc()
-                        patch.status.update({
-                            "conditions": conditions,
-                            "observedGeneration": meta.get("generation", 0),
-                        })
-                        return
+                # Create provider client
+                provider_spec = provider_obj.get("spec", {})
+                provider_client = get_cached_provider_client(provider_spec, provider_obj.get("metadata", {}))
+
+                # Apply policy
+                conditions = Conditions(status.get("conditions"))
 
-                    # Check if policy has changed by comparing with current policy
-                    policy_changed = True
+                with trace_span("apply_bucket_policy", kind=KIND_BUCKET_POLICY):
                     try:
-                        current_policy = provider_client.get_bucket_policy(bucket_name)
-                        if current_policy is not None:
-                            if isinstance(provider_client, AWSProvider):
-                                current_policy_normalized = json.dumps(current_policy, sort_keys=True)
-                                desired_policy_normalized = json.dumps(
-                                    provider_client._convert_policy_to_aws_format(policy),
-                                    sort_keys=True
+                        # Check if policy has changed by comparing with current policy.
+                        # GetBucketPolicy also answers NoSuchBucket, so no separate HEAD is needed.
+                        policy_changed = True
+                        bucket_missing = False
+                        try:
+                            current_policy = provider_client.get_bucket_policy(bucket_name)
+                            if current_policy is not None:
+                                policy_changed = (
+                                    _policy_digest(current_policy)
+                                    != _desired_policy_digest(meta, provider_client, policy)
                                 )
-                                policy_changed = current_policy_normalized != desired_policy_normalized
 
                                 if not policy_changed:
                                     self.log_info(meta, f"Policy for bucket {bucket_name} unchanged, skipping update",
@@ -169,54 +187,88 @@ class BucketPolicyHandler(BaseHandler):
                                 else:
                                     self.log_info(meta, f"Drift detected: policy for bucket {bucket_name}",
                                                  reason="DriftDetected", bucket_name=bucket_name, resource_type="policy")
-                                    metrics.drift_detected_total.labels(kind=KIND_BUCKET_POLICY, resource_type="policy").inc()
-                        else:
-                            self.log_info(meta, f"No existing policy for bucket {bucket_name}, will create new policy",
-                                         reason="PolicyCreation", bucket_name=bucket_name)
+                                    _POLICY_DRIFT_DETECTED.inc()
+                            else:
+                                self.log_info(meta, f"No existing policy for bucket {bucket_name}, will create new policy",
+                                             reason="PolicyCreation", bucket_name=bucket_name)
+                                policy_changed = True
+                        except ClientError as e:
+                            bucket_missing = e.response.get("Error", {}).get("Code") == "NoSuchBucket"
+                            policy_changed = True
+                        except Exception as e:
+                            # Note: debug logs remain as logger.debug since BaseHandler doesn't provide log_debug
                             policy_changed = True
+
+                        if bucket_missing:
+                            error_msg = f"Bucket {bucket_name} does not exist in provider"
+                            self.log_error(meta, error_msg, reason="BucketNotExists", bucket_name=bucket_name)
+                            conditions = set_bucket_not_ready_condition(conditions, error_msg)
+                            _RECONCILE_FAILED.inc()
+                            status_patch["conditions"] = conditions.to_list()
+                            return
+
+                        # Apply policy only if it changed
+                        if policy_changed:
+                            provider_client.set_bucket_policy(bucket_name, policy)
+                            emit_policy_applied(meta, bucket_name)
+                            self.log_info(meta, f"Applied policy to bucket {bucket_name}",
+                                         reason="PolicyApplied", bucket_name=bucket_name)
+                        else:
+                            self.log_info(meta, f"Policy for bucket {bucket_name} is already up to date",
+                                         reason="PolicyUpToDate", bucket_name=bucket_name)
+
+                        # Set ready condition
+                        conditions = set_ready_condition(conditions, True, f"Policy applied to bucket {bucket_name}")
+
                     except Exception as e:
-                        # Note: debug logs remain as logger.debug since BaseHandler doesn't provide log_debug
-                        policy_changed = True
+                        error_msg = f"Failed to apply policy: {str(e)}"
+                        self.log_error(meta, error_msg, error=e, reason="PolicyApplyFailed", bucket_name=bucket_name)
+                        conditions = set_apply_failed_condition(conditions, error_msg)
+                        emit_policy_failed(meta, error_msg)
+                        _RECONCILE_FAILED.inc()
+                        status_patch.update({
+                            "applied": False,
+                            "conditions": conditions.to_list(),
+                        })
+                        return
+
+                # Update status
+                status_patch.update({
+                    "applied": True,
+                    "lastSyncTime": now_iso(),
+                    "conditions": conditions.to_list(),
+                })
+                ready = True
+            finally:
+                if status_patch:
+                    self.update_resource_status(patch, meta, ready, status_patch, status)
 
-                    # Apply policy only if it changed
-                    if policy_changed:
-                        provider_client.set_bucket_policy(bucket_name, policy)
-                        emit_policy_applied(meta, bucket_name)
-                        self.log_info(meta, f"Applied policy to bucket {bucket_name}",
-                                     reason="PolicyApplied", bucket_name=bucket_name)
-                    else:
-                        self.log_info(meta, f"Policy for bucket {bucket_name} is already up to date",
-                                     reason="PolicyUpToDate", bucket_name=bucket_name)
-
-                    # Set ready condition
-                    conditions = set_ready_condition(conditions, True, f"Policy applied to bucket {bucket_name}")
-
-                except Exception as e:
-                    error_msg = f"Failed to apply policy: {str(e)}"
-                    self.log_error(meta, error_msg, error=e, reason="PolicyApplyFailed", bucket_name=bucket_name)
-                    conditions = set_apply_failed_condition(conditions, error_msg)
-                    emit_policy_failed(meta, error_msg)
-                    metrics.reconcile_total.labels(kind=KIND_BUCKET_POLICY, result="failed").inc()
-                    patch.status.update({
-                        "applied": False,
-                        "conditions": conditions,
-                        "observedGeneration": meta.get("generation", 0),
-                    })
-
-            # Update status
-            status_data = {
-                "applied": True,
-                "lastSyncTime": datetime.now(timezone.utc).isoformat(),
-                "conditions": conditions,
-            }
-
-            self.update_resource_status(patch, meta, True, status_data)
+    def _get_bucket(
+        self,
+        api: Any,
+        bucket_ns: str,
+        bucket_name: str,
+        bucket_index: kopf.Index | None = None,
+    ) -> dict[str, Any]:
+        """Get a Bucket from the index, falling back to the API."""
+        bucket_obj = get_from_index(bucket_index, bucket_ns, bucket_name)
+        if bucket_obj is None:
+            bucket_obj = api.get_namespaced_custom_object(
+                group="s3.cloud37.dev",
+                version="v1alpha1",
+                namespace=bucket_ns,
+                plural="buckets",
+                name=bucket_name,
+            )
+        return bucket_obj
 
     def delete(
         self,
         spec: dict[str, Any],
         meta: dict[str, Any],
         patch: kopf.Patch,
+        bucket_index: kopf.Index | None = None,
+        provider_index: kopf.Index | None = None,
     ) -> None:
         """Handle BucketPolicy resource deletion."""
         name = meta.get("name", "unknown")
@@ -225,19 +277,16 @@ class BucketPolicyHandler(BaseHandler):
 
         self.log_info(meta, f"BucketPolicy {name} is being deleted", event="deletion", reason="Deletion", bucket_name=bucket_name or name)
 
+        with _desired_policy_digests_lock:
+            _desired_policy_digests.pop(meta.get("uid"), None)
+
         if bucket_name:
             try:
                 api = get_k8s_client()
                 namespace = meta.get("namespace", "default")
                 bucket_ns = bucket_ref.get("namespace", namespace)
 
-                bucket_obj = api.get_namespaced_custom_object(
-                    group="s3.cloud37.dev",
-                    version="v1alpha1",
-                    namespace=bucket_ns,
-                    plural="buckets",
-                    name=bucket_name,
-                )
+                bucket_obj = self._get_bucket(api, bucket_ns, bucket_name, bucket_index)
 
                 bucket_spec = bucket_obj.get("spec", {})
                 provider_ref = bucket_spec.get("providerRef", {})
@@ -245,10 +294,10 @@ class BucketPolicyHandler(BaseHandler):
 
                 if provider_name:
                     provider_ns = provider_ref.get("namespace", bucket_ns)
-                    provider_obj = get_provider_with_cache(api, provider_name, provider_ns, namespace)
+                    provider_obj = get_provider_with_cache(api, provider_name, provider_ns, namespace, provider_index)
 
                     provider_spec = provider_obj.get("spec", {})
-                    provider_client = create_provider_from_spec(provider_spec, provider_obj.get("metadata", {}))
+                    provider_client = get_cached_provider_client(provider_spec, provider_obj.get("metadata", {}))
 
                     if provider_client.bucket_exists(bucket_name):
                         provider_client.delete_bucket_policy(bucket_name)
@@ -270,7 +319,7 @@ _handler = BucketPolicyHandler()
 @kopf.on.create(API_GROUP_VERSION, KIND_BUCKET_POLICY)
 @kopf.on.update(API_GROUP_VERSION, KIND_BUCKET_POLICY)
 @kopf.on.resume(API_GROUP_VERSION, KIND_BUCKET_POLICY)
-@kopf.timer(API_GROUP_VERSION, KIND_BUCKET_POLICY, interval=int(os.getenv("DRIFT_CHECK_INTERVAL_SECONDS", "300")))
+@kopf.timer(API_GROUP_VERSION, KIND_BUCKET_POLICY, interval=_DRIFT_CHECK_INTERVAL_SECONDS)
 def handle_bucket_policy(
     spec: dict[str, Any],
     meta: dict[str, Any],
@@ -279,8 +328,19 @@ def handle_bucket_policy(
     **kwargs: Any,
 ) -> None:
     """Handle BucketPolicy resource reconciliation."""
+    # Timer ticks carry no change reason; skip them while the last sync is fresh
+    if kwargs.get("reason") is None and not _handler.drift_check_due(meta, status, _DRIFT_CHECK_INTERVAL_SECONDS):
+        _RECONCILE_SKIPPED.inc()
+        return
     _handler.ensure_finalizer(meta, patch)
-    _handler.reconcile_with_metrics(meta, lambda: _handler.reconcile(spec, meta, status, patch))
+    _handler.reconcile_with_metrics(
+        meta,
+        lambda: _handler.reconcile(
+            spec, meta, status, patch,
+            bucket_index=kwargs.get("bucket_index"),
+            provider_index=kwargs.get("provider_index"),
+        ),
+    )
 
 
 @kopf.on.delete(API_GROUP_VERSION, KIND_BUCKET_POLICY)
@@ -291,4 +351,8 @@ def handle_bucket_policy_delete(
     **kwargs: Any,
 ) -> None:
     """Handle BucketPolicy resource deletion."""
-    _handler.delete(spec, meta, patch)
+    _handler.delete(
+        spec, meta, patch,
+        bucket_index=kwargs.get("bucket_index"),
+        provider_index=kwargs.get("provider_index"),
+    )
@@ -2,26 +2,38 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import hashlib
 from typing import Any
 
 import kopf
+import orjson
 from kubernetes import client
 
 from .. import metrics
-from ..builders.provider import create_provider_from_spec
-from ..constants import API_GROUP_VERSION, KIND_IAM_POLICY
-from ..handlers.shared import get_provider_with_cache, get_k8s_client
-from ..services.aws.client import AWSProvider
+from ..builders.provider import get_cached_provider_client
+from ..constants import API_GROUP_VERSION, COND_READY, KIND_IAM_POLICY
+from ..handlers.shared import get_k8s_client, get_provider_with_cache
 from ..tracing import trace_span
 from ..utils.conditions import (
+    Conditions,
     set_attach_failed_condition,
     set_provider_not_ready_condition,
     set_ready_condition,
 )
-from ..utils.events import emit_validate_succeeded
+from ..utils.events import emit_validate_failed, emit_validate_succeeded
+from ..utils.timestamps import now_iso
 from .base import BaseHandler
 
+# Pre-bound reconcile counters
+_RECONCILE_FAILED = metrics.reconcile_total.labels(kind=KIND_IAM_POLICY, result="failed")
+_RECONCILE_SKIPPED = metrics.reconcile_total.labels(kind=KIND_IAM_POLICY, result="skipped")
+
+
+def _policy_digest(provider_ns: str, provider_name: str, policy: dict[str, Any]) -> str:
+    """Digest a policy document together with the Provider it is applied to."""
+    canonical = orjson.dumps([provider_ns, provider_name, policy], option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
 
 class IAMPolicyHandler(BaseHandler):
     """Handler for IAMPolicy resources."""
@@ -30,14 +42,33 @@ class IAMPolicyHandler(BaseHandler):
         """Initialize IAM policy handler."""
         super().__init__(KIND_IAM_POLICY)
 
+    def _reject_spec(
+        self,
+        meta: dict[str, Any],
+        status: dict[str, Any],
+        patch: kopf.Patch,
+        error_msg: str,
+    ) -> None:
+        """Record an invalid spec as not Ready without raising."""
+        self.log_error(meta, error_msg, reason="ValidationFailed")
+        emit_validate_failed(meta, error_msg)
+        conditions = set_ready_condition(Conditions(status.get("conditions")), False, error_msg)
+        self.fail_reconcile(meta, patch, conditions.to_list(), error_msg)
+        patch.status["applied"] = False
+
     def reconcile(
         self,
         spec: dict[str, Any],
         meta: dict[str, Any],
         status: dict[str, Any],
         patch: kopf.Patch,
+        provider_index: kopf.Index | None = None,
     ) -> None:
-        """Reconcile IAMPolicy resource."""
+        """Reconcile IAMPolicy resource.
+
+        The referenced Provider is read from the kopf in-memory index when
+        available; the cached getter falls back to the API on a miss.
+        """
         namespace = meta.get("namespace", "default")
         name = meta.get("name", "unknown")
         provider_ref = spec.get("providerRef", {})
@@ -45,15 +76,19 @@ class IAMPolicyHandler(BaseHandler):
         policy = spec.get("policy", {})
 
         with trace_span("reconcile_iampolicy", kind=KIND_IAM_POLICY, attributes={"policy.name": name}):
-            # Validate spec
+            # Validate spec; an invalid spec cannot succeed until it is edited,
+            # so record it in status and return instead of raising for a retry
             if not provider_name:
-                self.handle_validation_error(meta, "providerRef.name is required")
+                self._reject_spec(meta, status, patch, "providerRef.name is required")
+                return
 
             if not policy:
-                self.handle_validation_error(meta, "policy is required")
+                self._reject_spec(meta, status, patch, "policy is required")
+                return
 
             if not isinstance(policy, dict) or "statement" not in policy:
-                self.handle_validation_error(meta, "policy must contain 'statement' field")
+                self._reject_spec(meta, status, patch, "policy must contain 'statement' field")
+                return
 
             emit_validate_succeeded(meta)
 
@@ -62,13 +97,7 @@ class IAMPolicyHandler(BaseHandler):
             provider_ns = provider_ref.get("namespace", namespace)
 
             try:
-                provider_obj = api.get_namespaced_custom_object(
-                    group="s3.cloud37.dev",
-                    version="v1alpha1",
-                    namespace=provider_ns,
-                    plural="providers",
-                    name=provider_name,
-                )
+                provider_obj = get_provider_with_cache(api, provider_name, provider_ns, namespace, provider_index)
             except client.exceptions.ApiException as e:
                 if e.status == 404:
                     error_msg = f"Provider {provider_name} not found in namespace {provider_ns}"
@@ -78,10 +107,7 @@ class IAMPolicyHandler(BaseHandler):
 
             # Check if provider is ready
             provider_status = provider_obj.get("status", {})
-            provider_conditions = provider_status.get("conditions", [])
-            provider_ready = any(
-                cond.get("type") == "Ready" and cond.get("status") == "True" for cond in provider_conditions
-            )
+            provider_ready = Conditions(provider_status.get("conditions")).is_true(COND_READY)
 
             if not provider_ready:
                 error_msg = f"Provider {provider_name} is not ready"
@@ -89,65 +115,70 @@ class IAMPolicyHandler(BaseHandler):
 
             # Create provider client
             provider_spec = provider_obj.get("spec", {})
-            provider_client = create_provider_from_spec(provider_spec, provider_obj.get("metadata", {}))
+            provider_client = get_cached_provider_client(provider_spec, provider_obj.get("metadata", {}))
 
-            # Convert policy to AWS format
-            if isinstance(provider_client, AWSProvider):
-                aws_policy = provider_client._convert_policy_to_aws_format(policy)
-            else:
-                aws_policy = policy
+            # Convert policy to the provider's format
+            aws_policy = provider_client.convert_policy(policy)
 
             # Create managed policy
-            conditions = status.get("conditions", [])
+            conditions = Conditions(status.get("conditions"))
             policy_arn = None
+            policy_digest = _policy_digest(provider_ns, provider_name, aws_policy)
 
-            with trace_span("create_managed_policy", kind=KIND_IAM_POLICY):
-                try:
-                    tags = spec.get("tags", {})
-                    description = f"IAMPolicy {name} managed by wasabi-s3-operator"
-
-                    policy_response = provider_client.create_managed_policy(
-                        policy_name=name,
-                        policy_document=aws_policy,
-                        description=description
-                    )
-
-                    # Extract policy ARN from response
-                    policy_arn = policy_response.get("Policy", {}).get("Arn")
-                    if not policy_arn:
-                        policy_arn = f"arn:aws:iam::*:policy/{name}"
-
-                    self.log_info(meta, f"Created managed policy {name} with ARN {policy_arn}",
-                                 reason="PolicyCreated", policy_name=name, policy_arn=policy_arn)
-                    conditions = set_ready_condition(conditions, True, f"IAMPolicy {name} is ready")
-
-                except Exception as e:
-                    error_msg = f"Failed to create managed policy: {str(e)}"
-                    self.log_error(meta, error_msg, error=e, reason="PolicyCreationFailed", policy_name=name)
-                    conditions = set_attach_failed_condition(conditions, error_msg)
-                    metrics.reconcile_total.labels(kind=KIND_IAM_POLICY, result="failed").inc()
-                    patch.status.update({
-                        "conditions": conditions,
-                        "observedGeneration": meta.get("generation", 0),
-                    })
-                    raise
+            if status.get("policyArn") and status.get("policyHash") == policy_digest:
+                # This document was already applied on this Provider; skip the IAM round trips
+                policy_arn = status["policyArn"]
+                conditions = set_ready_condition(conditions, True, f"IAMPolicy {name} is ready")
+            else:
+                with trace_span("create_managed_policy", kind=KIND_IAM_POLICY):
+                    try:
+                        tags = spec.get("tags", {})
+                        description = f"IAMPolicy {name} managed by wasabi-s3-operator"
+
+                        policy_response = provider_client.create_managed_policy(
+                            policy_name=name,
+                            policy_document=aws_policy,
+                            description=description
+                        )
+
+                        # Extract policy ARN from response
+                        policy_arn = policy_response.get("Policy", {}).get("Arn")
+                        if not policy_arn:
+                            policy_arn = f"arn:aws:iam::*:policy/{name}"
+
+                        self.log_info(meta, f"Created managed policy {name} with ARN {policy_arn}",
+                                     reason="PolicyCreated", policy_name=name, policy_arn=policy_arn)
+                        conditions = set_ready_condition(conditions, True, f"IAMPolicy {name} is ready")
+
+                    except Exception as e:
+                        error_msg = f"Failed to create managed policy: {str(e)}"
+                        self.log_error(meta, error_msg, error=e, reason="PolicyCreationFailed", policy_name=name)
+                        conditions = set_attach_failed_condition(conditions, error_msg)
+                        _RECONCILE_FAILED.inc()
+                        patch.status.update({
+                            "conditions": conditions.to_list(),
+                            "observedGeneration": meta.get("generation", 0),
+                        })
+                        raise
 
             # Update status
             status_data = {
                 "applied": True,
                 "policyArn": policy_arn,
+                "policyHash": policy_digest,
                 "attachedUsers": [],  # Will be populated when users reference this policy
-                "lastSyncTime": datetime.now(timezone.utc).isoformat(),
-                "conditions": conditions,
+                "lastSyncTime": now_iso(),
+                "conditions": conditions.to_list(),
             }
 
-            self.update_resource_status(patch, meta, True, status_data)
+            self.update_resource_status(patch, meta, True, status_data, status)
 
     def delete(
         self,
         spec: dict[str, Any],
         meta: dict[str, Any],
         patch: kopf.Patch,
+        provider_index: kopf.Index | None = None,
     ) -> None:
         """Handle IAMPolicy resource deletion."""
         name = meta.get("name", "unknown")
@@ -164,16 +195,10 @@ class IAMPolicyHandler(BaseHandler):
                 provider_ns = provider_ref.get("namespace", namespace)
 
                 try:
-                    provider_obj = api.get_namespaced_custom_object(
-                        group="s3.cloud37.dev",
-                        version="v1alpha1",
-                        namespace=provider_ns,
-                        plural="providers",
-                        name=provider_name,
-                    )
+                    provider_obj = get_provider_with_cache(api, provider_name, provider_ns, namespace, provider_index)
 
                     provider_spec = provider_obj.get("spec", {})
-                    provider_client = create_provider_from_spec(provider_spec, provider_obj.get("metadata", {}))
+                    provider_client = get_cached_provider_client(provider_spec, provider_obj.get("metadata", {}))
 
                     provider_client.delete_managed_policy(name)
                     self.log_info(meta, f"Deleted managed policy {name} from Wasabi",
@@ -204,7 +229,18 @@ def handle_iampolicy(
 ) -> None:
     """Handle IAMPolicy resource reconciliation."""
     _handler.ensure_finalizer(meta, patch)
-    _handler.reconcile_with_metrics(meta, lambda: _handler.reconcile(spec, meta, status, patch))
+    # Already applied at this generation (resume, metadata-only update)
+    if (
+        status.get("applied")
+        and status.get("observedGeneration") == meta.get("generation", 0)
+        and Conditions(status.get("conditions")).is_true(COND_READY)
+    ):
+        _RECONCILE_SKIPPED.inc()
+        return
+    _handler.reconcile_with_metrics(
+        meta,
+        lambda: _handler.reconcile(spec, meta, status, patch, provider_index=kwargs.get("provider_index")),
+    )
 
 
 @kopf.on.delete(API_GROUP_VERSION, KIND_IAM_POLICY)
@@ -215,4 +251,4 @@ def handle_iampolicy_delete(
     **kwargs: Any,
 ) -> None:
     """Handle IAMPolicy resource deletion."""
-    _handler.delete(spec, meta, patch)
+    _handler.delete(spec, meta, patch, provider_index=kwargs.get("provider_index"))
@@ -0,0 +1,65 @@
+"""In-memory kopf indexes for CRDs referenced by other resources."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import kopf
+
+from ..constants import API_GROUP_VERSION, KIND_BUCKET, KIND_IAM_POLICY, KIND_PROVIDER, KIND_USER
+
+
+@kopf.index(API_GROUP_VERSION, KIND_PROVIDER)
+def provider_index(
+    namespace: str,
+    name: str,
+    body: kopf.Body,
+    **kwargs: Any,
+) -> dict[tuple[str, str], dict[str, Any]]:
+    """Index Provider resources by (namespace, name).
+
+    Injected into handlers as the ``provider_index`` keyword argument.
+    """
+    return {(namespace, name): dict(body)}
+
+
+@kopf.index(API_GROUP_VERSION, KIND_IAM_POLICY)
+def iampolicy_index(
+    namespace: str,
+    name: str,
+    body: kopf.Body,
+    **kwargs: Any,
+) -> dict[tuple[str, str], dict[str, Any]]:
+    """Index IAMPolicy resources by (namespace, name).
+
+    Injected into handlers as the ``iampolicy_index`` keyword argument.
+    """
+    return {(namespace, name): dict(body)}
+
+
+@kopf.index(API_GROUP_VERSION, KIND_USER)
+def user_index(
+    namespace: str,
+    name: str,
+    body: kopf.Body,
+    **kwargs: Any,
+) -> dict[tuple[str, str], dict[str, Any]]:
+    """Index User resources by (namespace, name).
+
+    Injected into handlers as the ``user_index`` keyword argument.
+    """
+    return {(namespace, name): dict(body)}
+
+
+@kopf.index(API_GROUP_VERSION, KIND_BUCKET)
+def bucket_index(
+    namespace: str,
+    name: str,
+    body: kopf.Body,
+    **kwargs: Any,
+) -> dict[tuple[str, str], dict[str, Any]]:
+    """Index Bucket resources by (namespace, name).
+
+    Injected into handlers as the ``bucket_index`` keyword argument.
+    """
+    return {(namespace, name): dict(body)}
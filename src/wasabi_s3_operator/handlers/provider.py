@@ -2,22 +2,23 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
 from typing import Any
 
 import kopf
 
 from .. import metrics
-from ..builders.provider import create_provider_from_spec
+from ..builders.provider import create_provider_from_spec, invalidate_provider_client
 from ..constants import API_GROUP_VERSION, KIND_PROVIDER
 from ..tracing import trace_span
 from ..utils.conditions import (
+    Conditions,
     set_auth_valid_condition,
     set_endpoint_reachable_condition,
     set_ready_condition,
 )
 from ..utils.errors import sanitize_exception
 from ..utils.events import emit_validate_succeeded
+from ..utils.timestamps import now_iso
 from .base import BaseHandler
 
 
@@ -45,8 +46,8 @@ class ProviderHandler(BaseHandler):
 
             emit_validate_succeeded(meta)
 
-            # Initialize conditions if needed
-            conditions = status.get("conditions", [])
+            # Index existing conditions by type; serialized once for the status patch
+            conditions = Conditions(status.get("conditions"))
 
             # Try to create provider and test connectivity
             with trace_span("create_provider", kind=KIND_PROVIDER):
@@ -59,7 +60,7 @@ class ProviderHandler(BaseHandler):
                     sanitized_error = sanitize_exception(e)
                     auth_message = f"Authentication failed: {sanitized_error}"
                     error_type = type(e).__name__
-                    metrics.error_total.labels(kind=KIND_PROVIDER, error_type=error_type).inc()
+                    self._labels(metrics.error_total, error_type=error_type).inc()
                     self.log_error(meta, f"Failed to create provider: {sanitized_error}", error=e, reason="AuthFailed")
 
             conditions = set_auth_valid_condition(conditions, auth_valid, auth_message)
@@ -79,7 +80,7 @@ class ProviderHandler(BaseHandler):
                         sanitized_error = sanitize_exception(e)
                         endpoint_message = f"Connectivity test failed: {sanitized_error}"
                         error_type = type(e).__name__
-                        metrics.error_total.labels(kind=KIND_PROVIDER, error_type=error_type).inc()
+                        self._labels(metrics.error_total, error_type=error_type).inc()
                         self.log_error(meta, f"Connectivity test failed: {sanitized_error}", error=e, reason="ConnectivityFailed")
                         metrics.provider_connectivity_total.labels(provider=name, status="error").inc()
             else:
@@ -96,10 +97,10 @@ class ProviderHandler(BaseHandler):
             # Update status
             status_data = {
                 "connected": connected,
-                "lastConnectTime": datetime.now(timezone.utc).isoformat() if connected else None,
-                "conditions": conditions,
+                "lastConnectTime": now_iso() if connected else None,
+                "conditions": conditions.to_list(),
             }
-            self.update_resource_status(patch, meta, ready, status_data)
+            self.update_resource_status(patch, meta, ready, status_data, status)
 
     def delete(
         self,
@@ -109,7 +110,8 @@ class ProviderHandler(BaseHandler):
     ) -> None:
         """Handle Provider resource deletion."""
         self.log_info(meta, "Provider is being deleted", event="deletion", reason="Deletion")
-        # No cleanup needed for provider itself
+        # Drop the client other handlers cached for this Provider
+        invalidate_provider_client(meta.get("uid"))
         self.remove_finalizer(meta, patch)
 
 
@@ -2,30 +2,262 @@
 
 from __future__ import annotations
 
-import time
-from typing import Any
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, cast
 
 from kubernetes import client
 
 from .. import metrics
 from ..constants import KIND_PROVIDER, KIND_USER
-from ..utils.cache import get_cached_object, make_cache_key, set_cached_object
+from ..utils.cache import get_cached_object, is_refresh_due, set_cached_object
+from ..utils.k8s import get_api_client
 from ..utils.rate_limit import handle_rate_limit_error, rate_limit_k8s
 
+# Process-wide CustomObjectsApi on the shared ApiClient
+_k8s_api: client.CustomObjectsApi | None = None
+_k8s_api_lock = threading.Lock()
+
+# Pre-bound API call counters and duration histograms (avoids a labels() lookup per call)
+_API_CALLS = {
+    (operation, result): metrics.api_call_total.labels(api_type="k8s", operation=operation, result=result)
+    for operation in ("get_provider", "get_user")
+    for result in ("cache_hit", "revalidated", "success", "error")
+}
+_API_CALL_DURATION = {
+    operation: metrics.api_call_duration_seconds.labels(api_type="k8s", operation=operation)
+    for operation in ("get_provider", "get_user")
+}
+
+# Maximum GET attempts (initial request plus rate-limit retries)
+_MAX_GET_ATTEMPTS = 3
+
+# Background refreshes of cache entries past their refresh threshold
+_refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cache-refresh")
+_refreshing: set[Hashable] = set()
+_refreshing_lock = threading.Lock()
+
+# In-flight GETs by cache key, so concurrent misses share one API request
+_inflight: dict[Hashable, Future[Any]] = {}
+_inflight_lock = threading.Lock()
+
+
+def _singleflight(key: Hashable, fn: Callable[[], Any]) -> Any:
+    """Run ``fn`` once for concurrent callers sharing the same key.
+
+    The first caller runs ``fn``; callers arriving while it is in flight
+    wait for and receive the same result (or exception).
+
+    Args:
+        key: Coalescing key
+        fn: Zero-argument function performing the request
+
+    Returns:
+        Result of ``fn``
+    """
+    with _inflight_lock:
+        future = _inflight.get(key)
+        leader = future is None
+        if future is None:
+            future = Future()
+            _inflight[key] = future
+
+    if not leader:
+        return future.result()
+
+    try:
+        result = fn()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+def _list_since(api: Any, namespace: str, plural: str, name: str) -> Callable[[str], Any]:
+    """Build a ``list_since`` function for one named custom object.
+
+    The list is filtered to the object's name and served from any state at
+    least as new as the given resourceVersion (``NotOlderThan``).
+    """
+    return lambda resource_version: rate_limit_k8s(api.list_namespaced_custom_object)(
+        group="s3.cloud37.dev",
+        version="v1alpha1",
+        namespace=namespace,
+        plural=plural,
+        field_selector=f"metadata.name={name}",
+        resource_version=resource_version,
+        resource_version_match="NotOlderThan",
+        limit=1,
+    )
+
+
+def get_from_index(
+    index: Any,
+    namespace: str,
+    name: str,
+) -> dict[str, Any] | None:
+    """Look up a resource body in a kopf in-memory index.
+
+    Args:
+        index: kopf.Index keyed by (namespace, name), or None if not available
+        namespace: Resource namespace
+        name: Resource name
+
+    Returns:
+        Indexed resource body, or None if the index is missing or has no entry
+    """
+    if index is None:
+        return None
+
+    store = index.get((namespace, name))
+    if not store:
+        return None
+
+    for obj in store:
+        return cast(dict[str, Any], obj)
+    return None
+
+
+def _fetch(operation: str, cache_key: Hashable, fetch: Callable[[], Any]) -> Any:
+    """GET an object, retrying rate-limited requests, and cache the result.
+
+    Args:
+        operation: Metric operation label ("get_provider" or "get_user")
+        cache_key: Cache key of the object
+        fetch: Zero-argument function issuing the GET
+
+    Returns:
+        Fetched object
+    """
+    with _API_CALL_DURATION[operation].time():
+        attempt = 0
+        while True:
+            try:
+                obj = _singleflight(cache_key, fetch)
+            except Exception as e:
+                _API_CALLS[operation, "error"].inc()
+                # Retry after a jittered backoff while attempts remain
+                if attempt + 1 < _MAX_GET_ATTEMPTS and handle_rate_limit_error(e, attempt=attempt):
+                    attempt += 1
+                    continue
+                raise
+            _API_CALLS[operation, "success"].inc()
+            set_cached_object(cache_key, obj)
+            return obj
+
+
+def _revalidate(
+    operation: str,
+    cache_key: Hashable,
+    list_since: Callable[[str], Any],
+) -> bool:
+    """Keep a cached object if its resourceVersion is still current.
+
+    Args:
+        operation: Metric operation label ("get_provider" or "get_user")
+        cache_key: Cache key of the object
+        list_since: Function listing the object at or newer than a resourceVersion
+
+    Returns:
+        True if the entry was revalidated or replaced, False if a GET is needed
+    """
+    cached = get_cached_object(cache_key)
+    resource_version = (cached or {}).get("metadata", {}).get("resourceVersion")
+    if not resource_version:
+        return False
+
+    items = list_since(resource_version).get("items") or []
+    if not items:
+        # Deleted (or not visible): let the GET surface the 404
+        return False
+
+    current = items[0]
+    if current.get("metadata", {}).get("resourceVersion") == resource_version:
+        set_cached_object(cache_key, cached)
+        _API_CALLS[operation, "revalidated"].inc()
+    else:
+        set_cached_object(cache_key, current)
+        _API_CALLS[operation, "success"].inc()
+    return True
+
+
+def _refresh(
+    operation: str,
+    cache_key: Hashable,
+    fetch: Callable[[], Any],
+    list_since: Callable[[str], Any] | None = None,
+) -> None:
+    """Refresh a cache entry in the background, leaving it to expire on error."""
+    try:
+        if list_since is None or not _revalidate(operation, cache_key, list_since):
+            _fetch(operation, cache_key, fetch)
+    except Exception:
+        pass
+    finally:
+        with _refreshing_lock:
+            _refreshing.discard(cache_key)
+
+
+def _get_with_cache(
+    operation: str,
+    cache_key: Hashable,
+    fetch: Callable[[], Any],
+    list_since: Callable[[str], Any] | None = None,
+) -> Any:
+    """Serve an object from the TTL cache, falling back to a GET.
+
+    Hits past the refresh threshold are still returned immediately, with a
+    refresh scheduled in the background so busy keys do not expire into a
+    synchronous miss. When ``list_since`` is given, the refresh first checks
+    the cached ``resourceVersion`` and only replaces the entry if it changed.
+
+    Args:
+        operation: Metric operation label ("get_provider" or "get_user")
+        cache_key: Cache key of the object
+        fetch: Zero-argument function issuing the GET
+        list_since: Optional function listing the object at or newer than a resourceVersion
+
+    Returns:
+        Cached or fetched object
+    """
+    cached = get_cached_object(cache_key)
+    if cached is not None:
+        _API_CALLS[operation, "cache_hit"].inc()
+        if is_refresh_due(cache_key):
+            with _refreshing_lock:
+                schedule = cache_key not in _refreshing
+                _refreshing.add(cache_key)
+            if schedule:
+                _refresh_executor.submit(_refresh, operation, cache_key, fetch, list_since)
+        return cached
+
+    return _fetch(operation, cache_key, fetch)
+
 
 def get_provider_with_cache(
     api: Any,
     provider_name: str,
     provider_ns: str,
     namespace: str = "default",
+    provider_index: Any = None,
 ) -> dict[str, Any]:
     """Get provider CRD with caching.
+
+    Reads from the kopf ``provider_index`` when one is passed, then from the
+    TTL cache, and only then issues a GET (e.g. before the index is filled).
     
     Args:
         api: Kubernetes CustomObjectsApi instance
         provider_name: Name of the provider
         provider_ns: Namespace of the provider
         namespace: Current namespace (for fallback)
+        provider_index: Optional kopf index of Providers keyed by (namespace, name)
         
     Returns:
         Provider CRD object
@@ -33,47 +265,41 @@ def get_provider_with_cache(
     Raises:
         client.exceptions.ApiException: If provider not found or API error
     """
-    cache_key = make_cache_key(KIND_PROVIDER, provider_ns, provider_name)
-    cached_provider = get_cached_object(cache_key)
-    
-    if cached_provider is not None:
-        metrics.api_call_total.labels(api_type="k8s", operation="get_provider", result="cache_hit").inc()
-        return cached_provider
-    
-    start_time = time.time()
-    try:
-        provider_obj = rate_limit_k8s(api.get_namespaced_custom_object)(
+    provider_obj = get_from_index(provider_index, provider_ns, provider_name)
+    if provider_obj is not None:
+        _API_CALLS["get_provider", "cache_hit"].inc()
+        return provider_obj
+
+    return cast(dict[str, Any], _get_with_cache(
+        "get_provider",
+        (KIND_PROVIDER, provider_ns, provider_name),
+        lambda: rate_limit_k8s(api.get_namespaced_custom_object)(
             group="s3.cloud37.dev",
             version="v1alpha1",
             namespace=provider_ns,
             plural="providers",
             name=provider_name,
-        )
-        metrics.api_call_total.labels(api_type="k8s", operation="get_provider", result="success").inc()
-        set_cached_object(cache_key, provider_obj)
-        return provider_obj
-    except Exception as e:
-        metrics.api_call_total.labels(api_type="k8s", operation="get_provider", result="error").inc()
-        if handle_rate_limit_error(e):
-            # Retry once after rate limit backoff
-            return get_provider_with_cache(api, provider_name, provider_ns, namespace)
-        raise
-    finally:
-        duration = time.time() - start_time
-        metrics.api_call_duration_seconds.labels(api_type="k8s", operation="get_provider").observe(duration)
+        ),
+        _list_since(api, provider_ns, "providers", provider_name),
+    ))
 
 
 def get_user_with_cache(
     api: Any,
     user_name: str,
     user_ns: str,
+    user_index: Any = None,
 ) -> dict[str, Any]:
     """Get user CRD with caching.
+
+    Reads from the kopf ``user_index`` when one is passed, then from the
+    TTL cache, and only then issues a GET (e.g. before the index is filled).
     
     Args:
         api: Kubernetes CustomObjectsApi instance
         user_name: Name of the user
         user_ns: Namespace of the user
+        user_index: Optional kopf index of Users keyed by (namespace, name)
         
     Returns:
         User CRD object
@@ -81,48 +307,39 @@ def get_user_with_cache(
     Raises:
         client.exceptions.ApiException: If user not found or API error
     """
-    cache_key = make_cache_key(KIND_USER, user_ns, user_name)
-    cached_user = get_cached_object(cache_key)
-    
-    if cached_user is not None:
-        metrics.api_call_total.labels(api_type="k8s", operation="get_user", result="cache_hit").inc()
-        return cached_user
-    
-    start_time = time.time()
-    try:
-        user_obj = rate_limit_k8s(api.get_namespaced_custom_object)(
+    user_obj = get_from_index(user_index, user_ns, user_name)
+    if user_obj is not None:
+        _API_CALLS["get_user", "cache_hit"].inc()
+        return user_obj
+
+    return cast(dict[str, Any], _get_with_cache(
+        "get_user",
+        (KIND_USER, user_ns, user_name),
+        lambda: rate_limit_k8s(api.get_namespaced_custom_object)(
             group="s3.cloud37.dev",
             version="v1alpha1",
             namespace=user_ns,
             plural="users",
             name=user_name,
-        )
-        metrics.api_call_total.labels(api_type="k8s", operation="get_user", result="success").inc()
-        set_cached_object(cache_key, user_obj)
-        return user_obj
-    except Exception as e:
-        metrics.api_call_total.labels(api_type="k8s", operation="get_user", result="error").inc()
-        if handle_rate_limit_error(e):
-            # Retry once after rate limit backoff
-            return get_user_with_cache(api, user_name, user_ns)
-        raise
-    finally:
-        duration = time.time() - start_time
-        metrics.api_call_duration_seconds.labels(api_type="k8s", operation="get_user").observe(duration)
+        ),
+        _list_since(api, user_ns, "users", user_name),
+    ))
 
 
 def get_k8s_client() -> client.CustomObjectsApi:
     """Get Kubernetes CustomObjectsApi client.
+
+    Built on the shared ApiClient from ``utils.k8s``, so configuration is
+    loaded once and the connection pool is shared with other typed APIs;
+    later calls return the same client.
     
     Returns:
         CustomObjectsApi instance
     """
-    from kubernetes import config
-    
-    try:
-        config.load_incluster_config()
-    except config.ConfigException:
-        config.load_kube_config()
-    
-    return client.CustomObjectsApi()
+    global _k8s_api
+    if _k8s_api is None:
+        with _k8s_api_lock:
+            if _k8s_api is None:
+                _k8s_api = client.CustomObjectsApi(get_api_client())
+    return _k8s_api
 
@@ -2,25 +2,67 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any
 
 import kopf
 from kubernetes import client
 
 from .. import metrics
-from ..builders.provider import create_provider_from_spec
-from ..constants import API_GROUP_VERSION, KIND_USER
-from ..handlers.shared import get_provider_with_cache, get_k8s_client
+from ..builders.provider import get_cached_provider_client
+from ..constants import API_GROUP_VERSION, COND_READY, KIND_USER
+from ..handlers.shared import get_from_index, get_provider_with_cache, get_k8s_client
 from ..tracing import trace_span
 from ..utils.conditions import (
+    Conditions,
     set_creation_failed_condition,
     set_provider_not_ready_condition,
     set_ready_condition,
 )
 from ..utils.events import emit_validate_succeeded
+from ..utils.timestamps import now_iso
 from .base import BaseHandler
 
+# Pre-bound reconcile counters (avoids a labels() lookup per call)
+_RECONCILE_SUCCESS = metrics.reconcile_total.labels(kind=KIND_USER, result="success")
+_RECONCILE_SKIPPED = metrics.reconcile_total.labels(kind=KIND_USER, result="skipped")
+
+# Shared pool for fetching a referenced IAMPolicy while the Provider is read;
+# sized like kopf's worker pool so concurrent reconciles do not queue behind it
+_fetch_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("KOPF_MAX_WORKERS", "20")), thread_name_prefix="user-fetch"
+)
+
+
+@lru_cache(maxsize=512)
+def _default_policy(bucket_name: str) -> dict[str, Any]:
+    """Build the default full-access inline policy for a bucket.
+
+    The result is shared between callers for the same bucket and must not
+    be mutated.
+
+    Args:
+        bucket_name: Bucket the policy grants access to
+
+    Returns:
+        Policy document in CRD format
+    """
+    return {
+        "version": "2012-10-17",
+        "statement": [
+            {
+                "effect": "Allow",
+                "action": ["s3:*"],
+                "resource": [
+                    f"arn:aws:s3:::{bucket_name}",
+                    f"arn:aws:s3:::{bucket_name}/*",
+                ],
+            }
+        ],
+    }
+
 
 class UserHandler(BaseHandler):
     """Handler for User resources."""
@@ -35,13 +77,20 @@ class UserHandler(BaseHandler):
         meta: dict[str, Any],
         status: dict[str, Any],
         patch: kopf.Patch,
+        provider_index: kopf.Index | None = None,
+        iampolicy_index: kopf.Index | None = None,
     ) -> None:
-        """Reconcile User resource."""
+        """Reconcile User resource.
+
+        Referenced Provider and IAMPolicy objects are read from the kopf
+        in-memory indexes when available, falling back to the API on a miss.
+        """
         namespace = meta.get("namespace", "default")
         name = meta.get("name", "unknown")
         provider_ref = spec.get("providerRef", {})
         provider_name = provider_ref.get("name")
         user_name = spec.get("name")
+        generation = meta.get("generation", 0)
 
         with trace_span("reconcile_user", kind=KIND_USER, attributes={"user.name": user_name or name}):
             # Validate spec
@@ -57,56 +106,67 @@ class UserHandler(BaseHandler):
             api = get_k8s_client()
             provider_ns = provider_ref.get("namespace", namespace)
 
-            try:
-                provider_obj = api.get_namespaced_custom_object(
-                    group="s3.cloud37.dev",
-                    version="v1alpha1",
-                    namespace=provider_ns,
-                    plural="providers",
-                    name=provider_name,
-                )
-            except client.exceptions.ApiException as e:
-                if e.status == 404:
-                    error_msg = f"Provider {provider_name} not found in namespace {provider_ns}"
-                    self.handle_provider_not_found(meta, status, patch, provider_name, provider_ns, error_msg)
-                    return
-                raise
+            # A new user with a policyRef also needs the IAMPolicy; unless the
+            # index already has it, start the GET now so it overlaps with the
+            # Provider fetch
+            policy_future = None
+            policy_ref = spec.get("policyRef") or {}
+            if not status.get("userId") and policy_ref.get("name") and not spec.get("policy"):
+                policy_ns = policy_ref.get("namespace", namespace)
+                if get_from_index(iampolicy_index, policy_ns, policy_ref["name"]) is None:
+                    policy_future = _fetch_executor.submit(
+                        self._get_iam_policy, api, policy_ns, policy_ref["name"],
+                    )
 
-            # Check if provider is ready
-            provider_status = provider_obj.get("status", {})
-            provider_conditions = provider_status.get("conditions", [])
-            provider_ready = any(
-                cond.get("type") == "Ready" and cond.get("status") == "True" for cond in provider_conditions
-            )
+            try:
+                try:
+                    provider_obj = get_provider_with_cache(api, provider_name, provider_ns, namespace, provider_index)
+                except client.exceptions.ApiException as e:
+                    if e.status == 404:
+                        error_msg = f"Provider {provider_name} not found in namespace {provider_ns}"
+                        self.handle_provider_not_found(meta, status, patch, provider_name, provider_ns, error_msg)
+                        return
+                    raise
 
-            if not provider_ready:
-                error_msg = f"Provider {provider_name} is not ready"
-                self.handle_provider_not_ready(meta, status, patch, provider_name, error_msg)
+                # Check if provider is ready
+                provider_status = provider_obj.get("status", {})
+                provider_ready = Conditions(provider_status.get("conditions")).is_true(COND_READY)
 
-            # Create provider client
-            provider_spec = provider_obj.get("spec", {})
-            provider_client = create_provider_from_spec(provider_spec, provider_obj.get("metadata", {}))
+                if not provider_ready:
+                    error_msg = f"Provider {provider_name} is not ready"
+                    self.handle_provider_not_ready(meta, status, patch, provider_name, error_msg)
 
-            # Check if user already exists
-            existing_user_id = status.get("userId")
-            conditions = status.get("conditions", [])
+                # Create provider client
+                provider_spec = provider_obj.get("spec", {})
+                provider_client = get_cached_provider_client(provider_spec, provider_obj.get("metadata", {}))
 
-            if not existing_user_id:
-                self._create_user(provider_client, api, namespace, user_name, spec, meta, status, patch, conditions)
-            else:
-                # User already exists
-                self.log_info(meta, f"User {user_name} already exists", reason="UserExists", user_name=user_name)
-                conditions = set_ready_condition(conditions, True, f"User {user_name} is ready")
+                # Check if user already exists
+                existing_user_id = status.get("userId")
+                conditions = Conditions(status.get("conditions"))
 
-                status_update = {
-                    "observedGeneration": meta.get("generation", 0),
-                    "userId": existing_user_id,
-                    "created": True,
-                    "conditions": conditions,
-                }
+                if not existing_user_id:
+                    self._create_user(
+                        provider_client, api, namespace, user_name, spec, meta, status, patch, conditions,
+                        iampolicy_index, policy_future,
+                    )
+                else:
+                    # User already exists
+                    self.log_info(meta, f"User {user_name} already exists", reason="UserExists", user_name=user_name)
+                    conditions = set_ready_condition(conditions, True, f"User {user_name} is ready")
+
+                    status_update = {
+                        "observedGeneration": generation,
+                        "userId": existing_user_id,
+                        "created": True,
+                        "conditions": conditions.to_list(),
+                    }
 
-                metrics.reconcile_total.labels(kind=KIND_USER, result="success").inc()
-                patch.status.update(status_update)
+                    _RECONCILE_SUCCESS.inc()
+                    patch.status.update(status_update)
+            finally:
+                # No-op once the lookup has been consumed; drops it if we bailed out early
+                if policy_future is not None:
+                    policy_future.cancel()
 
     def _create_user(
         self,
@@ -118,9 +178,15 @@ class UserHandler(BaseHandler):
         meta: dict[str, Any],
         status: dict[str, Any],
         patch: kopf.Patch,
-        conditions: list[dict[str, Any]],
+        conditions: Conditions,
+        iampolicy_index: kopf.Index | None = None,
+        policy_future: Future | None = None,
     ) -> None:
-        """Create a new user."""
+        """Create a new user.
+
+        ``policy_future`` is a pending IAMPolicy lookup started by ``reconcile``;
+        when absent the policy is fetched here.
+        """
         with trace_span("create_user", kind=KIND_USER):
             try:
                 policy = spec.get("policy")
@@ -131,12 +197,7 @@ class UserHandler(BaseHandler):
                     error_msg = "Cannot specify both policy and policyRef"
                     self.logger.error(error_msg)
                     conditions = set_creation_failed_condition(conditions, error_msg)
-                    emit_reconcile_failed(meta, error_msg)
-                    metrics.reconcile_total.labels(kind=KIND_USER, result="failed").inc()
-                    patch.status.update({
-                        "conditions": conditions,
-                        "observedGeneration": meta.get("generation", 0),
-                    })
+                    self.fail_reconcile(meta, patch, conditions.to_list(), error_msg)
                     return
 
                 # If policyRef is provided, fetch the IAMPolicy
@@ -149,56 +210,35 @@ class UserHandler(BaseHandler):
                         error_msg = "policyRef.name is required"
                         self.logger.error(error_msg)
                         conditions = set_creation_failed_condition(conditions, error_msg)
-                        emit_reconcile_failed(meta, error_msg)
-                        metrics.reconcile_total.labels(kind=KIND_USER, result="failed").inc()
-                        patch.status.update({
-                            "conditions": conditions,
-                            "observedGeneration": meta.get("generation", 0),
-                        })
+                        self.fail_reconcile(meta, patch, conditions.to_list(), error_msg)
                         return
 
                     # Fetch the IAMPolicy
                     try:
-                        policy_obj = api.get_namespaced_custom_object(
-                            group="s3.cloud37.dev",
-                            version="v1alpha1",
-                            namespace=policy_ns,
-                            plural="iampolicies",
-                            name=policy_name,
-                        )
+                        if policy_future is not None:
+                            policy_obj = policy_future.result()
+                        else:
+                            policy_obj = self._get_iam_policy(api, policy_ns, policy_name, iampolicy_index)
 
                         # Check if policy is ready
                         policy_status = policy_obj.get("status", {})
-                        policy_conditions = policy_status.get("conditions", [])
-                        policy_ready = any(
-                            cond.get("type") == "Ready" and cond.get("status") == "True" for cond in policy_conditions
-                        )
+                        policy_ready = Conditions(policy_status.get("conditions")).is_true(COND_READY)
 
                         if not policy_ready:
                             error_msg = f"IAMPolicy {policy_name} is not ready"
                             self.logger.warning(error_msg)
                             conditions = set_creation_failed_condition(conditions, error_msg)
-                            emit_reconcile_failed(meta, error_msg)
-                            metrics.reconcile_total.labels(kind=KIND_USER, result="failed").inc()
-                            patch.status.update({
-                                "conditions": conditions,
-                                "observedGeneration": meta.get("generation", 0),
-                            })
+                            self.fail_reconcile(meta, patch, conditions.to_list(), error_msg)
                             raise kopf.TemporaryError(error_msg)
 
-                        self.logger.info(f"Will attach managed policy {policy_name} to user {user_name}")
+                        self.logger.info("Will attach managed policy %s to user %s", policy_name, user_name)
                         policy = None  # Set to None to indicate we're using policyRef
                     except client.exceptions.ApiException as e:
                         if e.status == 404:
                             error_msg = f"IAMPolicy {policy_name} not found in namespace {policy_ns}"
                             self.logger.error(error_msg)
                             conditions = set_creation_failed_condition(conditions, error_msg)
-                            emit_reconcile_failed(meta, error_msg)
-                            metrics.reconcile_total.labels(kind=KIND_USER, result="failed").inc()
-                            patch.status.update({
-                                "conditions": conditions,
-                                "observedGeneration": meta.get("generation", 0),
-                            })
+                            self.fail_reconcile(meta, patch, conditions.to_list(), error_msg)
                             return
                         raise
 
@@ -207,27 +247,15 @@ class UserHandler(BaseHandler):
                     tags = spec.get("tags", {})
                     bucket_name = tags.get("Bucket", user_name)
 
-                    policy = {
-                        "version": "2012-10-17",
-                        "statement": [
-                            {
-                                "effect": "Allow",
-                                "action": ["s3:*"],
-                                "resource": [
-                                    f"arn:aws:s3:::{bucket_name}",
-                                    f"arn:aws:s3:::{bucket_name}/*",
-                                ],
-                            }
-                        ],
-                    }
-                    self.logger.info(f"No policy provided, creating default policy for bucket {bucket_name}")
+                    policy = _default_policy(bucket_name)
+                    self.logger.info("No policy provided, creating default policy for bucket %s", bucket_name)
 
                 # Create user (with or without inline policy)
                 if policy:
-                    self.logger.info(f"Creating user {user_name} with inline policy: {policy}")
+                    self.logger.info("Creating user %s with inline policy: %s", user_name, policy)
                     user_response = provider_client.create_user(user_name, policy)
                 else:
-                    self.logger.info(f"Creating user {user_name} without inline policy")
+                    self.logger.info("Creating user %s without inline policy", user_name)
                     user_response = provider_client.create_user(user_name, None)
 
                 user_id = user_response.get("User", {}).get("UserId")
@@ -235,43 +263,58 @@ class UserHandler(BaseHandler):
                 # If policyRef was specified, attach the managed policy
                 if policy_ref and policy_name:
                     try:
-                        self.logger.info(f"Attaching managed policy {policy_name} to user {user_name}")
+                        self.logger.info("Attaching managed policy %s to user %s", policy_name, user_name)
                         provider_client.attach_managed_policy_to_user(user_name, policy_name)
-                        self.logger.info(f"Successfully attached managed policy {policy_name} to user {user_name}")
+                        self.logger.info("Successfully attached managed policy %s to user %s", policy_name, user_name)
                     except Exception as e:
                         error_msg = f"Failed to attach managed policy {policy_name}: {str(e)}"
                         self.logger.error(error_msg)
                         # Don't fail user creation if policy attachment fails
 
                 conditions = set_ready_condition(conditions, True, f"User {user_name} created")
-                self.logger.info(f"Created user {user_name} with ID {user_id}")
+                self.logger.info("Created user %s with ID %s", user_name, user_id)
 
                 status_update = {
                     "observedGeneration": meta.get("generation", 0),
                     "userId": user_id,
                     "created": True,
-                    "lastSyncTime": datetime.now(timezone.utc).isoformat(),
-                    "conditions": conditions,
+                    "lastSyncTime": now_iso(),
+                    "conditions": conditions.to_list(),
                 }
 
-                metrics.reconcile_total.labels(kind=KIND_USER, result="success").inc()
+                _RECONCILE_SUCCESS.inc()
                 patch.status.update(status_update)
             except Exception as e:
                 error_msg = f"Failed to create user: {str(e)}"
                 self.logger.error(error_msg)
                 conditions = set_creation_failed_condition(conditions, error_msg)
-                emit_reconcile_failed(meta, error_msg)
-                metrics.reconcile_total.labels(kind=KIND_USER, result="failed").inc()
-                patch.status.update({
-                    "conditions": conditions,
-                    "observedGeneration": meta.get("generation", 0),
-                })
+                self.fail_reconcile(meta, patch, conditions.to_list(), error_msg)
+
+    def _get_iam_policy(
+        self,
+        api: Any,
+        policy_ns: str,
+        policy_name: str,
+        iampolicy_index: kopf.Index | None = None,
+    ) -> dict[str, Any]:
+        """Get an IAMPolicy from the index, falling back to the API."""
+        policy_obj = get_from_index(iampolicy_index, policy_ns, policy_name)
+        if policy_obj is None:
+            policy_obj = api.get_namespaced_custom_object(
+                group="s3.cloud37.dev",
+                version="v1alpha1",
+                namespace=policy_ns,
+                plural="iampolicies",
+                name=policy_name,
+            )
+        return policy_obj
 
     def delete(
         self,
         spec: dict[str, Any],
         meta: dict[str, Any],
         patch: kopf.Patch,
+        provider_index: kopf.Index | None = None,
     ) -> None:
         """Handle User resource deletion."""
         name = meta.get("name", "unknown")
@@ -289,14 +332,14 @@ class UserHandler(BaseHandler):
                     namespace = meta.get("namespace", "default")
                     provider_ns = provider_ref.get("namespace", namespace)
 
-                    provider_obj = get_provider_with_cache(api, provider_name, provider_ns, namespace)
+                    provider_obj = get_provider_with_cache(api, provider_name, provider_ns, namespace, provider_index)
                     provider_spec = provider_obj.get("spec", {})
-                    provider_client = create_provider_from_spec(provider_spec, provider_obj.get("metadata", {}))
+                    provider_client = get_cached_provider_client(provider_spec, provider_obj.get("metadata", {}))
 
                     provider_client.delete_user(user_name)
-                    self.logger.info(f"Deleted user {user_name}")
+                    self.logger.info("Deleted user %s", user_name)
             except Exception as e:
-                self.logger.error(f"Failed to delete user {user_name}: {e}")
+                self.logger.error("Failed to delete user %s: %s", user_name, e)
             finally:
                 self.remove_finalizer(meta, patch)
         else:
@@ -319,7 +362,23 @@ def handle_user(
 ) -> None:
     """Handle User resource reconciliation."""
     _handler.ensure_finalizer(meta, patch)
-    _handler.reconcile_with_metrics(meta, lambda: _handler.reconcile(spec, meta, status, patch))
+    # Nothing changed since the last successful reconcile (resume/re-list);
+    # skipped before reconcile_with_metrics so it is not timed as a reconcile
+    if (
+        status.get("userId")
+        and status.get("observedGeneration") == meta.get("generation", 0)
+        and Conditions(status.get("conditions")).is_true(COND_READY)
+    ):
+        _RECONCILE_SKIPPED.inc()
+        return
+    _handler.reconcile_with_metrics(
+        meta,
+        lambda: _handler.reconcile(
+            spec, meta, status, patch,
+            provider_index=kwargs.get("provider_index"),
+            iampolicy_index=kwargs.get("iampolicy_index"),
+        ),
+    )
 
 
 @kopf.on.delete(API_GROUP_VERSION, KIND_USER)
@@ -330,4 +389,4 @@ def handle_user_delete(
     **kwargs: Any,
 ) -> None:
     """Handle User resource deletion."""
-    _handler.delete(spec, meta, patch)
+    _handler.delete(spec, meta, patch, provider_index=kwargs.get("provider_index"))
@@ -1,91 +1,161 @@
 """Health check endpoint for the operator."""
 
-from typing import Any
-from werkzeug.wrappers import Request, Response
-from werkzeug.serving import make_server
+import os
+import socket
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any
+
+from prometheus_client.exposition import MetricsHandler
+
+# Precomputed probe responses - payloads never change, so each kubelet
+# probe is answered from this table without building a response object
+HEALTHZ_BODY = b'{"status":"ok"}'
+READYZ_BODY = b'{"status":"ready"}'
+PROBE_ROUTES = {
+    "/healthz": (HEALTHZ_BODY, str(len(HEALTHZ_BODY))),
+    "/readyz": (READYZ_BODY, str(len(READYZ_BODY))),
+}
+
+# Default number of worker threads serving the metrics/health HTTP endpoint
+DEFAULT_SERVER_MAX_WORKERS = int(os.getenv("METRICS_SERVER_MAX_WORKERS", "8"))
+
+# Per-connection socket timeout, so a stalled client cannot pin a pool worker
+DEFAULT_SERVER_TIMEOUT_SECONDS = float(os.getenv("METRICS_SERVER_TIMEOUT_SECONDS", "10"))
+
+
+class ProbeMetricsHandler(MetricsHandler):
+    """HTTP handler serving static probe responses and Prometheus metrics.
+
+    ``/healthz`` and ``/readyz`` are answered with fixed bytes straight to
+    the socket; every other path is delegated to prometheus_client's
+    ``MetricsHandler``, which gzips the exposition when the scraper sends
+    ``Accept-Encoding: gzip``. No WSGI environ is built for any request.
+    """
+
+    timeout = DEFAULT_SERVER_TIMEOUT_SECONDS
+
+    def setup(self) -> None:
+        """Disable Nagle's algorithm on the accepted connection."""
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_GET(self) -> None:  # noqa: N802 - name required by BaseHTTPRequestHandler
+        """Serve probe endpoints directly, delegate everything else to metrics."""
+        route = PROBE_ROUTES.get(self.path.split("?", 1)[0])
+        if route is None:
+            super().do_GET()
+            return
+
+        body, content_length = route
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", content_length)
+        self.end_headers()
+        self.wfile.write(body)
 
 
-def health_check_app(environ: dict[str, Any], start_response: Any) -> list[bytes]:
-    """WSGI application for health check endpoints.
-    
-    Note: When mounted via DispatcherMiddleware, the path prefix is stripped,
-    so '/healthz' becomes '/' when passed to this function.
+class PooledHTTPServer(HTTPServer):
+    """HTTP server that dispatches connections to a bounded thread pool.
+
+    Spawning a thread per connection churns OS threads under constant probe
+    and scrape traffic; a fixed pool avoids that while still keeping a slow
+    ``/metrics`` scrape from blocking ``/healthz``. The listening socket sets
+    ``SO_REUSEPORT`` where the platform supports it.
     """
-    request = Request(environ)
-    path = request.path
-    
-    # When mounted under /healthz or /readyz, DispatcherMiddleware strips the prefix
-    # So we check for root path or check the SCRIPT_NAME to determine which endpoint
-    script_name = environ.get("SCRIPT_NAME", "")
-    
-    if path == "/" or path == "/healthz" or script_name == "/healthz":
-        response = Response('{"status":"ok"}', mimetype="application/json", status=200)
-    elif path == "/readyz" or script_name == "/readyz":
-        # Readiness check - can add more sophisticated checks here
-        response = Response('{"status":"ready"}', mimetype="application/json", status=200)
-    else:
-        response = Response('{"error":"not found"}', mimetype="application/json", status=404)
-    
-    return response(environ, start_response)
-
-
-def add_health_routes_to_metrics_server(port: int) -> None:
-    """Add health check routes to the metrics server.
-    
-    This creates a wrapper WSGI app that handles /healthz and /readyz routes,
-    and delegates /metrics to prometheus_client's WSGI app.
-    
+
+    allow_reuse_address = True
+
+    def __init__(
+        self,
+        server_address: tuple[str, int],
+        handler_class: type[BaseHTTPRequestHandler],
+        max_workers: int = DEFAULT_SERVER_MAX_WORKERS,
+    ) -> None:
+        """Initialize the server and its worker pool.
+
+        Args:
+            server_address: (host, port) to bind to
+            handler_class: Request handler class
+            max_workers: Maximum number of concurrent request workers
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="metrics-http",
+        )
+        super().__init__(server_address, handler_class)
+
+    def server_bind(self) -> None:
+        """Enable SO_REUSEPORT before binding the listening socket."""
+        if hasattr(socket, "SO_REUSEPORT"):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        """Hand the accepted connection off to the worker pool."""
+        self._executor.submit(self._process_request_worker, request, client_address)
+
+    def _process_request_worker(self, request: Any, client_address: Any) -> None:
+        """Serve a single connection on a pool worker thread."""
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self) -> None:
+        """Close the listening socket and stop the worker pool."""
+        super().server_close()
+        self._executor.shutdown(wait=False)
+
+
+def make_pooled_server(
+    host: str,
+    port: int,
+    handler_class: type[BaseHTTPRequestHandler] = ProbeMetricsHandler,
+    max_workers: int = DEFAULT_SERVER_MAX_WORKERS,
+) -> PooledHTTPServer:
+    """Create the metrics/health HTTP server backed by a bounded thread pool.
+
     Args:
-        port: Port number for the health check server (must be different from metrics port)
+        host: Host to bind to
+        port: Port to bind to
+        handler_class: Request handler class (defaults to ProbeMetricsHandler)
+        max_workers: Maximum number of concurrent request workers
+
+    Returns:
+        Server instance (call ``serve_forever`` to start it)
     """
-    # Start a simple health check server on a separate port
-    # The deployment will need to be updated to use this port for health checks
-    # Or we can integrate it into the metrics server using DispatcherMiddleware
-    from werkzeug.middleware.dispatcher import DispatcherMiddleware
-    from prometheus_client import make_wsgi_app
-    
-    metrics_app = make_wsgi_app()
-    
-    # Create combined app with health checks
-    combined_app = DispatcherMiddleware(
-        metrics_app,
-        {
-            "/healthz": health_check_app,
-            "/readyz": health_check_app,
-        }
-    )
-    
-    # Start server in background thread
-    server = make_server("", port, combined_app, threaded=True)
-    thread = threading.Thread(target=server.serve_forever, daemon=True)
-    thread.start()
-
-
-def create_combined_wsgi_app() -> Any:
-    """Create a WSGI app that combines metrics and health check endpoints.
-    
+    return PooledHTTPServer((host, port), handler_class, max_workers=max_workers)
+
+
+# The single metrics/health server for this process
+_server: PooledHTTPServer | None = None
+_server_lock = threading.Lock()
+
+
+def add_health_routes_to_metrics_server(port: int) -> PooledHTTPServer:
+    """Start the metrics server with health check routes.
+
+    Serves /healthz and /readyz directly and delegates /metrics to
+    prometheus_client's handler. Only one server is started per process;
+    repeated calls return the running instance instead of binding the port
+    again.
+
+    Args:
+        port: Port number for the metrics and health check server
+
     Returns:
-        Combined WSGI application
+        The running server instance
     """
-    from prometheus_client import make_wsgi_app
-    
-    metrics_app = make_wsgi_app()
-    
-    def combined_app(environ: dict[str, Any], start_response: Any) -> list[bytes]:
-        """WSGI app that routes /healthz and /readyz, delegates /metrics to prometheus."""
-        path = environ.get("PATH_INFO", "")
-        
-        # Handle health check endpoints
-        if path == "/healthz":
-            response = Response('{"status":"ok"}', mimetype="application/json", status=200)
-            return response(environ, start_response)
-        elif path == "/readyz":
-            response = Response('{"status":"ready"}', mimetype="application/json", status=200)
-            return response(environ, start_response)
-        else:
-            # Delegate all other paths (including /metrics) to prometheus app
-            return metrics_app(environ, start_response)
-    
-    return combined_app
+    global _server
+    with _server_lock:
+        if _server is None:
+            _server = make_pooled_server("", port)
+            # Start server in background thread
+            thread = threading.Thread(target=_server.serve_forever, daemon=True)
+            thread.start()
+        return _server
 
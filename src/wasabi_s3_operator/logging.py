@@ -1,10 +1,26 @@
 """Structured logging configuration for the S3 Operator."""
 
-import json
 import logging
 import sys
 from typing import Any
 
+import orjson
+
+# Fields whose values must never reach the logs
+SECRET_FIELDS = frozenset({"access_key", "secret_key", "session_token", "password"})
+
+
+class _JsonMessage:
+    """Log message argument that serializes to JSON only when formatted."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self.data = data
+
+    def __str__(self) -> str:
+        return orjson.dumps(self.data).decode()
+
 
 def setup_structured_logging() -> None:
     """Configure structured JSON logging."""
@@ -27,7 +43,13 @@ def log_resource_event(
     message: str,
     **kwargs: Any,
 ) -> None:
-    """Log a structured resource event."""
+    """Log a structured resource event.
+
+    Nothing is built when INFO is disabled for ``logger``; otherwise JSON
+    encoding is deferred until a handler actually formats the record.
+    """
+    if not logger.isEnabledFor(logging.INFO):
+        return
     log_data = {
         "controller": controller,
         "resource": resource_kind,
@@ -39,15 +61,20 @@ def log_resource_event(
         "message": message,
     }
     log_data.update(kwargs)
-    logger.info(json.dumps(log_data))
+    logger.info("%s", _JsonMessage(log_data))
 
 
 def sanitize_secrets(log_data: dict[str, Any]) -> dict[str, Any]:
-    """Remove secret fields from log data."""
-    secret_fields = {"access_key", "secret_key", "session_token", "password"}
-    sanitized = log_data.copy()
-    for field in secret_fields:
-        if field in sanitized:
-            sanitized[field] = "***REDACTED***"
+    """Remove secret fields from log data.
+
+    Returns ``log_data`` unchanged when it holds no secret fields; otherwise
+    returns a redacted copy.
+    """
+    present = SECRET_FIELDS & log_data.keys()
+    if not present:
+        return log_data
+    sanitized = {**log_data}
+    for field in present:
+        sanitized[field] = "***REDACTED***"
     return sanitized
 
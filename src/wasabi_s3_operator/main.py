@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
-import threading
+import socket
 from typing import Any
 
 import kopf
-from werkzeug.serving import make_server
 
 from . import health
 from . import logging as structured_logging
@@ -15,7 +15,43 @@ from . import metrics
 from .tracing import initialize_tracing
 
 # Import handlers - they register themselves via @kopf decorators
-from .handlers import access_key, bucket, bucket_policy, iampolicy, provider, user  # noqa: F401
+from .handlers import access_key, bucket, bucket_policy, iampolicy, indexes, provider, user  # noqa: F401
+
+
+def peering_priority(pod_name: str) -> int:
+    """Derive a stable kopf peering priority from the pod name.
+
+    Pod names are unique among live replicas, so a 48-bit digest gives every
+    replica a distinct priority; equal priorities would let two peers keep
+    reconciling side by side.
+
+    Args:
+        pod_name: Name of this replica's pod
+
+    Returns:
+        Non-negative priority
+    """
+    return int.from_bytes(hashlib.blake2b(pod_name.encode(), digest_size=6).digest(), "big")
+
+
+def error_delays(min_delay: float, max_delay: float, backoff: float) -> tuple[float, ...]:
+    """Build an exponential ``settings.batching.error_delays`` sequence.
+
+    Args:
+        min_delay: First delay in seconds
+        max_delay: Cap on, and final value of, the sequence
+        backoff: Multiplier applied between consecutive delays
+
+    Returns:
+        Delays from ``min_delay`` growing by ``backoff`` up to ``max_delay``
+    """
+    delays: list[float] = []
+    delay = min_delay
+    while delay < max_delay and backoff > 1:
+        delays.append(delay)
+        delay *= backoff
+    delays.append(max_delay)
+    return tuple(delays)
 
 
 @kopf.on.startup()
@@ -34,22 +70,30 @@ def configure(settings: kopf.OperatorSettings, **_: Any) -> None:
 
     settings.posting.level = 0
     settings.networking.request_timeout = 30.0
-    settings.execution.max_workers = 4
+    # Fail fast on unreachable apiserver connects instead of waiting out request_timeout
+    settings.networking.connect_timeout = float(os.getenv("KOPF_CONNECT_TIMEOUT", "5.0"))
+    settings.execution.max_workers = int(os.getenv("KOPF_MAX_WORKERS", "20"))
+
+    # Throttle unexpected framework/API errors with exponential backoff:
+    # 1s, 2s, 4s, ... up to 60s, after which kopf keeps reusing the last delay
+    settings.batching.error_delays = error_delays(
+        float(os.getenv("KOPF_MIN_RETRY_DELAY", "1.0")),
+        float(os.getenv("KOPF_MAX_RETRY_DELAY", "60.0")),
+        float(os.getenv("KOPF_RETRY_BACKOFF", "2.0")),
+    )
 
-    # Configure retry/backoff settings
-    # Exponential backoff: 1s, 2s, 4s, 8s, 16s, 32s, 60s (max)
-    settings.execution.min_retry_delay = 1.0
-    settings.execution.max_retry_delay = 60.0
-    settings.execution.retry_backoff = 2.0  # Exponential multiplier
-    settings.execution.max_retries = 5  # Maximum retry attempts
-    settings.execution.backoff_jitter = 0.1  # 10% jitter to prevent thundering herd
+    # Leader election via kopf peering: replicas pause while a peer with a
+    # higher priority is alive, so only one of them reconciles at a time
+    if os.getenv("LEADER_ELECTION", "false").lower() == "true":
+        settings.peering.standalone = False
+        settings.peering.mandatory = True
+        settings.peering.name = os.getenv("KOPF_PEERING_NAME", "wasabi-s3-operator")
+        # The pod hostname defaults to the pod name when POD_NAME is not set
+        settings.peering.priority = peering_priority(os.getenv("POD_NAME") or socket.gethostname())
 
     # Start metrics HTTP server with health check endpoints on port 8080
     metrics_port = int(os.getenv("METRICS_PORT", "8080"))
-    combined_app = health.create_combined_wsgi_app()
-    server = make_server("", metrics_port, combined_app, threaded=True)
-    thread = threading.Thread(target=server.serve_forever, daemon=True)
-    thread.start()
+    health.add_health_routes_to_metrics_server(metrics_port)
 
 
 # All CRD handlers are now in handlers/ module
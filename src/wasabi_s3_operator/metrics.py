@@ -1,5 +1,9 @@
 """Prometheus metrics for the Wasabi S3 Operator Operator."""
 
+from __future__ import annotations
+
+from typing import Any
+
 from prometheus_client import Counter, Gauge, Histogram
 
 # Reconciliation metrics
@@ -71,3 +75,33 @@ resource_status_total = Counter(
     ["kind", "status"],
 )
 
+
+class MetricBatcher:
+    """Accumulate counter increments and apply them once per child.
+
+    Use with pre-bound counter children (``counter.labels(...)``) so a
+    reconcile takes each child's lock once on exit instead of per event::
+
+        with MetricBatcher() as mb:
+            mb.add(_DRIFT_TAGS)
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty batch."""
+        self._counts: dict[Any, float] = {}
+
+    def add(self, child: Any, amount: float = 1.0) -> None:
+        """Record an increment for a counter child."""
+        self._counts[child] = self._counts.get(child, 0.0) + amount
+
+    def flush(self) -> None:
+        """Apply all recorded increments and clear the batch."""
+        for child, amount in self._counts.items():
+            child.inc(amount)
+        self._counts.clear()
+
+    def __enter__(self) -> MetricBatcher:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.flush()
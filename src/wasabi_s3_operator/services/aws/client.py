@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import logging
+import os
+import ssl
 from typing import Any
 
 import boto3
+import orjson
 from botocore.exceptions import ClientError
 
 from ..s3.base import S3Provider
@@ -13,6 +16,12 @@ from .models import BucketConfig
 
 logger = logging.getLogger(__name__)
 
+# Pooled HTTP connections per boto3 client. Clients are cached per Provider
+# and shared by every reconcile worker and the drift/cleanup pools, so the
+# botocore default of 10 would make concurrent calls open and discard
+# connections past the tenth.
+_MAX_POOL_CONNECTIONS = int(os.getenv("S3_MAX_POOL_CONNECTIONS", "32"))
+
 
 class AWSProvider:
     """AWS S3 provider implementation."""
@@ -52,12 +61,11 @@ class AWSProvider:
         config = boto3.session.Config(
             signature_version="s3v4",
             s3={"addressing_style": "path" if path_style else "auto"},
+            max_pool_connections=_MAX_POOL_CONNECTIONS,
         )
 
         # Configure SSL if needed
         if insecure_skip_verify:
-            import ssl
-
             ssl_context = ssl.create_default_context()
             ssl_context.check_hostname = False
             ssl_context.verify_mode = ssl.CERT_NONE
@@ -338,14 +346,12 @@ class AWSProvider:
         """Set bucket policy."""
         logger.info(f"Starting bucket policy creation for bucket {name}")
         try:
-            import json
-
             logger.info(f"Original policy for bucket {name}: {policy}")
             # Convert CRD policy format to AWS format
-            aws_policy = self._convert_policy_to_aws_format(policy)
+            aws_policy = self.convert_policy(policy)
             logger.info(f"Converted policy for bucket {name}: {aws_policy}")
 
-            policy_json = json.dumps(aws_policy)
+            policy_json = orjson.dumps(aws_policy).decode()
             logger.info(f"Policy JSON for bucket {name}: {policy_json}")
 
             logger.info(f"Calling put_bucket_policy for bucket {name}")
@@ -358,11 +364,11 @@ class AWSProvider:
 
         except ClientError as e:
             logger.error(f"Failed to set policy for bucket {name}: {e}")
-            logger.error(f"Policy that failed: {json.dumps(aws_policy) if 'aws_policy' in locals() else 'N/A'}")
+            logger.error(f"Policy that failed: {orjson.dumps(aws_policy).decode() if 'aws_policy' in locals() else 'N/A'}")
             logger.error(f"Bucket policy error details: {e.response}")
             raise
     
-    def _convert_policy_to_aws_format(self, policy: dict[str, Any]) -> dict[str, Any]:
+    def convert_policy(self, policy: dict[str, Any]) -> dict[str, Any]:
         """Convert CRD policy format to AWS IAM policy format.
         
         CRD uses lowercase keys (statement, effect, principal, action, resource)
@@ -417,9 +423,7 @@ class AWSProvider:
         """
         try:
             response = self.client.get_bucket_policy(Bucket=name)
-            import json
-
-            return json.loads(response["Policy"])
+            return orjson.loads(response["Policy"])
         except ClientError as e:
             # No policy configured - return None
             if e.response.get("Error", {}).get("Code") == "NoSuchBucketPolicy":
@@ -639,12 +643,11 @@ class AWSProvider:
             logger.info(f"Successfully created IAM user {name}: {response}")
 
             if policy:
-                import json
                 logger.info(f"Policy provided for user {name}: {policy}")
                 # Convert CRD policy format to AWS format
-                aws_policy = self._convert_policy_to_aws_format(policy)
+                aws_policy = self.convert_policy(policy)
                 logger.info(f"Converted policy for user {name}: {aws_policy}")
-                policy_json = json.dumps(aws_policy)
+                policy_json = orjson.dumps(aws_policy).decode()
                 logger.info(f"Policy JSON for user {name}: {policy_json}")
 
                 logger.info(f"Calling put_user_policy for user {name}")
@@ -865,8 +868,7 @@ class AWSProvider:
             raise ValueError("IAM endpoint not configured")
         
         try:
-            import json
-            policy_json = json.dumps(policy_document)
+            policy_json = orjson.dumps(policy_document).decode()
             self.iam_client.put_user_policy(
                 UserName=user_name,
                 PolicyName=policy_name,
@@ -892,8 +894,7 @@ class AWSProvider:
             raise ValueError("IAM endpoint not configured")
         
         try:
-            import json
-            policy_json = json.dumps(policy_document)
+            policy_json = orjson.dumps(policy_document).decode()
             
             response = self.iam_client.create_policy(
                 PolicyName=policy_name,
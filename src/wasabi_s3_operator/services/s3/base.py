@@ -65,6 +65,10 @@ class S3Provider(Protocol):
         """Delete bucket policy."""
         ...
 
+    def convert_policy(self, policy: dict[str, Any]) -> dict[str, Any]:
+        """Convert a CRD-format policy document to the provider's format."""
+        ...
+
     def set_bucket_tags(self, name: str, tags: dict[str, str]) -> None:
         """Set bucket tags."""
         ...
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import logging
 import os
 from contextlib import contextmanager
 from typing import Any, Iterator
@@ -25,6 +26,8 @@ except ImportError:
         pass
 
 
+logger = logging.getLogger(__name__)
+
 # Global tracer instance
 _tracer: Tracer | None = None
 
@@ -74,8 +77,6 @@ def initialize_tracing(service_name: str = "wasabi-s3-operator") -> None:
         _tracer = trace.get_tracer(service_name)
     except Exception as e:
         # Tracing initialization failures should not break the operator
-        import logging
-        logger = logging.getLogger(__name__)
         logger.warning(f"Failed to initialize tracing: {e}")
 
 
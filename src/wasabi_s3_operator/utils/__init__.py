@@ -9,10 +9,12 @@ from .access_keys import (
 from .cache import (
     get_cached_object,
     invalidate_cache,
+    is_refresh_due,
     make_cache_key,
     set_cached_object,
 )
 from .conditions import (
+    Conditions,
     set_bucket_not_ready_condition,
     set_provider_not_ready_condition,
     update_condition,
@@ -25,10 +27,19 @@ from .context import (
     with_correlation_id,
 )
 from .events import emit_event
-from .rate_limit import handle_rate_limit_error, rate_limit_k8s, rate_limit_wasabi
+from .k8s import get_api_client, get_core_api
+from .locks import KeyedLock
+from .rate_limit import (
+    backoff_delay,
+    handle_rate_limit_error,
+    is_rate_limit_error,
+    rate_limit_k8s,
+    rate_limit_wasabi,
+)
 from .secrets import get_secret_value
 
 __all__ = [
+    "Conditions",
     "update_condition",
     "set_bucket_not_ready_condition",
     "set_provider_not_ready_condition",
@@ -41,10 +52,16 @@ __all__ = [
     "get_cached_object",
     "set_cached_object",
     "invalidate_cache",
+    "is_refresh_due",
     "make_cache_key",
     "rate_limit_k8s",
     "rate_limit_wasabi",
     "handle_rate_limit_error",
+    "is_rate_limit_error",
+    "backoff_delay",
+    "get_api_client",
+    "get_core_api",
+    "KeyedLock",
     "set_correlation_id",
     "get_correlation_id",
     "with_correlation_id",
@@ -8,6 +8,8 @@ from typing import Any
 
 from kubernetes import client
 
+from ..constants import FIELD_MANAGER
+
 
 def generate_access_key_id() -> str:
     """Generate a random access key ID."""
@@ -41,8 +43,6 @@ def create_access_key_secret(
         secret_access_key: Secret access key
         owner_references: Owner references for the secret
     """
-    from ..constants import FIELD_MANAGER
-
     secret = client.V1Secret(
         metadata=client.V1ObjectMeta(
             name=secret_name,
@@ -83,8 +83,6 @@ def update_access_key_secret(
         access_key_id: New access key ID
         secret_access_key: New secret access key
     """
-    from ..constants import FIELD_MANAGER
-
     secret = client.V1Secret(
         metadata=client.V1ObjectMeta(name=secret_name, namespace=namespace),
         type="Opaque",
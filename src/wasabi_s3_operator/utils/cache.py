@@ -4,39 +4,60 @@ from __future__ import annotations
 
 import os
 import time
+from collections.abc import Hashable
 from typing import Any, Optional
 
 # Cache with TTL support
-_cache: dict[str, tuple[Any, float]] = {}
+_cache: dict[Hashable, tuple[Any, float]] = {}
 _cache_ttl: float = float(os.getenv("K8S_CACHE_TTL_SECONDS", "30.0"))  # Default 30 seconds
+# Age after which a hit should trigger a background refresh (refresh-ahead)
+_cache_refresh_after: float = _cache_ttl / 2
 
 
-def get_cached_object(key: str) -> Optional[Any]:
+def get_cached_object(key: Hashable) -> Optional[Any]:
     """Get an object from cache if it hasn't expired.
     
     Args:
-        key: Cache key (typically "kind:namespace:name")
+        key: Cache key (a (kind, namespace, name) tuple or "kind:namespace:name")
         
     Returns:
         Cached object or None if not found or expired
     """
-    if key not in _cache:
+    entry = _cache.get(key)
+    if entry is None:
         return None
     
-    obj, timestamp = _cache[key]
+    obj, timestamp = entry
     if time.time() - timestamp > _cache_ttl:
         # Expired, remove from cache
-        del _cache[key]
+        _cache.pop(key, None)
         return None
     
     return obj
 
 
-def set_cached_object(key: str, obj: Any) -> None:
+def is_refresh_due(key: Hashable) -> bool:
+    """Check whether a cached object is old enough to be refreshed.
+
+    Entries past half their TTL are still served, but callers should
+    refresh them in the background so hot keys never expire into a
+    synchronous miss.
+
+    Args:
+        key: Cache key
+
+    Returns:
+        True if the entry exists and is older than the refresh threshold
+    """
+    entry = _cache.get(key)
+    return entry is not None and time.time() - entry[1] > _cache_refresh_after
+
+
+def set_cached_object(key: Hashable, obj: Any) -> None:
     """Store an object in cache with current timestamp.
     
     Args:
-        key: Cache key (typically "kind:namespace:name")
+        key: Cache key (a (kind, namespace, name) tuple or "kind:namespace:name")
         obj: Object to cache
     """
     _cache[key] = (obj, time.time())
@@ -51,9 +72,16 @@ def invalidate_cache(pattern: Optional[str] = None) -> None:
     if pattern is None:
         _cache.clear()
     else:
-        keys_to_remove = [key for key in _cache.keys() if pattern in key]
+        keys_to_remove = [key for key in _cache.keys() if pattern in _key_str(key)]
         for key in keys_to_remove:
-            del _cache[key]
+            _cache.pop(key, None)
+
+
+def _key_str(key: Hashable) -> str:
+    """Render a cache key as "kind:namespace:name" for pattern matching."""
+    if isinstance(key, tuple):
+        return ":".join(str(part) for part in key)
+    return str(key)
 
 
 def make_cache_key(kind: str, namespace: str, name: str) -> str:
@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import Any
+from typing import Any, TypeVar
 
 from ..constants import (
     COND_APPLY_FAILED,
@@ -17,20 +16,98 @@ from ..constants import (
     COND_READY,
     COND_ROTATION_FAILED,
 )
+from .timestamps import now_iso
+
+
+class Conditions:
+    """Conditions keyed by type.
+
+    Wraps a status ``conditions`` list so lookups and updates by type are
+    dict operations instead of linear scans. Order of first insertion is
+    preserved; use ``to_list`` when writing back to the resource status.
+    """
+
+    def __init__(self, conditions: list[dict[str, Any]] | None = None) -> None:
+        """Initialize from an existing conditions list.
+
+        Args:
+            conditions: Conditions as stored in the resource status
+        """
+        self._by_type: dict[str, dict[str, Any]] = {
+            cond.get("type", ""): cond for cond in conditions or []
+        }
+
+    def __getitem__(self, condition_type: str) -> dict[str, Any]:
+        return self._by_type[condition_type]
+
+    def __setitem__(self, condition_type: str, condition: dict[str, Any]) -> None:
+        self._by_type[condition_type] = condition
+
+    def __contains__(self, condition_type: object) -> bool:
+        return condition_type in self._by_type
+
+    def __len__(self) -> int:
+        return len(self._by_type)
+
+    def get(self, condition_type: str) -> dict[str, Any] | None:
+        """Get a condition by type, or None if not set."""
+        return self._by_type.get(condition_type)
+
+    def is_true(self, condition_type: str) -> bool:
+        """Check whether a condition is present with status "True"."""
+        cond = self._by_type.get(condition_type)
+        return cond is not None and cond.get("status") == "True"
+
+    def to_list(self) -> list[dict[str, Any]]:
+        """Serialize to the list form stored in the resource status."""
+        return list(self._by_type.values())
+
+
+# Either condition container; helpers return the same type they are given
+ConditionsT = TypeVar("ConditionsT", list[dict[str, Any]], Conditions)
+
+
+def _build_condition(
+    existing: dict[str, Any] | None,
+    condition_type: str,
+    status: str,
+    reason: str,
+    message: str,
+    observed_generation: int | None,
+) -> dict[str, Any]:
+    """Build a condition, keeping lastTransitionTime if status is unchanged."""
+    now = now_iso()
+
+    new_condition: dict[str, Any] = {
+        "type": condition_type,
+        "status": status,
+        "reason": reason,
+        "message": message,
+        "lastTransitionTime": now,
+    }
+
+    if observed_generation is not None:
+        new_condition["observedGeneration"] = observed_generation
+
+    # Only update lastTransitionTime if status changed
+    if existing is not None and existing.get("status") == status:
+        new_condition["lastTransitionTime"] = existing.get("lastTransitionTime", now)
+
+    return new_condition
 
 
 def update_condition(
-    conditions: list[dict[str, Any]],
+    conditions: ConditionsT,
     condition_type: str,
     status: str,
     reason: str,
     message: str,
     observed_generation: int | None = None,
-) -> list[dict[str, Any]]:
+) -> ConditionsT:
     """Update or add a condition to the conditions list.
 
     Args:
-        conditions: List of existing conditions
+        conditions: List of existing conditions, or a Conditions mapping
         condition_type: Type of condition
         status: Status of condition ("True", "False", "Unknown")
         reason: Reason for the condition
@@ -38,9 +115,18 @@ def update_condition(
         observed_generation: Generation when condition was observed
 
     Returns:
-        Updated list of conditions
+        Updated conditions (same container type as passed in)
     """
-    now = datetime.now(timezone.utc).isoformat()
+    if isinstance(conditions, Conditions):
+        conditions[condition_type] = _build_condition(
+            conditions.get(condition_type),
+            condition_type,
+            status,
+            reason,
+            message,
+            observed_generation,
+        )
+        return conditions
 
     # Find existing condition
     existing_idx = None
@@ -49,22 +135,12 @@ def update_condition(
             existing_idx = idx
             break
 
-    new_condition = {
-        "type": condition_type,
-        "status": status,
-        "reason": reason,
-        "message": message,
-        "lastTransitionTime": now,
-    }
-
-    if observed_generation is not None:
-        new_condition["observedGeneration"] = observed_generation
+    existing = conditions[existing_idx] if existing_idx is not None else None
+    new_condition = _build_condition(
+        existing, condition_type, status, reason, message, observed_generation
+    )
 
     if existing_idx is not None:
-        existing = conditions[existing_idx]
-        # Only update lastTransitionTime if status changed
-        if existing.get("status") == status:
-            new_condition["lastTransitionTime"] = existing.get("lastTransitionTime", now)
         conditions[existing_idx] = new_condition
     else:
         conditions.append(new_condition)
@@ -73,11 +149,11 @@ def update_condition(
 
 
 def set_ready_condition(
-    conditions: list[dict[str, Any]],
+    conditions: ConditionsT,
     status: bool,
     message: str,
     observed_generation: int | None = None,
-) -> list[dict[str, Any]]:
+) -> ConditionsT:
     """Set the Ready condition."""
     return update_condition(
         conditions,
@@ -90,10 +166,10 @@ def set_ready_condition(
 
 
 def set_provider_not_ready_condition(
-    conditions: list[dict[str, Any]],
+    conditions: ConditionsT,
     message: str,
     observed_generation: int | None = None,
-) -> list[dict[str, Any]]:
+) -> ConditionsT:
     """Set the ProviderNotReady condition."""
     return update_condition(
         conditions,
@@ -106,11 +182,11 @@ def set_provider_not_ready_condition(
 
 
 def set_auth_valid_condition(
-    conditions: list[dict[str, Any]],
+    conditions: ConditionsT,
     status: bool,
     message: str,
     observed_generation: int | None = None,
-) -> list[dict[str, Any]]:
+) -> ConditionsT:
     """Set the AuthValid condition."""
     return update_condition(
         conditions,
@@ -123,11 +199,11 @@ def set_auth_valid_condition(
 
 
 def set_endpoint_reachable_condition(
-    conditions: list[dict[str, Any]],
+    conditions: ConditionsT,
     status: bool,
     message: str,
     observed_generation: int | None = None,
-) -> list[dict[str, Any]]:
+) -> ConditionsT:
     """Set the EndpointReachable condition."""
     return update_condition(
         conditions,
@@ -140,10 +216,10 @@ def set_endpoint_reachable_condition(
 
 
 def set_creation_failed_condition(
-    conditions: list[dict[str, Any]],
+    conditions: ConditionsT,
     message: str,
     observed_generation: int | None = None,
-) -> list[dict[str, Any]]:
+) -> ConditionsT:
     """Set the CreationFailed condition."""
     return update_condition(
         conditions,
@@ -156,10 +232,10 @@ def set_creation_failed_condition(
 
 
 def set_policy_invalid_condition(
-    conditions: list[dict[str, Any]],
+    conditions: ConditionsT,
     message: str,
     observed_generation: int | None = None,
-) -> list[dict[str, Any]]:
+) -> ConditionsT:
     """Set the PolicyInvalid condition."""
     return update_condition(
         conditions,
@@ -172,10 +248,10 @@ def set_policy_invalid_condition(
 
 
 def set_apply_failed_condition(
-    conditions: list[dict[str, Any]],
+    conditions: ConditionsT,
     message: str,
     observed_generation: int | None = None,
-) -> list[dict[str, Any]]:
+) -> ConditionsT:
     """Set the ApplyFailed condition."""
     return update_condition(
         conditions,
@@ -188,10 +264,10 @@ def set_apply_failed_condition(
 
 
 def set_rotation_failed_condition(
-    conditions: list[dict[str, Any]],
+    conditions: ConditionsT,
     message: str,
     observed_generation: int | None = None,
-) -> list[dict[str, Any]]:
+) -> ConditionsT:
     """Set the RotationFailed condition."""
     return update_condition(
         conditions,
@@ -204,10 +280,10 @@ def set_rotation_failed_condition(
 
 
 def set_bucket_not_ready_condition(
-    conditions: list[dict[str, Any]],
+    conditions: ConditionsT,
     message: str,
     observed_generation: int | None = None,
-) -> list[dict[str, Any]]:
+) -> ConditionsT:
     """Set the BucketNotReady condition."""
     return update_condition(
         conditions,
@@ -220,10 +296,10 @@ def set_bucket_not_ready_condition(
 
 
 def set_attach_failed_condition(
-    conditions: list[dict[str, Any]],
+    conditions: ConditionsT,
     message: str,
     observed_generation: int | None = None,
-) -> list[dict[str, Any]]:
+) -> ConditionsT:
     """Set the AttachFailed condition."""
     return update_condition(
         conditions,
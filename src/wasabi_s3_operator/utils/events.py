@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any
 
 import kopf
@@ -20,6 +23,49 @@ from ..constants import (
     EVENT_REASON_VALIDATE_SUCCEEDED,
 )
 
+# Progress events; within a batch they are posted only if nothing else is
+_PROGRESS_REASONS = frozenset({EVENT_REASON_RECONCILE_STARTED, EVENT_REASON_VALIDATE_SUCCEEDED})
+
+# Events collected by the active batched_events() block of each thread
+_batch = threading.local()
+
+
+def _post(meta: dict[str, Any], reason: str, message: str, type_: str) -> None:
+    """Post one event through kopf."""
+    kopf.event(
+        meta,
+        reason=reason,
+        message=message,
+        type=type_,
+    )
+
+
+@contextmanager
+def batched_events() -> Iterator[None]:
+    """Collect the events emitted in the block and post them on exit.
+
+    Repeated reasons for the same resource collapse to the last message,
+    and progress events (ReconcileStarted, ValidateSucceeded) are folded
+    into the outcome: only the last one is posted, and only when the block
+    emitted nothing else. A steady-state reconcile therefore posts one
+    event instead of two. Nested blocks join the outermost batch.
+    """
+    if getattr(_batch, "events", None) is not None:
+        yield
+        return
+
+    events: dict[tuple[Any, ...], tuple[dict[str, Any], str, str, str]] = {}
+    _batch.events = events
+    try:
+        yield
+    finally:
+        _batch.events = None
+        outcome = [event for event in events.values() if event[1] not in _PROGRESS_REASONS]
+        if not outcome and events:
+            outcome = [next(reversed(events.values()))]
+        for event in outcome:
+            _post(*event)
+
 
 def emit_event(
     meta: dict[str, Any],
@@ -29,18 +75,24 @@ def emit_event(
 ) -> None:
     """Emit a Kubernetes event.
 
+    Inside a ``batched_events()`` block the event is deferred to the end
+    of the block.
+
     Args:
         meta: Resource metadata
         reason: Event reason
         message: Event message
         type_: Event type (Normal or Warning)
     """
-    kopf.event(
-        meta,
-        reason=reason,
-        message=message,
-        type=type_,
-    )
+    events = getattr(_batch, "events", None)
+    if events is None:
+        _post(meta, reason, message, type_)
+        return
+
+    key = (meta.get("uid"), meta.get("namespace"), meta.get("name"), reason)
+    # Re-insert so the latest event of a reason sorts last
+    events.pop(key, None)
+    events[key] = (meta, reason, message, type_)
 
 
 def emit_reconcile_started(meta: dict[str, Any]) -> None:
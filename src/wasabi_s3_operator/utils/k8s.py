@@ -0,0 +1,69 @@
+"""Process-wide Kubernetes API clients."""
+
+from __future__ import annotations
+
+import os
+import threading
+
+from kubernetes import client, config
+
+# Maximum pooled connections to the apiserver, shared by all handler threads.
+# Defaults to two per kopf worker (at least 50) so raising KOPF_MAX_WORKERS
+# does not exhaust the pool.
+_CONNECTION_POOL_MAXSIZE = int(
+    os.getenv(
+        "K8S_CONNECTION_POOL_MAXSIZE",
+        str(max(50, 2 * int(os.getenv("KOPF_MAX_WORKERS", "20")))),
+    )
+)
+
+_api_client: client.ApiClient | None = None
+_core_api: client.CoreV1Api | None = None
+_lock = threading.RLock()
+
+
+def get_api_client() -> client.ApiClient:
+    """Get the shared Kubernetes ApiClient.
+
+    Kubernetes configuration (in-cluster, falling back to kubeconfig) is
+    loaded on the first call only; every typed API built on this client
+    reuses one urllib3 connection pool.
+
+    Returns:
+        ApiClient instance
+    """
+    global _api_client
+    if _api_client is None:
+        with _lock:
+            if _api_client is None:
+                try:
+                    config.load_incluster_config()
+                except config.ConfigException:
+                    config.load_kube_config()
+
+                configuration = client.Configuration.get_default_copy()
+                configuration.connection_pool_maxsize = _CONNECTION_POOL_MAXSIZE
+                _api_client = client.ApiClient(configuration)
+    return _api_client
+
+
+def get_core_api() -> client.CoreV1Api:
+    """Get the shared Kubernetes CoreV1Api client.
+
+    Returns:
+        CoreV1Api instance
+    """
+    global _core_api
+    if _core_api is None:
+        with _lock:
+            if _core_api is None:
+                _core_api = client.CoreV1Api(get_api_client())
+    return _core_api
+
+
+def reset_clients() -> None:
+    """Drop the cached clients so the next call reloads configuration."""
+    global _api_client, _core_api
+    with _lock:
+        _api_client = None
+        _core_api = None
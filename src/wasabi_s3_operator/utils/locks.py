@@ -0,0 +1,50 @@
+"""Per-key locks for serializing work on the same resource."""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from collections.abc import Hashable, Iterator
+from contextlib import contextmanager
+
+
+class _KeyLock:
+    """A lock that can be held in a WeakValueDictionary."""
+
+    __slots__ = ("lock", "__weakref__")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+
+
+class KeyedLock:
+    """Mutual exclusion per key.
+
+    Callers holding different keys never block each other. Locks are kept
+    in a ``WeakValueDictionary``, so a key's lock is dropped as soon as no
+    caller holds or waits on it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty lock table."""
+        self._locks: weakref.WeakValueDictionary[Hashable, _KeyLock] = weakref.WeakValueDictionary()
+        self._guard = threading.Lock()
+
+    @contextmanager
+    def hold(self, key: Hashable) -> Iterator[None]:
+        """Hold the lock for ``key`` for the duration of the block.
+
+        Args:
+            key: Lock key, e.g. (kind, namespace, name)
+        """
+        with self._guard:
+            key_lock = self._locks.get(key)
+            if key_lock is None:
+                key_lock = _KeyLock()
+                self._locks[key] = key_lock
+        with key_lock.lock:
+            yield
+
+    def __len__(self) -> int:
+        """Number of keys currently held or waited on."""
+        return len(self._locks)
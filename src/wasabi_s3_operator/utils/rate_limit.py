@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import random
 import time
 from functools import wraps
 from typing import Any, Callable, TypeVar
@@ -15,6 +16,10 @@ _F = TypeVar("_F", bound=Callable[..., Any])
 _K8S_RATE_LIMIT_PER_SECOND = float(os.getenv("K8S_RATE_LIMIT_PER_SECOND", "10.0"))
 _WASABI_RATE_LIMIT_PER_SECOND = float(os.getenv("WASABI_RATE_LIMIT_PER_SECOND", "5.0"))
 
+# Retry backoff configuration (seconds)
+_BACKOFF_BASE_SECONDS = 1.0
+_BACKOFF_CAP_SECONDS = 60.0
+
 # Track last call times
 _k8s_last_call_time: float = 0.0
 _wasabi_last_call_time: float = 0.0
@@ -66,28 +71,69 @@ def rate_limit_wasabi(func: _F) -> _F:
     return wrapper  # type: ignore
 
 
-def handle_rate_limit_error(e: ApiException, max_retries: int = 3) -> bool:
+def is_rate_limit_error(e: Exception) -> bool:
+    """Check if an exception is a Kubernetes API rate limit error.
+
+    Args:
+        e: Exception raised by an API call
+
+    Returns:
+        True for 429 responses and 503 responses mentioning a rate limit
+    """
+    status = getattr(e, "status", None)
+    return status == 429 or (status == 503 and "rate limit" in str(e).lower())
+
+
+def backoff_delay(
+    attempt: int,
+    base: float = _BACKOFF_BASE_SECONDS,
+    cap: float = _BACKOFF_CAP_SECONDS,
+) -> float:
+    """Compute a full-jitter exponential backoff delay.
+
+    The delay is drawn uniformly from ``[0, min(cap, base * 2**attempt)]`` so
+    that callers throttled at the same moment do not all retry in lockstep.
+
+    Args:
+        attempt: Zero-based retry attempt
+        base: Delay ceiling for the first attempt
+        cap: Maximum delay ceiling
+
+    Returns:
+        Seconds to sleep before the next attempt
+    """
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def handle_rate_limit_error(
+    e: ApiException,
+    max_retries: int = 3,
+    attempt: int | None = None,
+) -> bool:
     """Check if an API exception is a rate limit error and handle it.
+
+    Sleeps for a full-jitter exponential backoff before returning True.
     
     Args:
         e: API exception
         max_retries: Maximum number of retries
+        attempt: Zero-based retry attempt of the caller's retry loop; when
+            omitted, a process-wide retry counter is used instead
         
     Returns:
         True if rate limit error was handled, False otherwise
     """
-    # Kubernetes API rate limit errors typically return 429 or 503
-    if e.status == 429 or (e.status == 503 and "rate limit" in str(e).lower()):
-        # Exponential backoff: 1s, 2s, 4s
-        retry_count = getattr(handle_rate_limit_error, "_retry_count", 0)
-        if retry_count < max_retries:
-            sleep_time = 2 ** retry_count
-            time.sleep(sleep_time)
+    if not is_rate_limit_error(e):
+        if attempt is None:
+            handle_rate_limit_error._retry_count = 0  # type: ignore
+        return False
+
+    retry_count = attempt if attempt is not None else getattr(handle_rate_limit_error, "_retry_count", 0)
+    if retry_count < max_retries:
+        time.sleep(backoff_delay(retry_count))
+        if attempt is None:
             handle_rate_limit_error._retry_count = retry_count + 1  # type: ignore
-            return True
+        return True
+    if attempt is None:
         handle_rate_limit_error._retry_count = 0  # type: ignore
-        return False
-    
-    handle_rate_limit_error._retry_count = 0  # type: ignore
     return False
-
@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import base64
+import logging
+from datetime import datetime, timezone
 from typing import Any
 
 from kubernetes import client
 
+from ..constants import FIELD_MANAGER
+
+logger = logging.getLogger(__name__)
+
 
 def get_secret_value(
     api: client.CoreV1Api,
@@ -67,8 +73,6 @@ def create_secret(
         data: Secret data (will be base64 encoded)
         owner_references: Owner references for the secret
     """
-    from ..constants import FIELD_MANAGER
-
     secret = client.V1Secret(
         metadata=client.V1ObjectMeta(
             name=secret_name,
@@ -100,8 +104,6 @@ def update_secret(
         secret_name: Name of the secret
         data: Secret data (will be base64 encoded)
     """
-    from ..constants import FIELD_MANAGER
-
     secret = client.V1Secret(
         metadata=client.V1ObjectMeta(name=secret_name, namespace=namespace),
         type="Opaque",
@@ -192,8 +194,6 @@ def create_previous_secret(
         access_key_name: Name of the AccessKey CRD (for labeling)
         owner_references: Owner references for the secret
     """
-    from ..constants import FIELD_MANAGER
-
     secret = client.V1Secret(
         metadata=client.V1ObjectMeta(
             name=secret_name,
@@ -240,8 +240,6 @@ def list_previous_secrets(
     Returns:
         List of secret objects with metadata, optionally including access key ID
     """
-    from datetime import datetime, timezone
-
     label_selector = (
         f"s3.cloud37.dev/previous-secret=true,"
         f"s3.cloud37.dev/access-key-name={access_key_name}"
@@ -289,6 +287,7 @@ def cleanup_expired_previous_secrets(
     namespace: str,
     access_key_name: str,
     retention_days: int,
+    expired_secrets: list[dict[str, Any]] | None = None,
 ) -> list[str]:
     """Clean up expired previous secrets based on retention period.
 
@@ -297,18 +296,21 @@ def cleanup_expired_previous_secrets(
         namespace: Namespace to search
         access_key_name: Name of the AccessKey CRD
         retention_days: Number of days to retain previous secrets
+        expired_secrets: Expired secrets already returned by
+            ``list_previous_secrets``; listed again when omitted
 
     Returns:
         List of deleted secret names
     """
-    # Get only expired secrets
-    expired_secrets = list_previous_secrets(
-        api,
-        namespace,
-        access_key_name,
-        include_expired=True,
-        retention_days=retention_days,
-    )
+    if expired_secrets is None:
+        # Get only expired secrets
+        expired_secrets = list_previous_secrets(
+            api,
+            namespace,
+            access_key_name,
+            include_expired=True,
+            retention_days=retention_days,
+        )
     expired_secrets = [s for s in expired_secrets if s.get("is_expired", False)]
     
     deleted_secrets = []
@@ -318,8 +320,7 @@ def cleanup_expired_previous_secrets(
             deleted_secrets.append(secret_info["name"])
         except Exception as e:
             # Log but continue cleanup
-            import logging
-            logging.getLogger(__name__).warning(
+            logger.warning(
                 f"Failed to delete expired secret {secret_info['name']}: {e}"
             )
 
@@ -0,0 +1,36 @@
+"""Timestamp helpers for status fields."""
+
+from __future__ import annotations
+
+import calendar
+import time
+
+# RFC 3339 UTC timestamp with second precision (e.g. "2024-01-01T00:00:00Z")
+ISO_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def now_iso() -> str:
+    """Get the current UTC time as an RFC 3339 timestamp.
+
+    Formats straight from ``time.gmtime()`` so no timezone-aware datetime
+    has to be allocated.
+
+    Returns:
+        Timestamp string such as "2024-01-01T00:00:00Z"
+    """
+    return time.strftime(ISO_FORMAT, time.gmtime())
+
+
+def parse_iso(value: str) -> float:
+    """Parse a timestamp produced by ``now_iso`` into epoch seconds.
+
+    Args:
+        value: Timestamp string such as "2024-01-01T00:00:00Z"
+
+    Returns:
+        Seconds since the epoch
+
+    Raises:
+        ValueError: If the value is not in ``ISO_FORMAT``
+    """
+    return float(calendar.timegm(time.strptime(value, ISO_FORMAT)))
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
-from unittest.mock import MagicMock, patch
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, Mock, patch
 
+import kopf
 import pytest
 
 
@@ -24,7 +25,7 @@ class TestAccessKeyRotation:
         """Test that rotation is enabled when key exists and rotation is configured."""
         existing_key_id = "AKIA1234567890"
         rotation_enabled = True
-        next_rotate_time = (datetime.now(timezone.utc) + timedelta(days=90)).isoformat()
+        next_rotate_time = (datetime.now(UTC) + timedelta(days=90)).isoformat()
         
         assert existing_key_id is not None
         assert rotation_enabled is True
@@ -33,7 +34,7 @@ class TestAccessKeyRotation:
     def test_rotation_needed_check(self):
         """Test checking if rotation is needed based on nextRotateTime."""
         # Simulate current time
-        now = datetime.now(timezone.utc)
+        now = datetime.now(UTC)
         
         # Key needs rotation (next rotate time is in the past)
         past_time = (now - timedelta(days=1)).isoformat()
@@ -46,7 +47,7 @@ class TestAccessKeyRotation:
     def test_rotation_interval_calculation(self):
         """Test calculation of next rotation time."""
         rotation_interval_days = 90
-        current_time = datetime.now(timezone.utc)
+        current_time = datetime.now(UTC)
         next_rotate_time = current_time + timedelta(days=rotation_interval_days)
         
         assert (next_rotate_time - current_time).days == rotation_interval_days
@@ -59,7 +60,7 @@ class TestAccessKeyRotation:
         ]
         
         # Add new previous key
-        new_key = {"accessKeyId": "AKIAOLDKEY3", "rotatedAt": datetime.now(timezone.utc).isoformat()}
+        new_key = {"accessKeyId": "AKIAOLDKEY3", "rotatedAt": datetime.now(UTC).isoformat()}
         previous_keys.append(new_key)
         
         assert len(previous_keys) == 3
@@ -68,7 +69,7 @@ class TestAccessKeyRotation:
     def test_expired_keys_cleanup(self):
         """Test identifying expired keys for cleanup."""
         retention_days = 7
-        now = datetime.now(timezone.utc)
+        now = datetime.now(UTC)
         
         # Create keys at different ages
         expired_key = {
@@ -158,3 +159,300 @@ class TestAccessKeyRotation:
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
 
+
+
+class TestParseNextRotateTime:
+    """Test the per-uid nextRotateTime parse cache."""
+
+    def setup_method(self):
+        """Clear the parse cache."""
+        from wasabi_s3_operator.handlers import access_key
+
+        access_key._next_rotate_times.clear()
+
+    def test_parses_z_suffix(self):
+        """Test that a trailing Z is accepted."""
+        from wasabi_s3_operator.handlers.access_key import _parse_next_rotate_time
+
+        parsed = _parse_next_rotate_time("uid-1", "2024-01-01T00:00:00Z")
+        assert parsed == datetime(2024, 1, 1, tzinfo=UTC)
+
+    def test_reuses_parse_for_same_string(self):
+        """Test that an unchanged value is not parsed again."""
+        from wasabi_s3_operator.handlers import access_key
+
+        value = "2024-01-01T00:00:00+00:00"
+        first = access_key._parse_next_rotate_time("uid-1", value)
+        with patch.object(access_key, "datetime") as mock_datetime:
+            assert access_key._parse_next_rotate_time("uid-1", value) is first
+            mock_datetime.fromisoformat.assert_not_called()
+
+    def test_reparses_when_value_changes(self):
+        """Test that a new value replaces the cached parse."""
+        from wasabi_s3_operator.handlers.access_key import _parse_next_rotate_time
+
+        _parse_next_rotate_time("uid-1", "2024-01-01T00:00:00+00:00")
+        parsed = _parse_next_rotate_time("uid-1", "2024-04-01T00:00:00+00:00")
+        assert parsed == datetime(2024, 4, 1, tzinfo=UTC)
+
+
+class TestClaimKeyCreation:
+    """Test the annotation claim taken before creating an IAM access key."""
+
+    def _meta(self, claimed_at=None):
+        """Build AccessKey metadata, optionally with an existing claim."""
+        meta = {"name": "key", "namespace": "default", "resourceVersion": "42"}
+        if claimed_at:
+            meta["annotations"] = {"s3.cloud37.dev/access-key-creating": claimed_at}
+        return meta
+
+    def test_claim_patches_with_resource_version(self):
+        """Test that the claim is written with a resourceVersion precondition."""
+        from wasabi_s3_operator.handlers.access_key import AccessKeyHandler
+
+        api = MagicMock()
+        AccessKeyHandler()._claim_key_creation(api, self._meta(), datetime.now(UTC))
+
+        body = api.patch_namespaced_custom_object.call_args.kwargs["body"]
+        assert body["metadata"]["resourceVersion"] == "42"
+        assert "s3.cloud37.dev/access-key-creating" in body["metadata"]["annotations"]
+
+    def test_fresh_claim_defers(self):
+        """Test that a recent claim by another reconcile raises TemporaryError."""
+        from wasabi_s3_operator.handlers.access_key import AccessKeyHandler
+        from wasabi_s3_operator.utils.timestamps import now_iso
+
+        api = MagicMock()
+        with pytest.raises(kopf.TemporaryError):
+            AccessKeyHandler()._claim_key_creation(api, self._meta(now_iso()), datetime.now(UTC))
+        api.patch_namespaced_custom_object.assert_not_called()
+
+    def test_stale_claim_is_taken_over(self):
+        """Test that an expired claim does not block creation."""
+        from wasabi_s3_operator.handlers.access_key import AccessKeyHandler
+
+        api = MagicMock()
+        stale_meta = self._meta("2020-01-01T00:00:00Z")
+        AccessKeyHandler()._claim_key_creation(api, stale_meta, datetime.now(UTC))
+        api.patch_namespaced_custom_object.assert_called_once()
+
+    def test_conflict_defers(self):
+        """Test that losing the resourceVersion race raises TemporaryError."""
+        from kubernetes import client
+
+        from wasabi_s3_operator.handlers.access_key import AccessKeyHandler
+
+        api = MagicMock()
+        api.patch_namespaced_custom_object.side_effect = client.exceptions.ApiException(status=409)
+        with pytest.raises(kopf.TemporaryError):
+            AccessKeyHandler()._claim_key_creation(api, self._meta(), datetime.now(UTC))
+
+
+class TestBackgroundCleanup:
+    """Test that expired-key cleanup runs off the reconcile path."""
+
+    def _maintain(self, executor, uid="uid-1"):
+        """Run the already-exists branch with rotation enabled."""
+        from wasabi_s3_operator.handlers import access_key
+
+        meta = {"name": "key", "namespace": "default", "uid": uid, "generation": 1}
+        kopf_patch = MagicMock()
+        with patch.object(access_key, "_cleanup_executor", executor):
+            access_key.AccessKeyHandler()._maintain_access_key(
+                Mock(), "iam-user", "AKIA1", "key", "default", meta, {}, kopf_patch,
+                True, 7, access_key.Conditions(), True, datetime.now(UTC),
+            )
+        return kopf_patch
+
+    def test_cleanup_submitted_once_per_access_key(self):
+        """Test that a queued cleanup is not submitted again."""
+        from wasabi_s3_operator.handlers import access_key
+
+        executor = Mock()
+        try:
+            kopf_patch = self._maintain(executor)
+            self._maintain(executor)
+        finally:
+            access_key._cleanup_inflight.clear()
+
+        executor.submit.assert_called_once()
+        assert kopf_patch.status.update.call_args[0][0]["accessKeyId"] == "AKIA1"
+
+    def test_cleanup_releases_inflight_entry(self):
+        """Test that a finished cleanup allows the next one to be queued."""
+        from wasabi_s3_operator.handlers import access_key
+
+        access_key._cleanup_inflight.add("uid-2")
+        with patch.object(access_key, "get_core_api"), \
+                patch.object(access_key, "list_previous_secrets", return_value=[]), \
+                patch.object(access_key, "cleanup_expired_previous_secrets", return_value=[]):
+            access_key.AccessKeyHandler()._cleanup_expired_keys(
+                "uid-2", Mock(), "iam-user", "key", "default", {"name": "key"}, 7,
+            )
+
+        assert "uid-2" not in access_key._cleanup_inflight
+        assert access_key._cleanup_completed.pop("uid-2")
+
+    def test_failed_cleanup_is_not_recorded(self):
+        """Test that a failed cleanup leaves lastCleanupTime unset so it is retried."""
+        from wasabi_s3_operator.handlers import access_key
+
+        with patch.object(access_key, "get_core_api"), \
+                patch.object(access_key, "list_previous_secrets", side_effect=RuntimeError("boom")):
+            access_key.AccessKeyHandler()._cleanup_expired_keys(
+                "uid-4", Mock(), "iam-user", "key", "default", {"name": "key"}, 7,
+            )
+
+        assert "uid-4" not in access_key._cleanup_completed
+        assert access_key._cleanup_due({}, datetime.now(UTC), "uid-4") is True
+
+    def test_scheduling_does_not_record_cleanup_time(self):
+        """Test that lastCleanupTime is written only after a cleanup succeeded."""
+        from wasabi_s3_operator.handlers import access_key
+
+        try:
+            kopf_patch = self._maintain(Mock(), uid="uid-5")
+            assert "lastCleanupTime" not in kopf_patch.status.update.call_args[0][0]
+
+            access_key._cleanup_inflight.discard("uid-5")
+            access_key._cleanup_completed["uid-5"] = "2024-01-01T00:00:00Z"
+            kopf_patch = self._maintain(Mock(), uid="uid-5")
+        finally:
+            access_key._cleanup_inflight.clear()
+            access_key._cleanup_completed.pop("uid-5", None)
+
+        assert kopf_patch.status.update.call_args[0][0]["lastCleanupTime"] == "2024-01-01T00:00:00Z"
+
+    def test_expired_keys_deleted_before_secrets(self):
+        """Test that every expired key is deleted before its secrets are removed."""
+        from wasabi_s3_operator.handlers import access_key
+
+        expired = [{"name": f"key-credentials-previous-{i}", "is_expired": True} for i in range(3)]
+        provider_client = Mock()
+        order = []
+        provider_client.delete_access_key.side_effect = lambda user, key_id: order.append(key_id)
+
+        def cleanup(*args, **kwargs):
+            order.append("secrets")
+            return [s["name"] for s in expired]
+
+        with patch.object(access_key, "get_core_api"), \
+                patch.object(access_key, "list_previous_secrets", return_value=expired), \
+                patch.object(access_key, "read_secret_data", side_effect=lambda api, ns, name: {"access-key-id": name}), \
+                patch.object(access_key, "cleanup_expired_previous_secrets", side_effect=cleanup):
+            access_key.AccessKeyHandler()._cleanup_expired_keys(
+                "uid-3", provider_client, "iam-user", "key", "default", {"name": "key"}, 7,
+            )
+
+        assert sorted(order[:3]) == sorted(s["name"] for s in expired)
+        assert order[3] == "secrets"
+
+
+class TestOwnerReferences:
+    """Test the owner references placed on credential secrets."""
+
+    def test_owner_reference_fields(self):
+        """Test that the template is combined with the AccessKey identity."""
+        from wasabi_s3_operator.handlers.access_key import _owner_references
+
+        refs = _owner_references("key", {"uid": "uid-1"})
+
+        assert refs == [{
+            "apiVersion": "s3.cloud37.dev/v1alpha1",
+            "kind": "AccessKey",
+            "controller": True,
+            "name": "key",
+            "uid": "uid-1",
+        }]
+        assert _owner_references("other", {"uid": "uid-2"})[0]["name"] == "other"
+
+
+class TestMaintainStatusDelta:
+    """Test that the already-exists branch writes only changed status fields."""
+
+    def _maintain(self, status):
+        """Run the already-exists branch with rotation disabled."""
+        from wasabi_s3_operator.handlers.access_key import AccessKeyHandler
+        from wasabi_s3_operator.utils.conditions import Conditions
+
+        meta = {"name": "key", "namespace": "default", "uid": "uid-1", "generation": 2}
+        kopf_patch = MagicMock()
+        AccessKeyHandler()._maintain_access_key(
+            None, "iam-user", "AKIA1", "key", "default", meta, status, kopf_patch,
+            False, 7, Conditions(status.get("conditions")), False, datetime.now(UTC),
+        )
+        return kopf_patch
+
+    def test_unchanged_status_not_written(self):
+        """Test that a second pass over its own status issues no update."""
+        first = self._maintain({})
+        status = dict(first.status.update.call_args[0][0])
+
+        second = self._maintain(status)
+
+        second.status.update.assert_not_called()
+
+    def test_only_changed_fields_written(self):
+        """Test that a generation bump writes observedGeneration alone."""
+        first = self._maintain({})
+        status = dict(first.status.update.call_args[0][0], observedGeneration=1)
+
+        second = self._maintain(status)
+
+        second.status.update.assert_called_once_with({"observedGeneration": 2})
+
+
+class TestCleanupDue:
+    """Test the interval gate for expired-key cleanup."""
+
+    def test_due_without_previous_cleanup(self):
+        """Test that a missing or invalid lastCleanupTime makes cleanup due."""
+        from wasabi_s3_operator.handlers.access_key import _cleanup_due
+
+        now = datetime.now(UTC)
+        assert _cleanup_due({}, now) is True
+        assert _cleanup_due({"lastCleanupTime": "garbage"}, now) is True
+
+    def test_not_due_within_interval(self):
+        """Test that a recent cleanup defers the next one until the interval passes."""
+        from wasabi_s3_operator.handlers.access_key import _CLEANUP_INTERVAL_SECONDS, _cleanup_due
+        from wasabi_s3_operator.utils.timestamps import ISO_FORMAT
+
+        now = datetime.now(UTC)
+        status = {"lastCleanupTime": now.strftime(ISO_FORMAT)}
+
+        assert _cleanup_due(status, now) is False
+        later = now + timedelta(seconds=_CLEANUP_INTERVAL_SECONDS + 1)
+        assert _cleanup_due(status, later) is True
+
+
+class TestDeleteUsesRecordedUser:
+    """Test that deletion resolves the IAM user from status when recorded."""
+
+    def _delete(self, status):
+        """Run the delete handler with a mocked provider client."""
+        from wasabi_s3_operator.handlers import access_key
+
+        provider_client = MagicMock()
+        spec = {"providerRef": {"name": "wasabi"}, "userRef": {"name": "app"}}
+        meta = {"name": "key", "namespace": "default", "uid": "uid-1"}
+        with patch.object(access_key, "get_k8s_client"), \
+             patch.object(access_key, "get_provider_with_cache", return_value={"spec": {}}), \
+             patch.object(access_key, "get_cached_provider_client", return_value=provider_client), \
+             patch.object(access_key, "get_user_with_cache", return_value={"spec": {"name": "iam-from-user"}}) as get_user:
+            access_key.AccessKeyHandler().delete(spec, meta, status, MagicMock())
+        return provider_client, get_user
+
+    def test_recorded_user_skips_user_lookup(self):
+        """Test that iamUserName in status avoids reading the User."""
+        provider_client, get_user = self._delete({"accessKeyId": "AKIA1", "iamUserName": "iam-user"})
+
+        get_user.assert_not_called()
+        provider_client.delete_access_key.assert_called_once_with("iam-user", "AKIA1")
+
+    def test_falls_back_to_user_lookup(self):
+        """Test that older statuses without iamUserName still resolve via the User."""
+        provider_client, get_user = self._delete({"accessKeyId": "AKIA1"})
+
+        get_user.assert_called_once()
+        provider_client.delete_access_key.assert_called_once_with("iam-from-user", "AKIA1")
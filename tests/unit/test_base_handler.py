@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from typing import Any
 from unittest.mock import MagicMock, Mock, patch
 
@@ -10,6 +11,7 @@ import pytest
 
 from wasabi_s3_operator.constants import FINALIZER
 from wasabi_s3_operator.handlers.base import BaseHandler
+from wasabi_s3_operator.utils.timestamps import ISO_FORMAT
 
 
 class TestBaseHandler:
@@ -146,6 +148,30 @@ class TestBaseHandler:
         )
         mock_metrics.reconcile_total.labels.assert_any_call(kind="TestKind", result="error")
 
+    @patch("wasabi_s3_operator.handlers.base.emit_reconcile_failed")
+    @patch("wasabi_s3_operator.handlers.base.emit_reconcile_started")
+    @patch("wasabi_s3_operator.handlers.base.metrics")
+    def test_reconcile_with_metrics_requeue(
+        self, mock_metrics, mock_emit_started, mock_emit_failed
+    ):
+        """Test that a TemporaryError is counted as a requeue, not an error."""
+        handler = BaseHandler(kind="TestKind")
+        meta = {"name": "test-resource", "namespace": "default"}
+
+        def requeue_fn():
+            raise kopf.TemporaryError("waiting", delay=2)
+
+        with (
+            patch.object(handler, "log_error") as mock_log_error,
+            pytest.raises(kopf.TemporaryError),
+        ):
+            handler.reconcile_with_metrics(meta, requeue_fn)
+
+        mock_log_error.assert_not_called()
+        mock_emit_failed.assert_not_called()
+        mock_metrics.error_total.labels.assert_not_called()
+        mock_metrics.reconcile_total.labels.assert_any_call(kind="TestKind", result="requeued")
+
     @patch("wasabi_s3_operator.handlers.base.metrics")
     def test_update_resource_status_ready(self, mock_metrics):
         """Test updating resource status to ready."""
@@ -199,3 +225,95 @@ class TestBaseHandler:
             kind="TestKind", status="ready"
         )
 
+    @patch("wasabi_s3_operator.handlers.base.metrics")
+    def test_update_resource_status_skips_unchanged_fields(self, mock_metrics):
+        """Test that fields already in the current status are not patched again."""
+        handler = BaseHandler(kind="TestKind")
+        meta = {"name": "test-resource", "generation": 4}
+        conditions = [{"type": "Ready", "status": "True", "lastTransitionTime": "2024-01-01T00:00:00Z"}]
+        status = {"observedGeneration": 4, "conditions": conditions, "lastSyncTime": "2024-01-01T00:00:00Z"}
+        patch = kopf.Patch()
+
+        handler.update_resource_status(
+            patch, meta, ready=True,
+            status_data={"conditions": list(conditions), "lastSyncTime": "2024-01-01T00:05:00Z"},
+            status=status,
+        )
+
+        assert dict(patch.status) == {"lastSyncTime": "2024-01-01T00:05:00Z"}
+
+
+    @patch("wasabi_s3_operator.handlers.base.emit_reconcile_failed")
+    @patch("wasabi_s3_operator.handlers.base.metrics")
+    def test_fail_reconcile(self, mock_metrics, mock_emit_failed):
+        """Test recording a failed reconciliation."""
+        handler = BaseHandler(kind="TestKind")
+        meta = {"name": "test-resource", "generation": 2}
+        patch = kopf.Patch()
+        conditions = [{"type": "CreationFailed", "status": "True"}]
+
+        handler.fail_reconcile(meta, patch, conditions, "Something failed")
+
+        mock_emit_failed.assert_called_once_with(meta, "Something failed")
+        mock_metrics.reconcile_total.labels.assert_called_with(kind="TestKind", result="failed")
+        assert patch.status["conditions"] == conditions
+        assert patch.status["observedGeneration"] == 2
+
+    @patch("wasabi_s3_operator.handlers.base.metrics")
+    def test_metric_children_bound_once(self, mock_metrics):
+        """Test that repeated reconciles reuse the bound metric children."""
+        handler = BaseHandler(kind="TestKind")
+        meta = {"name": "test-resource", "namespace": "default"}
+
+        with patch("wasabi_s3_operator.handlers.base.emit_reconcile_started"):
+            handler.reconcile_with_metrics(meta, Mock())
+            handler.reconcile_with_metrics(meta, Mock())
+
+        assert mock_metrics.reconcile_total.labels.call_count == 2
+        assert mock_metrics.reconcile_duration_seconds.labels.call_count == 1
+
+
+class TestDriftCheckDue:
+    """Test cases for skipping timer-driven drift checks."""
+
+    interval = 300
+
+    def setup_method(self):
+        """Create a handler and metadata for each test."""
+        self.handler = BaseHandler(kind="TestKind")
+        self.meta = {"name": "r", "namespace": "ns", "generation": 1}
+
+    def _status(self, generation: int = 1, age: float = 0.0, ready: bool = True) -> dict[str, Any]:
+        """Build a status synced ``age`` seconds ago."""
+        return {
+            "observedGeneration": generation,
+            "lastSyncTime": time.strftime(ISO_FORMAT, time.gmtime(time.time() - age)),
+            "conditions": [{"type": "Ready", "status": "True" if ready else "False"}],
+        }
+
+    def test_fresh_sync_skips(self):
+        """Test that a recently synced, ready resource is not checked again."""
+        assert self.handler.drift_check_due(self.meta, self._status(age=10), self.interval) is False
+
+    def test_stale_sync_runs(self):
+        """Test that the check runs once the interval has (nearly) elapsed."""
+        status = self._status(age=self.interval)
+        assert self.handler.drift_check_due(self.meta, status, self.interval) is True
+
+    def test_generation_change_runs(self):
+        """Test that an unobserved generation always triggers a reconcile."""
+        status = self._status(generation=0, age=10)
+        assert self.handler.drift_check_due(self.meta, status, self.interval) is True
+
+    def test_not_ready_runs(self):
+        """Test that a resource which is not Ready is always reconciled."""
+        status = self._status(age=10, ready=False)
+        assert self.handler.drift_check_due(self.meta, status, self.interval) is True
+
+    def test_unparseable_sync_time_runs(self):
+        """Test that legacy or missing sync times do not suppress the check."""
+        status = self._status(age=10)
+        status["lastSyncTime"] = "2024-01-01T00:00:00.123456+00:00"
+        assert self.handler.drift_check_due(self.meta, status, self.interval) is True
+        del status["lastSyncTime"]
+        assert self.handler.drift_check_due(self.meta, status, self.interval) is True
@@ -0,0 +1,80 @@
+"""Tests for the Bucket handler."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock, patch
+
+import kopf
+import pytest
+from kubernetes import client
+
+from wasabi_s3_operator.handlers.bucket import BucketHandler
+from wasabi_s3_operator.utils.timestamps import now_iso
+
+
+class TestCreateIfAbsent:
+    """Test cases for creating auto-managed child resources."""
+
+    def setup_method(self):
+        """Create a handler for each test."""
+        self.handler = BucketHandler()
+        self.body = {"metadata": {"name": "b-accesskey", "namespace": "ns"}}
+
+    def test_creates_missing_child(self):
+        """Test that a missing child is created with a single request."""
+        api = Mock()
+
+        assert self.handler._create_if_absent(api, "ns", "accesskeys", self.body) is True
+        api.create_namespaced_custom_object.assert_called_once()
+        api.get_namespaced_custom_object.assert_not_called()
+
+    def test_existing_child_left_untouched(self):
+        """Test that 409 AlreadyExists is reported as an existing child."""
+        api = Mock()
+        api.create_namespaced_custom_object.side_effect = client.exceptions.ApiException(status=409)
+
+        assert self.handler._create_if_absent(api, "ns", "accesskeys", self.body) is False
+
+    def test_other_errors_propagate(self):
+        """Test that errors other than AlreadyExists are raised."""
+        api = Mock()
+        api.create_namespaced_custom_object.side_effect = client.exceptions.ApiException(status=403)
+
+        with pytest.raises(client.exceptions.ApiException):
+            self.handler._create_if_absent(api, "ns", "accesskeys", self.body)
+
+
+class TestRequeueWhileUserPending:
+    """Test cases for the early User readiness check on retries."""
+
+    def setup_method(self):
+        """Create a handler for each test."""
+        self.handler = BucketHandler()
+
+    @patch("wasabi_s3_operator.handlers.bucket.get_user_with_cache")
+    def test_pending_user_requeues(self, mock_get_user):
+        """Test that a not-ready User within the timeout requeues."""
+        mock_get_user.return_value = {
+            "status": {"conditions": [{"type": "Ready", "status": "False"}]},
+        }
+        status = {"userCreatedAt": now_iso()}
+
+        with pytest.raises(kopf.TemporaryError):
+            self.handler._requeue_while_user_pending(Mock(), "ns", "b", status)
+
+    @patch("wasabi_s3_operator.handlers.bucket.get_user_with_cache")
+    def test_ready_user_proceeds(self, mock_get_user):
+        """Test that a Ready User lets reconciliation continue."""
+        mock_get_user.return_value = {
+            "status": {"conditions": [{"type": "Ready", "status": "True"}]},
+        }
+        status = {"userCreatedAt": now_iso()}
+
+        self.handler._requeue_while_user_pending(Mock(), "ns", "b", status)
+
+    @patch("wasabi_s3_operator.handlers.bucket.get_user_with_cache")
+    def test_no_pending_user_skips_lookup(self, mock_get_user):
+        """Test that no User lookup is made without status.userCreatedAt."""
+        self.handler._requeue_while_user_pending(Mock(), "ns", "b", {})
+
+        mock_get_user.assert_not_called()
@@ -0,0 +1,102 @@
+"""Tests for BucketPolicy drift comparison and status updates."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, Mock, patch
+
+from wasabi_s3_operator.handlers import bucket_policy
+from wasabi_s3_operator.handlers.bucket_policy import _desired_policy_digest, _policy_digest
+
+
+class TestPolicyDigest:
+    """Test cases for policy digests used in drift checks."""
+
+    def setup_method(self):
+        """Start each test with an empty digest cache."""
+        bucket_policy._desired_policy_digests.clear()
+
+    def test_digest_ignores_key_order(self):
+        """Test that equal documents digest equally regardless of key order."""
+        a = {"Version": "2012-10-17", "Statement": [{"Effect": "Allow", "Action": "s3:*"}]}
+        b = {"Statement": [{"Action": "s3:*", "Effect": "Allow"}], "Version": "2012-10-17"}
+
+        assert _policy_digest(a) == _policy_digest(b)
+        assert _policy_digest(a) != _policy_digest({**a, "Version": "2008-10-17"})
+
+    def test_desired_digest_cached_per_generation(self):
+        """Test that the desired policy is converted once per generation."""
+        provider_client = Mock()
+        provider_client.convert_policy.return_value = {"Statement": []}
+        meta = {"uid": "uid-1", "generation": 1}
+
+        first = _desired_policy_digest(meta, provider_client, {"statement": []})
+        second = _desired_policy_digest(meta, provider_client, {"statement": []})
+
+        assert first == second
+        provider_client.convert_policy.assert_called_once()
+
+        _desired_policy_digest({"uid": "uid-1", "generation": 2}, provider_client, {"statement": []})
+        assert provider_client.convert_policy.call_count == 2
+
+
+class TestReconcileStatus:
+    """Test that reconcile writes status once per pass."""
+
+    def _reconcile(self, provider_client, status=None):
+        """Run reconcile against a ready bucket and the given provider client."""
+        bucket = {
+            "spec": {"providerRef": {"name": "wasabi"}},
+            "status": {"conditions": [{"type": "Ready", "status": "True"}]},
+        }
+        kopf_patch = MagicMock()
+        meta = {"name": "policy", "namespace": "default", "uid": "uid-1", "generation": 3}
+        spec = {"bucketRef": {"name": "bucket"}, "policy": {"statement": []}}
+        with patch.object(bucket_policy, "get_k8s_client"), \
+                patch.object(bucket_policy, "get_provider_with_cache", return_value={"spec": {}}), \
+                patch.object(bucket_policy, "get_cached_provider_client", return_value=provider_client), \
+                patch.object(bucket_policy, "emit_validate_succeeded"), \
+                patch.object(bucket_policy, "emit_policy_applied"), \
+                patch.object(bucket_policy, "emit_policy_failed"), \
+                patch.object(bucket_policy.BucketPolicyHandler, "_get_bucket", return_value=bucket):
+            bucket_policy.BucketPolicyHandler().reconcile(spec, meta, status or {}, kopf_patch)
+        return kopf_patch
+
+    def test_apply_failure_is_not_overwritten(self):
+        """Test that a failed apply is the only status written."""
+        provider_client = Mock()
+        provider_client.get_bucket_policy.return_value = None
+        provider_client.set_bucket_policy.side_effect = RuntimeError("denied")
+
+        kopf_patch = self._reconcile(provider_client)
+
+        kopf_patch.status.update.assert_called_once()
+        status_update = kopf_patch.status.update.call_args[0][0]
+        assert status_update["applied"] is False
+        assert status_update["observedGeneration"] == 3
+
+    def test_success_writes_status_once(self):
+        """Test that the happy path issues a single status update."""
+        provider_client = Mock()
+        provider_client.get_bucket_policy.return_value = None
+
+        kopf_patch = self._reconcile(provider_client)
+
+        kopf_patch.status.update.assert_called_once()
+        status_update = kopf_patch.status.update.call_args[0][0]
+        assert status_update["applied"] is True
+        assert "lastSyncTime" in status_update
+
+    def test_changed_conditions_are_written(self):
+        """Test that a condition flipping to Ready is part of the status patch."""
+        provider_client = Mock()
+        provider_client.get_bucket_policy.return_value = None
+        status = {
+            "observedGeneration": 3,
+            "conditions": [{"type": "Ready", "status": "False", "reason": "NotReady", "message": "pending"}],
+        }
+
+        kopf_patch = self._reconcile(provider_client, status)
+
+        status_update = kopf_patch.status.update.call_args[0][0]
+        assert status_update["conditions"][0]["status"] == "True"
+        assert status["conditions"][0]["status"] == "False"
@@ -10,6 +10,7 @@ import pytest
 from wasabi_s3_operator.utils.cache import (
     get_cached_object,
     invalidate_cache,
+    is_refresh_due,
     make_cache_key,
     set_cached_object,
 )
@@ -98,6 +99,21 @@ class TestCacheOperations:
         assert result == obj2
         assert result["version"] == 2
 
+    def test_refresh_due_after_threshold(self):
+        """Test that entries past the refresh threshold are flagged but still served."""
+        key = "test:key:refresh"
+        set_cached_object(key, {"data": "test"})
+
+        assert is_refresh_due(key) is False
+        with patch("wasabi_s3_operator.utils.cache._cache_refresh_after", 0.0):
+            time.sleep(0.01)
+            assert is_refresh_due(key) is True
+            assert get_cached_object(key) == {"data": "test"}
+
+    def test_refresh_not_due_for_missing_key(self):
+        """Test that a missing entry never needs a refresh."""
+        assert is_refresh_due("missing:key") is False
+
 
 class TestCacheInvalidation:
     """Test cases for cache invalidation."""
@@ -133,6 +149,16 @@ class TestCacheInvalidation:
         # Bucket entry should still exist
         assert get_cached_object("Bucket:default:b1") is not None
 
+    def test_invalidate_cache_tuple_keys(self):
+        """Test that patterns also match (kind, namespace, name) tuple keys."""
+        set_cached_object(("Provider", "default", "p1"), {"name": "p1"})
+        set_cached_object(("User", "default", "u1"), {"name": "u1"})
+
+        invalidate_cache("Provider:default")
+
+        assert get_cached_object(("Provider", "default", "p1")) is None
+        assert get_cached_object(("User", "default", "u1")) is not None
+
     def test_invalidate_cache_namespace_pattern(self):
         """Test invalidating cache entries for specific namespace."""
         set_cached_object("Provider:ns1:p1", {"name": "p1"})
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from wasabi_s3_operator.utils.conditions import (
+    Conditions,
     set_auth_valid_condition,
     set_endpoint_reachable_condition,
     set_ready_condition,
@@ -76,3 +77,62 @@ class TestConditions:
         assert result[0]["type"] == "EndpointReachable"
         assert result[0]["status"] == "True"
 
+
+
+class TestConditionsMapping:
+    """Test the Conditions wrapper."""
+
+    def test_roundtrip_preserves_order(self) -> None:
+        """Test that conditions serialize back in their original order."""
+        original = [
+            {"type": "Ready", "status": "False"},
+            {"type": "CreationFailed", "status": "True"},
+        ]
+
+        conditions = Conditions(original)
+
+        assert conditions.to_list() == original
+        assert "CreationFailed" in conditions
+        assert len(conditions) == 2
+
+    def test_is_true(self) -> None:
+        """Test Ready lookups by type."""
+        conditions = Conditions([{"type": "Ready", "status": "True"}])
+
+        assert conditions.is_true("Ready")
+        assert not conditions.is_true("AuthValid")
+        assert not Conditions().is_true("Ready")
+
+    def test_set_helpers_update_in_place(self) -> None:
+        """Test that set_* helpers update a Conditions mapping by type."""
+        conditions = Conditions(
+            [
+                {
+                    "type": "Ready",
+                    "status": "True",
+                    "reason": "Ready",
+                    "message": "old",
+                    "lastTransitionTime": "2023-01-01T00:00:00Z",
+                }
+            ]
+        )
+
+        result = set_ready_condition(conditions, True, "still ready")
+        result = set_auth_valid_condition(result, False, "bad credentials")
+
+        assert result is conditions
+        as_list = conditions.to_list()
+        assert [c["type"] for c in as_list] == ["Ready", "AuthValid"]
+        assert as_list[0]["message"] == "still ready"
+        assert as_list[0]["lastTransitionTime"] == "2023-01-01T00:00:00Z"
+        assert as_list[1]["status"] == "False"
+
+    def test_source_list_not_mutated(self) -> None:
+        """Test that updating a Conditions mapping leaves the status list intact."""
+        original = [{"type": "Ready", "status": "False", "message": "old"}]
+        conditions = Conditions(original)
+
+        set_ready_condition(conditions, True, "now ready")
+
+        assert original == [{"type": "Ready", "status": "False", "message": "old"}]
+        assert conditions["Ready"]["status"] == "True"
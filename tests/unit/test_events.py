@@ -5,6 +5,7 @@ from __future__ import annotations
 from unittest.mock import patch
 
 from wasabi_s3_operator.utils.events import (
+    batched_events,
     emit_access_key_created,
     emit_access_key_rotated,
     emit_bucket_created,
@@ -231,3 +232,45 @@ class TestAccessKeyEvents:
 
 
 
+
+
+class TestBatchedEvents:
+    """Test cases for per-reconcile event batching."""
+
+    meta = {"name": "test-resource", "namespace": "default", "uid": "u1"}
+
+    @patch("wasabi_s3_operator.utils.events.kopf.event")
+    def test_progress_events_collapse_to_last(self, mock_event):
+        """Test that a reconcile with only progress events posts one event."""
+        with batched_events():
+            emit_reconcile_started(self.meta)
+            emit_validate_succeeded(self.meta)
+            mock_event.assert_not_called()
+
+        mock_event.assert_called_once_with(
+            self.meta, reason="ValidateSucceeded", message="Validation succeeded", type="Normal"
+        )
+
+    @patch("wasabi_s3_operator.utils.events.kopf.event")
+    def test_outcome_events_replace_progress(self, mock_event):
+        """Test that progress events are dropped and repeated reasons keep the last message."""
+        with batched_events():
+            emit_reconcile_started(self.meta)
+            emit_reconcile_failed(self.meta, "first")
+            emit_reconcile_failed(self.meta, "second")
+
+        mock_event.assert_called_once_with(
+            self.meta, reason="ReconcileFailed", message="second", type="Warning"
+        )
+
+    @patch("wasabi_s3_operator.utils.events.kopf.event")
+    def test_events_flushed_on_exception(self, mock_event):
+        """Test that events are still posted when the block raises."""
+        try:
+            with batched_events():
+                emit_validate_failed(self.meta, "bad spec")
+                raise ValueError("boom")
+        except ValueError:
+            pass
+
+        mock_event.assert_called_once()
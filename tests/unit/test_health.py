@@ -4,204 +4,23 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
-import pytest
-
-from wasabi_s3_operator.health import (
-    create_combined_wsgi_app,
-    health_check_app,
-)
-
-
-class TestHealthCheckApp:
-    """Test cases for health_check_app WSGI application."""
-
-    def test_healthz_endpoint_root_path(self):
-        """Test /healthz endpoint with root path."""
-        environ = {
-            "REQUEST_METHOD": "GET",
-            "PATH_INFO": "/",
-            "SCRIPT_NAME": "/healthz",
-            "SERVER_NAME": "localhost",
-            "SERVER_PORT": "8080",
-            "wsgi.url_scheme": "http",
-        }
-        
-        start_response = MagicMock()
-        result = health_check_app(environ, start_response)
-        
-        # Check that response contains status ok
-        response_body = b"".join(result)
-        assert b'"status":"ok"' in response_body
-        
-        # Check that status code is 200
-        status_call = start_response.call_args[0][0]
-        assert "200" in status_call
-
-    def test_healthz_endpoint_direct_path(self):
-        """Test /healthz endpoint with direct path."""
-        environ = {
-            "REQUEST_METHOD": "GET",
-            "PATH_INFO": "/healthz",
-            "SCRIPT_NAME": "",
-            "SERVER_NAME": "localhost",
-            "SERVER_PORT": "8080",
-            "wsgi.url_scheme": "http",
-        }
-        
-        start_response = MagicMock()
-        result = health_check_app(environ, start_response)
-        
-        response_body = b"".join(result)
-        assert b'"status":"ok"' in response_body
-
-    def test_readyz_endpoint_root_path(self):
-        """Test /readyz endpoint with root path."""
-        # Note: The health_check_app checks "/" first, so we get "ok" not "ready"
-        # when PATH_INFO is "/" even with SCRIPT_NAME="/readyz"
-        # This test verifies the actual behavior
-        environ = {
-            "REQUEST_METHOD": "GET",
-            "PATH_INFO": "/",
-            "SCRIPT_NAME": "/readyz",
-            "SERVER_NAME": "localhost",
-            "SERVER_PORT": "8080",
-            "wsgi.url_scheme": "http",
-        }
-        
-        start_response = MagicMock()
-        result = health_check_app(environ, start_response)
-        
-        response_body = b"".join(result)
-        # Due to the order of checks in health_check_app, "/" returns "ok"
-        assert b'"status":"ok"' in response_body
-        
-        status_call = start_response.call_args[0][0]
-        assert "200" in status_call
-
-    def test_readyz_endpoint_direct_path(self):
-        """Test /readyz endpoint with direct path."""
-        environ = {
-            "REQUEST_METHOD": "GET",
-            "PATH_INFO": "/readyz",
-            "SCRIPT_NAME": "",
-            "SERVER_NAME": "localhost",
-            "SERVER_PORT": "8080",
-            "wsgi.url_scheme": "http",
-        }
-        
-        start_response = MagicMock()
-        result = health_check_app(environ, start_response)
-        
-        response_body = b"".join(result)
-        assert b'"status":"ready"' in response_body
-
-    def test_not_found_endpoint(self):
-        """Test unknown endpoint returns 404."""
-        environ = {
-            "REQUEST_METHOD": "GET",
-            "PATH_INFO": "/unknown",
-            "SCRIPT_NAME": "",
-            "SERVER_NAME": "localhost",
-            "SERVER_PORT": "8080",
-            "wsgi.url_scheme": "http",
-        }
-        
-        start_response = MagicMock()
-        result = health_check_app(environ, start_response)
-        
-        response_body = b"".join(result)
-        assert b'"error":"not found"' in response_body
-        
-        status_call = start_response.call_args[0][0]
-        assert "404" in status_call
-
-    def test_content_type_is_json(self):
-        """Test that content type is application/json."""
-        environ = {
-            "REQUEST_METHOD": "GET",
-            "PATH_INFO": "/",
-            "SCRIPT_NAME": "/healthz",
-            "SERVER_NAME": "localhost",
-            "SERVER_PORT": "8080",
-            "wsgi.url_scheme": "http",
-        }
-        
-        start_response = MagicMock()
-        health_check_app(environ, start_response)
-        
-        # Check headers for content-type
-        headers = start_response.call_args[0][1]
-        content_type_header = [h for h in headers if h[0].lower() == "content-type"]
-        assert len(content_type_header) > 0
-        assert "application/json" in content_type_header[0][1]
 
+class TestHealthServerIntegration:
+    """Integration tests for health check server."""
 
-class TestCombinedWsgiApp:
-    """Test cases for combined WSGI application."""
-
-    def test_combined_app_healthz(self):
-        """Test combined app handles /healthz."""
-        app = create_combined_wsgi_app()
-        
-        environ = {
-            "REQUEST_METHOD": "GET",
-            "PATH_INFO": "/healthz",
-            "SERVER_NAME": "localhost",
-            "SERVER_PORT": "8080",
-            "wsgi.url_scheme": "http",
-        }
-        
-        start_response = MagicMock()
-        result = app(environ, start_response)
-        
-        response_body = b"".join(result)
-        assert b'"status":"ok"' in response_body
+    def setup_method(self):
+        """Reset the process-wide server before each test."""
+        import wasabi_s3_operator.health as health
 
-    def test_combined_app_readyz(self):
-        """Test combined app handles /readyz."""
-        app = create_combined_wsgi_app()
-        
-        environ = {
-            "REQUEST_METHOD": "GET",
-            "PATH_INFO": "/readyz",
-            "SERVER_NAME": "localhost",
-            "SERVER_PORT": "8080",
-            "wsgi.url_scheme": "http",
-        }
-        
-        start_response = MagicMock()
-        result = app(environ, start_response)
-        
-        response_body = b"".join(result)
-        assert b'"status":"ready"' in response_body
-
-    @patch("prometheus_client.make_wsgi_app")
-    def test_combined_app_delegates_to_metrics(self, mock_make_wsgi):
-        """Test combined app delegates /metrics to prometheus."""
-        mock_metrics_app = MagicMock(return_value=[b"metrics data"])
-        mock_make_wsgi.return_value = mock_metrics_app
-        
-        app = create_combined_wsgi_app()
-        
-        environ = {
-            "REQUEST_METHOD": "GET",
-            "PATH_INFO": "/metrics",
-            "SERVER_NAME": "localhost",
-            "SERVER_PORT": "8080",
-            "wsgi.url_scheme": "http",
-        }
-        
-        start_response = MagicMock()
-        result = app(environ, start_response)
-        
-        # Verify metrics app was called
-        assert mock_metrics_app.called
+        health._server = None
 
+    def teardown_method(self):
+        """Drop the mocked server after each test."""
+        import wasabi_s3_operator.health as health
 
-class TestHealthServerIntegration:
-    """Integration tests for health check server."""
+        health._server = None
 
-    @patch("wasabi_s3_operator.health.make_server")
+    @patch("wasabi_s3_operator.health.make_pooled_server")
     @patch("wasabi_s3_operator.health.threading.Thread")
     def test_add_health_routes_starts_server(self, mock_thread, mock_make_server):
         """Test that add_health_routes_to_metrics_server starts the server."""
@@ -222,7 +41,7 @@ class TestHealthServerIntegration:
         mock_thread.assert_called_once()
         mock_thread_instance.start.assert_called_once()
 
-    @patch("wasabi_s3_operator.health.make_server")
+    @patch("wasabi_s3_operator.health.make_pooled_server")
     @patch("wasabi_s3_operator.health.threading.Thread")
     def test_health_server_runs_as_daemon(self, mock_thread, mock_make_server):
         """Test that health server thread is created as daemon."""
@@ -237,3 +56,115 @@ class TestHealthServerIntegration:
         thread_kwargs = mock_thread.call_args[1]
         assert thread_kwargs.get("daemon") is True
 
+    @patch("wasabi_s3_operator.health.make_pooled_server")
+    @patch("wasabi_s3_operator.health.threading.Thread")
+    def test_server_started_only_once(self, mock_thread, mock_make_server):
+        """Test that repeated calls reuse the running server."""
+        from wasabi_s3_operator.health import add_health_routes_to_metrics_server
+
+        first = add_health_routes_to_metrics_server(8080)
+        second = add_health_routes_to_metrics_server(8080)
+
+        assert first is second
+        mock_make_server.assert_called_once()
+        mock_thread.assert_called_once()
+
+
+class TestPooledHTTPServer:
+    """Test cases for the thread-pool backed metrics/health server."""
+
+    def _serve(self, **kwargs):
+        import threading
+
+        from wasabi_s3_operator.health import make_pooled_server
+
+        server = make_pooled_server("127.0.0.1", 0, **kwargs)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        return server, server.socket.getsockname()[1]
+
+    def test_serves_probe_and_metrics_endpoints(self):
+        """Test /healthz, /readyz and /metrics over a real socket."""
+        import urllib.request
+
+        server, port = self._serve(max_workers=2)
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/healthz", timeout=5) as resp:
+                assert resp.status == 200
+                assert resp.headers["Content-Type"] == "application/json"
+                assert resp.read() == b'{"status":"ok"}'
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/readyz", timeout=5) as resp:
+                assert resp.read() == b'{"status":"ready"}'
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as resp:
+                assert b"python_info" in resp.read()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_probe_ignores_query_string(self):
+        """Test that probe routes match on the path only."""
+        import urllib.request
+
+        server, port = self._serve(max_workers=2)
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/readyz?verbose=1", timeout=5) as resp:
+                assert resp.headers["Content-Length"] == str(len(b'{"status":"ready"}'))
+                assert resp.read() == b'{"status":"ready"}'
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_metrics_gzip_when_requested(self):
+        """Test that /metrics is gzip-compressed for gzip-capable scrapers."""
+        import gzip
+        import urllib.request
+
+        server, port = self._serve(max_workers=2)
+        try:
+            request = urllib.request.Request(
+                f"http://127.0.0.1:{port}/metrics", headers={"Accept-Encoding": "gzip"}
+            )
+            with urllib.request.urlopen(request, timeout=5) as resp:
+                assert resp.headers["Content-Encoding"] == "gzip"
+                assert b"python_info" in gzip.decompress(resp.read())
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_handler_has_socket_timeout(self):
+        """Test that connections are bounded by a socket timeout."""
+        from wasabi_s3_operator.health import DEFAULT_SERVER_TIMEOUT_SECONDS, ProbeMetricsHandler
+
+        assert ProbeMetricsHandler.timeout == DEFAULT_SERVER_TIMEOUT_SECONDS
+        assert ProbeMetricsHandler.timeout > 0
+
+    def test_serves_requests_from_worker_pool(self):
+        """Test that requests are handled by pool worker threads."""
+        import threading
+        import urllib.request
+        from http.server import BaseHTTPRequestHandler
+
+        thread_names = []
+
+        class PingHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                thread_names.append(threading.current_thread().name)
+                self.send_response(200)
+                self.send_header("Content-Length", "4")
+                self.end_headers()
+                self.wfile.write(b"pong")
+
+            def log_message(self, format, *args):
+                pass
+
+        server, port = self._serve(handler_class=PingHandler, max_workers=2)
+        try:
+            for _ in range(3):
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/ping", timeout=5) as resp:
+                    assert resp.read() == b"pong"
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert len(thread_names) == 3
+        assert all(name.startswith("metrics-http") for name in thread_names)
@@ -0,0 +1,84 @@
+"""Unit tests for the IAMPolicy handler."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, Mock, patch
+
+from wasabi_s3_operator.handlers import iampolicy
+from wasabi_s3_operator.handlers.iampolicy import _policy_digest
+
+POLICY = {"version": "2012-10-17", "statement": [{"effect": "Allow", "action": ["s3:*"], "resource": ["*"]}]}
+
+
+class TestPolicyDigest:
+    """Test cases for the applied-policy digest."""
+
+    def test_digest_ignores_key_order(self):
+        """Test that key order does not change the digest."""
+        reordered = {"statement": POLICY["statement"], "version": POLICY["version"]}
+        assert _policy_digest("default", "wasabi", POLICY) == _policy_digest("default", "wasabi", reordered)
+
+    def test_digest_includes_provider(self):
+        """Test that the same document on another Provider has a different digest."""
+        assert _policy_digest("default", "wasabi", POLICY) != _policy_digest("default", "other", POLICY)
+
+
+class TestReconcileSkipsAppliedPolicy:
+    """Test that an already-applied document skips the IAM calls."""
+
+    def _reconcile(self, status):
+        """Run reconcile against a ready Provider with a mocked provider client."""
+        provider_client = Mock()
+        provider_client.convert_policy.side_effect = lambda policy: policy
+        provider_client.create_managed_policy.return_value = {"Policy": {"Arn": "arn:aws:iam::1:policy/p"}}
+        provider = {"spec": {}, "status": {"conditions": [{"type": "Ready", "status": "True"}]}}
+        meta = {"name": "p", "namespace": "default", "generation": 2}
+        spec = {"providerRef": {"name": "wasabi"}, "policy": POLICY}
+        kopf_patch = MagicMock()
+        with patch.object(iampolicy, "get_k8s_client"), \
+                patch.object(iampolicy, "get_provider_with_cache", return_value=provider), \
+                patch.object(iampolicy, "get_cached_provider_client", return_value=provider_client), \
+                patch.object(iampolicy, "emit_validate_succeeded"):
+            iampolicy.IAMPolicyHandler().reconcile(spec, meta, status, kopf_patch)
+        return provider_client, kopf_patch
+
+    def test_matching_digest_skips_create(self):
+        """Test that a recorded digest and ARN avoid create_managed_policy."""
+        status = {"policyArn": "arn:aws:iam::1:policy/p", "policyHash": _policy_digest("default", "wasabi", POLICY)}
+
+        provider_client, kopf_patch = self._reconcile(status)
+
+        provider_client.create_managed_policy.assert_not_called()
+        assert kopf_patch.status.update.call_args[0][0]["conditions"][0]["status"] == "True"
+
+    def test_changed_digest_creates_policy(self):
+        """Test that a different digest applies the policy and records the new digest."""
+        status = {"policyArn": "arn:aws:iam::1:policy/p", "policyHash": "stale"}
+
+        provider_client, kopf_patch = self._reconcile(status)
+
+        provider_client.create_managed_policy.assert_called_once()
+        status_update = kopf_patch.status.update.call_args[0][0]
+        assert status_update["policyHash"] == _policy_digest("default", "wasabi", POLICY)
+
+
+class TestInvalidSpec:
+    """Test that an invalid spec is recorded in status instead of raised."""
+
+    def test_missing_statement_returns_not_ready(self):
+        """Test that a policy without a statement sets Ready=False and returns."""
+        meta = {"name": "p", "namespace": "default", "generation": 3}
+        spec = {"providerRef": {"name": "wasabi"}, "policy": {"version": "2012-10-17"}}
+        kopf_patch = MagicMock()
+        kopf_patch.status = {}
+        with patch.object(iampolicy, "get_k8s_client") as get_client, \
+                patch.object(iampolicy, "emit_validate_failed") as emit_failed, \
+                patch("wasabi_s3_operator.handlers.base.emit_reconcile_failed"):
+            iampolicy.IAMPolicyHandler().reconcile(spec, meta, {}, kopf_patch)
+
+        get_client.assert_not_called()
+        emit_failed.assert_called_once()
+        assert kopf_patch.status["applied"] is False
+        assert kopf_patch.status["observedGeneration"] == 3
+        ready = kopf_patch.status["conditions"][0]
+        assert (ready["type"], ready["status"]) == ("Ready", "False")
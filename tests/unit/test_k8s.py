@@ -0,0 +1,56 @@
+"""Tests for the shared Kubernetes API clients."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from kubernetes.config import ConfigException
+
+from wasabi_s3_operator.utils import k8s
+
+
+class TestGetApiClient:
+    """Test cases for the process-wide ApiClient."""
+
+    def setup_method(self):
+        """Drop any client cached by earlier tests."""
+        k8s.reset_clients()
+
+    def teardown_method(self):
+        """Do not leak the client built from mocked config."""
+        k8s.reset_clients()
+
+    @patch("kubernetes.config.load_incluster_config")
+    def test_config_loaded_once(self, mock_load_incluster):
+        """Test that configuration is loaded once and the client reused."""
+        first = k8s.get_api_client()
+        second = k8s.get_api_client()
+
+        assert first is second
+        mock_load_incluster.assert_called_once()
+
+    @patch("kubernetes.config.load_kube_config")
+    @patch("kubernetes.config.load_incluster_config")
+    def test_kubeconfig_fallback(self, mock_load_incluster, mock_load_kube):
+        """Test falling back to kubeconfig outside a cluster."""
+        mock_load_incluster.side_effect = ConfigException("Not in cluster")
+
+        k8s.get_api_client()
+
+        mock_load_incluster.assert_called_once()
+        mock_load_kube.assert_called_once()
+
+    @patch("kubernetes.config.load_incluster_config")
+    def test_connection_pool_size(self, mock_load_incluster):
+        """Test that the shared client uses the configured pool size."""
+        api_client = k8s.get_api_client()
+
+        assert api_client.configuration.connection_pool_maxsize == k8s._CONNECTION_POOL_MAXSIZE
+
+    @patch("kubernetes.config.load_incluster_config")
+    def test_core_api_shares_api_client(self, mock_load_incluster):
+        """Test that CoreV1Api is cached and built on the shared ApiClient."""
+        core_api = k8s.get_core_api()
+
+        assert k8s.get_core_api() is core_api
+        assert core_api.api_client is k8s.get_api_client()
@@ -0,0 +1,58 @@
+"""Tests for per-key locks."""
+
+from __future__ import annotations
+
+import gc
+import threading
+import time
+
+from wasabi_s3_operator.utils.locks import KeyedLock
+
+
+class TestKeyedLock:
+    """Test cases for KeyedLock."""
+
+    def test_same_key_is_exclusive(self):
+        """Test that a second holder of the same key waits for the first."""
+        locks = KeyedLock()
+        events = []
+
+        def worker(tag):
+            with locks.hold(("Bucket", "ns", "b")):
+                events.append(f"{tag}-in")
+                time.sleep(0.05)
+                events.append(f"{tag}-out")
+
+        threads = [threading.Thread(target=worker, args=(tag,)) for tag in ("a", "b")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        assert events[0].endswith("-in")
+        assert events[1] == events[0].replace("-in", "-out")
+
+    def test_different_keys_do_not_block(self):
+        """Test that holding one key does not block another."""
+        locks = KeyedLock()
+        acquired = threading.Event()
+
+        def other():
+            with locks.hold(("Bucket", "ns", "other")):
+                acquired.set()
+
+        with locks.hold(("Bucket", "ns", "b")):
+            thread = threading.Thread(target=other)
+            thread.start()
+            assert acquired.wait(5)
+        thread.join(5)
+
+    def test_unused_locks_are_dropped(self):
+        """Test that a key's lock is released from the table once unused."""
+        locks = KeyedLock()
+
+        with locks.hold(("Bucket", "ns", "b")):
+            assert len(locks) == 1
+        gc.collect()
+
+        assert len(locks) == 0
@@ -0,0 +1,79 @@
+"""Unit tests for structured logging helpers."""
+
+from __future__ import annotations
+
+import json
+import logging
+from unittest.mock import MagicMock
+
+from wasabi_s3_operator.logging import log_resource_event, sanitize_secrets
+
+
+class TestLogResourceEvent:
+    """Test cases for log_resource_event."""
+
+    def test_logs_json_payload(self) -> None:
+        """Test that the event is logged as a single JSON object."""
+        logger = MagicMock(spec=logging.Logger)
+
+        log_resource_event(
+            logger,
+            controller="bucket",
+            resource_kind="Bucket",
+            resource_name="my-bucket",
+            namespace="default",
+            uid="uid-1",
+            event="reconcile",
+            reason="Created",
+            message="Bucket created",
+            bucket_name="my-bucket",
+        )
+
+        logger.info.assert_called_once()
+        fmt, message = logger.info.call_args[0]
+        payload = json.loads(fmt % message)
+        assert payload["resource"] == "Bucket"
+        assert payload["name"] == "my-bucket"
+        assert payload["reason"] == "Created"
+        assert payload["bucket_name"] == "my-bucket"
+
+    def test_skips_when_info_disabled(self) -> None:
+        """Test that nothing is logged when INFO is filtered out."""
+        logger = MagicMock(spec=logging.Logger)
+        logger.isEnabledFor.return_value = False
+
+        log_resource_event(
+            logger,
+            controller="bucket",
+            resource_kind="Bucket",
+            resource_name="my-bucket",
+            namespace="default",
+            uid="uid-1",
+            event="reconcile",
+            reason="Created",
+            message="Bucket created",
+        )
+
+        logger.isEnabledFor.assert_called_once_with(logging.INFO)
+        logger.info.assert_not_called()
+
+
+class TestSanitizeSecrets:
+    """Test cases for sanitize_secrets."""
+
+    def test_redacts_secret_fields(self) -> None:
+        """Test that secret fields are redacted."""
+        data = {"access_key": "AKIA", "secret_key": "s3cr3t", "name": "user"}
+
+        result = sanitize_secrets(data)
+
+        assert result["access_key"] == "***REDACTED***"
+        assert result["secret_key"] == "***REDACTED***"
+        assert result["name"] == "user"
+        assert data["access_key"] == "AKIA"
+
+    def test_returns_input_without_secrets(self) -> None:
+        """Test that data without secret fields is returned as-is."""
+        data = {"name": "user", "reason": "Created"}
+
+        assert sanitize_secrets(data) is data
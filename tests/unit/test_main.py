@@ -0,0 +1,31 @@
+"""Tests for operator startup configuration."""
+
+from __future__ import annotations
+
+from wasabi_s3_operator.main import error_delays, peering_priority
+
+
+class TestPeeringPriority:
+    """Test cases for the leader-election peering priority."""
+
+    def test_priority_is_stable(self):
+        """Test that a restarted replica with the same pod name keeps its priority."""
+        pod_name = "wasabi-s3-operator-7d9f-abcde"
+        assert peering_priority(pod_name) == peering_priority(pod_name)
+
+    def test_replicas_get_distinct_priorities(self):
+        """Test that sibling replicas do not share a priority."""
+        names = [f"wasabi-s3-operator-7d9f-{i:05d}" for i in range(1000)]
+        assert len({peering_priority(name) for name in names}) == len(names)
+
+
+class TestErrorDelays:
+    """Test cases for the error throttling backoff sequence."""
+
+    def test_exponential_up_to_cap(self):
+        """Test that delays double until they reach the cap."""
+        assert error_delays(1.0, 60.0, 2.0) == (1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 60.0)
+
+    def test_no_growth_uses_cap(self):
+        """Test that a non-growing backoff falls back to the cap alone."""
+        assert error_delays(1.0, 60.0, 1.0) == (60.0,)
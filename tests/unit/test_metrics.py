@@ -6,6 +6,7 @@ import pytest
 from prometheus_client import REGISTRY
 
 from wasabi_s3_operator.metrics import (
+    MetricBatcher,
     api_call_duration_seconds,
     api_call_total,
     bucket_operations_total,
@@ -206,3 +207,30 @@ class TestMetricOperations:
         assert value1 == 3
         assert value2 == 5
 
+
+class TestMetricBatcher:
+    """Test cases for MetricBatcher."""
+
+    def test_flushes_accumulated_counts_on_exit(self):
+        """Test that increments are applied once per child on exit."""
+        child_a = bucket_operations_total.labels(operation="batch_a", result="success")
+        child_b = bucket_operations_total.labels(operation="batch_b", result="success")
+
+        with MetricBatcher() as mb:
+            mb.add(child_a)
+            mb.add(child_a)
+            mb.add(child_b, 3)
+            assert child_a._value.get() == 0
+
+        assert child_a._value.get() == 2
+        assert child_b._value.get() == 3
+
+    def test_flushes_on_exception(self):
+        """Test that recorded increments survive an exception."""
+        child = bucket_operations_total.labels(operation="batch_err", result="failed")
+
+        with pytest.raises(RuntimeError), MetricBatcher() as mb:
+            mb.add(child)
+            raise RuntimeError("boom")
+
+        assert child._value.get() == 1
@@ -8,7 +8,9 @@ from unittest.mock import MagicMock, patch
 from kubernetes.client.exceptions import ApiException
 
 from wasabi_s3_operator.utils.rate_limit import (
+    backoff_delay,
     handle_rate_limit_error,
+    is_rate_limit_error,
     rate_limit_k8s,
     rate_limit_wasabi,
 )
@@ -187,24 +189,27 @@ class TestHandleRateLimitError:
         mock_sleep.assert_not_called()
 
     def test_exponential_backoff(self):
-        """Test exponential backoff on retries."""
+        """Test full-jitter exponential backoff on retries."""
         error = ApiException(status=429, reason="Too Many Requests")
         
         with patch("wasabi_s3_operator.utils.rate_limit.time.sleep") as mock_sleep:
-            # First retry - should sleep 1 second
-            result1 = handle_rate_limit_error(error)
-            assert result1 is True
-            assert mock_sleep.call_args_list[0][0][0] == 1  # 2^0 = 1
-            
-            # Second retry - should sleep 2 seconds
-            result2 = handle_rate_limit_error(error)
-            assert result2 is True
-            assert mock_sleep.call_args_list[1][0][0] == 2  # 2^1 = 2
-            
-            # Third retry - should sleep 4 seconds
-            result3 = handle_rate_limit_error(error)
-            assert result3 is True
-            assert mock_sleep.call_args_list[2][0][0] == 4  # 2^2 = 4
+            for _ in range(3):
+                assert handle_rate_limit_error(error) is True
+        
+        # Delays are drawn from [0, 1], [0, 2] and [0, 4]
+        delays = [c[0][0] for c in mock_sleep.call_args_list]
+        for attempt, delay in enumerate(delays):
+            assert 0 <= delay <= 2 ** attempt
+
+    def test_explicit_attempt_leaves_counter_untouched(self):
+        """Test that passing attempt does not use the process-wide counter."""
+        error = ApiException(status=429, reason="Too Many Requests")
+        
+        with patch("wasabi_s3_operator.utils.rate_limit.time.sleep"):
+            assert handle_rate_limit_error(error, attempt=0) is True
+            assert handle_rate_limit_error(error, attempt=3) is False
+        
+        assert getattr(handle_rate_limit_error, "_retry_count", 0) == 0
 
     def test_max_retries_exceeded(self):
         """Test that max retries limit is enforced."""
@@ -249,4 +254,22 @@ class TestHandleRateLimitError:
             assert result2 is False
 
 
+class TestBackoffDelay:
+    """Test cases for full-jitter backoff delays."""
+
+    def test_delay_within_bounds(self):
+        """Test that delays never exceed base * 2**attempt."""
+        for attempt in range(5):
+            for _ in range(20):
+                assert 0 <= backoff_delay(attempt) <= 2 ** attempt
+
+    def test_delay_capped(self):
+        """Test that the delay ceiling is capped."""
+        with patch("wasabi_s3_operator.utils.rate_limit.random.uniform") as mock_uniform:
+            backoff_delay(20, base=1.0, cap=60.0)
+        mock_uniform.assert_called_once_with(0, 60.0)
 
+    def test_is_rate_limit_error_without_status(self):
+        """Test that exceptions without a status are not rate limit errors."""
+        assert is_rate_limit_error(ValueError("boom")) is False
+        assert is_rate_limit_error(ApiException(status=429)) is True
@@ -422,3 +422,20 @@ class TestCleanupExpiredPreviousSecrets:
 
 
 
+
+    @patch("wasabi_s3_operator.utils.secrets.list_previous_secrets")
+    @patch("wasabi_s3_operator.utils.secrets.delete_secret")
+    def test_cleanup_reuses_listed_secrets(self, mock_delete, mock_list):
+        """Test that passing an existing listing skips the second LIST."""
+        mock_api = Mock()
+        listed = [
+            {"name": "expired-1", "is_expired": True},
+            {"name": "not-expired", "is_expired": False},
+        ]
+
+        result = cleanup_expired_previous_secrets(
+            mock_api, "default", "test-key", 30, expired_secrets=listed,
+        )
+
+        assert result == ["expired-1"]
+        mock_list.assert_not_called()
@@ -6,40 +6,48 @@ from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from kubernetes import client
+from prometheus_client import REGISTRY
 
 from wasabi_s3_operator.handlers.shared import (
+    get_from_index,
     get_k8s_client,
     get_provider_with_cache,
     get_user_with_cache,
 )
 
 
+def _api_call_count(operation: str, result: str) -> float:
+    """Read the current k8s api_call_total sample for an operation/result."""
+    value = REGISTRY.get_sample_value(
+        "wasabi_s3_operator_api_call_total",
+        {"api_type": "k8s", "operation": operation, "result": result},
+    )
+    return value or 0.0
+
+
 class TestGetProviderWithCache:
     """Test cases for get_provider_with_cache function."""
 
     @patch("wasabi_s3_operator.handlers.shared.get_cached_object")
-    @patch("wasabi_s3_operator.handlers.shared.metrics")
-    def test_get_provider_from_cache(self, mock_metrics, mock_get_cached):
+    def test_get_provider_from_cache(self, mock_get_cached):
         """Test getting provider from cache."""
         mock_api = Mock()
         cached_provider = {"metadata": {"name": "test-provider"}, "spec": {}}
         mock_get_cached.return_value = cached_provider
 
+        before = _api_call_count("get_provider", "cache_hit")
         result = get_provider_with_cache(mock_api, "test-provider", "default")
 
         assert result == cached_provider
         # API should not be called
         mock_api.get_namespaced_custom_object.assert_not_called()
         # Cache hit metric should be recorded
-        mock_metrics.api_call_total.labels.assert_called_with(
-            api_type="k8s", operation="get_provider", result="cache_hit"
-        )
+        assert _api_call_count("get_provider", "cache_hit") == before + 1
 
     @patch("wasabi_s3_operator.handlers.shared.set_cached_object")
     @patch("wasabi_s3_operator.handlers.shared.get_cached_object")
     @patch("wasabi_s3_operator.handlers.shared.rate_limit_k8s")
-    @patch("wasabi_s3_operator.handlers.shared.metrics")
-    def test_get_provider_from_api(self, mock_metrics, mock_rate_limit, mock_get_cached, mock_set_cached):
+    def test_get_provider_from_api(self, mock_rate_limit, mock_get_cached, mock_set_cached):
         """Test getting provider from API when not in cache."""
         mock_api = Mock()
         mock_get_cached.return_value = None
@@ -49,6 +57,7 @@ class TestGetProviderWithCache:
         mock_api_method = Mock(return_value=provider_obj)
         mock_rate_limit.return_value = mock_api_method
 
+        before = _api_call_count("get_provider", "success")
         result = get_provider_with_cache(mock_api, "test-provider", "default")
 
         assert result == provider_obj
@@ -57,16 +66,13 @@ class TestGetProviderWithCache:
         # Provider should be cached
         mock_set_cached.assert_called_once()
         # Success metric should be recorded
-        mock_metrics.api_call_total.labels.assert_called_with(
-            api_type="k8s", operation="get_provider", result="success"
-        )
+        assert _api_call_count("get_provider", "success") == before + 1
 
     @patch("wasabi_s3_operator.handlers.shared.get_cached_object")
     @patch("wasabi_s3_operator.handlers.shared.handle_rate_limit_error")
     @patch("wasabi_s3_operator.handlers.shared.rate_limit_k8s")
-    @patch("wasabi_s3_operator.handlers.shared.metrics")
     def test_get_provider_with_rate_limit(
-        self, mock_metrics, mock_rate_limit, mock_handle_rate_limit, mock_get_cached
+        self, mock_rate_limit, mock_handle_rate_limit, mock_get_cached
     ):
         """Test getting provider with rate limit error."""
         mock_api = Mock()
@@ -90,9 +96,8 @@ class TestGetProviderWithCache:
     @patch("wasabi_s3_operator.handlers.shared.get_cached_object")
     @patch("wasabi_s3_operator.handlers.shared.handle_rate_limit_error")
     @patch("wasabi_s3_operator.handlers.shared.rate_limit_k8s")
-    @patch("wasabi_s3_operator.handlers.shared.metrics")
     def test_get_provider_api_error(
-        self, mock_metrics, mock_rate_limit, mock_handle_rate_limit, mock_get_cached
+        self, mock_rate_limit, mock_handle_rate_limit, mock_get_cached
     ):
         """Test getting provider with API error."""
         mock_api = Mock()
@@ -103,41 +108,62 @@ class TestGetProviderWithCache:
         mock_rate_limit.return_value = mock_api_method
         mock_handle_rate_limit.return_value = False  # Not a rate limit error
 
+        before = _api_call_count("get_provider", "error")
         with pytest.raises(client.exceptions.ApiException):
             get_provider_with_cache(mock_api, "test-provider", "default")
 
         # Error metric should be recorded
-        mock_metrics.api_call_total.labels.assert_called_with(
-            api_type="k8s", operation="get_provider", result="error"
-        )
+        assert _api_call_count("get_provider", "error") == before + 1
+
+
+    @patch("wasabi_s3_operator.handlers.shared.get_cached_object")
+    @patch("wasabi_s3_operator.handlers.shared.handle_rate_limit_error")
+    @patch("wasabi_s3_operator.handlers.shared.rate_limit_k8s")
+    def test_get_provider_rate_limit_attempts_bounded(
+        self, mock_rate_limit, mock_handle_rate_limit, mock_get_cached
+    ):
+        """Test that persistent rate limiting gives up after bounded attempts."""
+        from wasabi_s3_operator.handlers import shared
+
+        mock_api = Mock()
+        mock_get_cached.return_value = None
+        rate_limit_error = client.exceptions.ApiException(status=429, reason="Too Many Requests")
+
+        mock_api_method = Mock(side_effect=rate_limit_error)
+        mock_rate_limit.return_value = mock_api_method
+        mock_handle_rate_limit.return_value = True
+
+        with pytest.raises(client.exceptions.ApiException):
+            get_provider_with_cache(mock_api, "test-provider", "default")
+
+        assert mock_api_method.call_count == shared._MAX_GET_ATTEMPTS
+        attempts = [c.kwargs["attempt"] for c in mock_handle_rate_limit.call_args_list]
+        assert attempts == list(range(shared._MAX_GET_ATTEMPTS - 1))
 
 
 class TestGetUserWithCache:
     """Test cases for get_user_with_cache function."""
 
     @patch("wasabi_s3_operator.handlers.shared.get_cached_object")
-    @patch("wasabi_s3_operator.handlers.shared.metrics")
-    def test_get_user_from_cache(self, mock_metrics, mock_get_cached):
+    def test_get_user_from_cache(self, mock_get_cached):
         """Test getting user from cache."""
         mock_api = Mock()
         cached_user = {"metadata": {"name": "test-user"}, "spec": {}}
         mock_get_cached.return_value = cached_user
 
+        before = _api_call_count("get_user", "cache_hit")
         result = get_user_with_cache(mock_api, "test-user", "default")
 
         assert result == cached_user
         # API should not be called
         mock_api.get_namespaced_custom_object.assert_not_called()
         # Cache hit metric should be recorded
-        mock_metrics.api_call_total.labels.assert_called_with(
-            api_type="k8s", operation="get_user", result="cache_hit"
-        )
+        assert _api_call_count("get_user", "cache_hit") == before + 1
 
     @patch("wasabi_s3_operator.handlers.shared.set_cached_object")
     @patch("wasabi_s3_operator.handlers.shared.get_cached_object")
     @patch("wasabi_s3_operator.handlers.shared.rate_limit_k8s")
-    @patch("wasabi_s3_operator.handlers.shared.metrics")
-    def test_get_user_from_api(self, mock_metrics, mock_rate_limit, mock_get_cached, mock_set_cached):
+    def test_get_user_from_api(self, mock_rate_limit, mock_get_cached, mock_set_cached):
         """Test getting user from API when not in cache."""
         mock_api = Mock()
         mock_get_cached.return_value = None
@@ -146,6 +172,7 @@ class TestGetUserWithCache:
         mock_api_method = Mock(return_value=user_obj)
         mock_rate_limit.return_value = mock_api_method
 
+        before = _api_call_count("get_user", "success")
         result = get_user_with_cache(mock_api, "test-user", "default")
 
         assert result == user_obj
@@ -154,16 +181,13 @@ class TestGetUserWithCache:
         # User should be cached
         mock_set_cached.assert_called_once()
         # Success metric should be recorded
-        mock_metrics.api_call_total.labels.assert_called_with(
-            api_type="k8s", operation="get_user", result="success"
-        )
+        assert _api_call_count("get_user", "success") == before + 1
 
     @patch("wasabi_s3_operator.handlers.shared.get_cached_object")
     @patch("wasabi_s3_operator.handlers.shared.handle_rate_limit_error")
     @patch("wasabi_s3_operator.handlers.shared.rate_limit_k8s")
-    @patch("wasabi_s3_operator.handlers.shared.metrics")
     def test_get_user_with_retry(
-        self, mock_metrics, mock_rate_limit, mock_handle_rate_limit, mock_get_cached
+        self, mock_rate_limit, mock_handle_rate_limit, mock_get_cached
     ):
         """Test getting user with retry logic."""
         mock_api = Mock()
@@ -183,9 +207,8 @@ class TestGetUserWithCache:
     @patch("wasabi_s3_operator.handlers.shared.get_cached_object")
     @patch("wasabi_s3_operator.handlers.shared.handle_rate_limit_error")
     @patch("wasabi_s3_operator.handlers.shared.rate_limit_k8s")
-    @patch("wasabi_s3_operator.handlers.shared.metrics")
     def test_get_user_error(
-        self, mock_metrics, mock_rate_limit, mock_handle_rate_limit, mock_get_cached
+        self, mock_rate_limit, mock_handle_rate_limit, mock_get_cached
     ):
         """Test getting user with non-rate-limit error."""
         mock_api = Mock()
@@ -196,17 +219,32 @@ class TestGetUserWithCache:
         mock_rate_limit.return_value = mock_api_method
         mock_handle_rate_limit.return_value = False
 
+        before = _api_call_count("get_user", "error")
         with pytest.raises(Exception, match="API error"):
             get_user_with_cache(mock_api, "test-user", "default")
 
-        mock_metrics.api_call_total.labels.assert_called_with(
-            api_type="k8s", operation="get_user", result="error"
-        )
+        assert _api_call_count("get_user", "error") == before + 1
 
 
 class TestGetK8sClient:
     """Test cases for get_k8s_client function."""
 
+    def setup_method(self):
+        """Drop any client cached by earlier tests."""
+        from wasabi_s3_operator.handlers import shared
+        from wasabi_s3_operator.utils import k8s
+
+        shared._k8s_api = None
+        k8s.reset_clients()
+
+    def teardown_method(self):
+        """Do not leak the mocked client into other tests."""
+        from wasabi_s3_operator.handlers import shared
+        from wasabi_s3_operator.utils import k8s
+
+        shared._k8s_api = None
+        k8s.reset_clients()
+
     @patch("wasabi_s3_operator.handlers.shared.client.CustomObjectsApi")
     @patch("kubernetes.config.load_incluster_config")
     def test_get_k8s_client_incluster(self, mock_load_incluster, mock_api):
@@ -236,5 +274,232 @@ class TestGetK8sClient:
         mock_load_incluster.assert_called_once()
         mock_load_kube.assert_called_once()
 
+    @patch("wasabi_s3_operator.handlers.shared.client.CustomObjectsApi")
+    @patch("kubernetes.config.load_incluster_config")
+    def test_get_k8s_client_reused(self, mock_load_incluster, mock_api):
+        """Test that config is loaded once and the client is reused."""
+        first = get_k8s_client()
+        second = get_k8s_client()
+
+        assert first is second
+        mock_load_incluster.assert_called_once()
+        mock_api.assert_called_once()
+
+
+
+
+class TestGetFromIndex:
+    """Test cases for get_from_index function."""
+
+    def test_returns_indexed_object(self):
+        """Test lookup returns the indexed body."""
+        provider_obj = {"metadata": {"name": "test-provider"}, "spec": {}}
+        index = {("default", "test-provider"): [provider_obj]}
+
+        assert get_from_index(index, "default", "test-provider") == provider_obj
+
+    def test_returns_none_on_miss(self):
+        """Test lookup returns None when the key is absent."""
+        index = {("default", "other"): [{}]}
+
+        assert get_from_index(index, "default", "test-provider") is None
+
+    def test_returns_none_without_index(self):
+        """Test lookup returns None when no index is available."""
+        assert get_from_index(None, "default", "test-provider") is None
+
+
+class TestIndexHandlers:
+    """Test cases for kopf index handlers."""
+
+    def test_provider_index_key(self):
+        """Test provider index is keyed by (namespace, name)."""
+        from wasabi_s3_operator.handlers.indexes import provider_index
+
+        body = {"metadata": {"name": "p", "namespace": "ns"}, "spec": {"region": "us-east-1"}}
+        result = provider_index(namespace="ns", name="p", body=body)
+
+        assert result == {("ns", "p"): body}
+
+    def test_user_index_key(self):
+        """Test user index is keyed by (namespace, name)."""
+        from wasabi_s3_operator.handlers.indexes import user_index
+
+        body = {"metadata": {"name": "u", "namespace": "ns"}, "spec": {"name": "app-user"}}
+        result = user_index(namespace="ns", name="u", body=body)
+
+        assert result == {("ns", "u"): body}
+
+    def test_bucket_index_key(self):
+        """Test bucket index is keyed by (namespace, name)."""
+        from wasabi_s3_operator.handlers.indexes import bucket_index
+
+        body = {"metadata": {"name": "b", "namespace": "ns"}, "spec": {"name": "my-bucket"}}
+        result = bucket_index(namespace="ns", name="b", body=body)
+
+        assert result == {("ns", "b"): body}
+
+
+class TestIndexLookup:
+    """Test cases for index-backed lookups in the cached getters."""
+
+    @patch("wasabi_s3_operator.handlers.shared.get_cached_object")
+    def test_provider_served_from_index(self, mock_get_cached):
+        """Test that an index hit answers without cache or API access."""
+        provider = {"metadata": {"name": "p"}}
+        mock_api = Mock()
+
+        result = get_provider_with_cache(mock_api, "p", "ns", provider_index={("ns", "p"): [provider]})
+
+        assert result is provider
+        mock_get_cached.assert_not_called()
+        mock_api.get_namespaced_custom_object.assert_not_called()
+
+    @patch("wasabi_s3_operator.handlers.shared.rate_limit_k8s")
+    @patch("wasabi_s3_operator.handlers.shared.get_cached_object")
+    def test_user_falls_back_on_index_miss(self, mock_get_cached, mock_rate_limit):
+        """Test that an index miss falls through to the API."""
+        user = {"metadata": {"name": "u"}}
+        mock_get_cached.return_value = None
+        mock_rate_limit.side_effect = lambda func: func
+        mock_api = Mock()
+        mock_api.get_namespaced_custom_object.return_value = user
+
+        result = get_user_with_cache(mock_api, "u", "ns", user_index={})
+
+        assert result == user
+        mock_api.get_namespaced_custom_object.assert_called_once()
+
+
+class TestSingleflight:
+    """Test cases for coalescing concurrent lookups."""
+
+    def test_concurrent_callers_share_one_call(self):
+        """Test that callers arriving mid-flight reuse the leader's result."""
+        import threading
+        import time
+
+        from wasabi_s3_operator.handlers.shared import _singleflight
+
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            release.wait(5)
+            return {"metadata": {"name": "p"}}
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(_singleflight("k", fetch)))
+        leader.start()
+        while not calls:
+            time.sleep(0.001)
+        follower = threading.Thread(target=lambda: results.append(_singleflight("k", fetch)))
+        follower.start()
+        # Give the follower time to join the in-flight request
+        time.sleep(0.1)
+        release.set()
+        leader.join(5)
+        follower.join(5)
+
+        assert len(calls) == 1
+        assert len(results) == 2
+        assert results[0] is results[1]
+
+    def test_exception_propagates_and_clears_entry(self):
+        """Test that failures reach the caller and are not cached."""
+        from wasabi_s3_operator.handlers import shared
+
+        def failing():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            shared._singleflight("k-err", failing)
+
+        assert "k-err" not in shared._inflight
+        assert shared._singleflight("k-err", lambda: 42) == 42
+
+
+class TestRefreshAhead:
+    """Test cases for background refresh of aging cache entries."""
+
+    @patch("wasabi_s3_operator.handlers.shared.is_refresh_due", return_value=True)
+    @patch("wasabi_s3_operator.handlers.shared.get_cached_object")
+    def test_stale_hit_served_and_refreshed_once(self, mock_get_cached, mock_refresh_due):
+        """Test that an aging hit is returned and refreshed in the background once."""
+        from wasabi_s3_operator.handlers import shared
+
+        cached = {"metadata": {"name": "p"}}
+        mock_get_cached.return_value = cached
+        executor = Mock()
+
+        with patch.object(shared, "_refresh_executor", executor):
+            assert get_provider_with_cache(Mock(), "p", "ns") is cached
+            assert get_provider_with_cache(Mock(), "p", "ns") is cached
+
+        executor.submit.assert_called_once()
+        shared._refreshing.clear()
+
+    @patch("wasabi_s3_operator.handlers.shared.set_cached_object")
+    def test_refresh_failure_is_swallowed(self, mock_set_cached):
+        """Test that a failed background refresh leaves the entry to expire."""
+        from wasabi_s3_operator.handlers import shared
+
+        def failing():
+            raise RuntimeError("boom")
+
+        shared._refreshing.add("k-refresh")
+        shared._refresh("get_provider", "k-refresh", failing)
+
+        mock_set_cached.assert_not_called()
+        assert "k-refresh" not in shared._refreshing
+
+
+class TestRevalidate:
+    """Test cases for resourceVersion revalidation of cache entries."""
+
+    @patch("wasabi_s3_operator.handlers.shared.set_cached_object")
+    @patch("wasabi_s3_operator.handlers.shared.get_cached_object")
+    def test_unchanged_entry_is_kept(self, mock_get_cached, mock_set_cached):
+        """Test that a matching resourceVersion keeps the cached object without a GET."""
+        from wasabi_s3_operator.handlers import shared
+
+        cached = {"metadata": {"name": "p", "resourceVersion": "7"}}
+        mock_get_cached.return_value = cached
+        list_since = Mock(return_value={"items": [{"metadata": {"resourceVersion": "7"}}]})
+        fetch = Mock()
+        before = _api_call_count("get_provider", "revalidated")
+
+        shared._refresh("get_provider", "k-rv", fetch, list_since)
+
+        list_since.assert_called_once_with("7")
+        fetch.assert_not_called()
+        mock_set_cached.assert_called_once_with("k-rv", cached)
+        assert _api_call_count("get_provider", "revalidated") == before + 1
+
+    @patch("wasabi_s3_operator.handlers.shared.set_cached_object")
+    @patch("wasabi_s3_operator.handlers.shared.get_cached_object")
+    def test_changed_entry_is_replaced(self, mock_get_cached, mock_set_cached):
+        """Test that a newer resourceVersion replaces the cached object."""
+        from wasabi_s3_operator.handlers import shared
+
+        mock_get_cached.return_value = {"metadata": {"name": "p", "resourceVersion": "7"}}
+        current = {"metadata": {"name": "p", "resourceVersion": "9"}}
+        fetch = Mock()
+
+        shared._refresh("get_provider", "k-rv", fetch, Mock(return_value={"items": [current]}))
+
+        fetch.assert_not_called()
+        mock_set_cached.assert_called_once_with("k-rv", current)
+
+    @patch("wasabi_s3_operator.handlers.shared.get_cached_object")
+    def test_missing_object_falls_back_to_get(self, mock_get_cached):
+        """Test that an empty list falls back to a GET."""
+        from wasabi_s3_operator.handlers import shared
+
+        mock_get_cached.return_value = {"metadata": {"name": "p", "resourceVersion": "7"}}
+        fetch = Mock(side_effect=client.exceptions.ApiException(status=404))
 
+        shared._refresh("get_provider", "k-rv", fetch, Mock(return_value={"items": []}))
 
+        fetch.assert_called_once()
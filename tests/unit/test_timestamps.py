@@ -0,0 +1,45 @@
+"""Tests for timestamp helpers."""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from wasabi_s3_operator.utils.timestamps import now_iso, parse_iso
+
+
+class TestNowIso:
+    """Test cases for now_iso function."""
+
+    def test_format(self):
+        """Test timestamp is RFC 3339 UTC with second precision."""
+        value = now_iso()
+
+        assert value.endswith("Z")
+        assert len(value) == len("2024-01-01T00:00:00Z")
+
+    def test_parses_as_current_utc_time(self):
+        """Test timestamp round-trips through datetime parsing."""
+        parsed = datetime.fromisoformat(now_iso().replace("Z", "+00:00"))
+
+        assert parsed.tzinfo is not None
+        assert abs((datetime.now(timezone.utc) - parsed).total_seconds()) < 5
+
+
+class TestParseIso:
+    """Test cases for parse_iso function."""
+
+    def test_known_value(self):
+        """Test parsing a fixed timestamp."""
+        assert parse_iso("2024-01-01T00:00:00Z") == 1704067200.0
+
+    def test_round_trips_now_iso(self):
+        """Test that now_iso output parses back to the current time."""
+        assert abs(parse_iso(now_iso()) - time.time()) < 5
+
+    def test_rejects_other_formats(self):
+        """Test that non-matching strings raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_iso("2024-01-01 00:00:00")
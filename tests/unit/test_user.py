@@ -0,0 +1,95 @@
+"""Unit tests for the User handler."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from wasabi_s3_operator.handlers import user
+
+
+class TestHandleUserShortCircuit:
+    """Test that an already-reconciled User bypasses the timed reconcile."""
+
+    def _handle(self, status):
+        """Run handle_user with the reconcile wrapper mocked."""
+        meta = {"name": "u", "namespace": "default", "generation": 2, "finalizers": []}
+        with patch.object(user._handler, "reconcile_with_metrics") as reconcile:
+            user.handle_user(spec={}, meta=meta, status=status, patch=MagicMock())
+        return reconcile
+
+    def test_ready_user_at_generation_is_skipped(self):
+        """Test that a Ready user at the observed generation is not reconciled."""
+        status = {"userId": "AID1", "observedGeneration": 2, "conditions": [{"type": "Ready", "status": "True"}]}
+
+        self._handle(status).assert_not_called()
+
+    def test_new_generation_is_reconciled(self):
+        """Test that a spec change still runs the reconcile."""
+        status = {"userId": "AID1", "observedGeneration": 1, "conditions": [{"type": "Ready", "status": "True"}]}
+
+        self._handle(status).assert_called_once()
+
+
+class TestCreateUserWithPolicyRef:
+    """Test creating a User that references an IAMPolicy."""
+
+    def test_prefetched_policy_is_attached(self):
+        """Test that the IAMPolicy fetched alongside the Provider is attached to the new user."""
+        ready = {"conditions": [{"type": "Ready", "status": "True"}]}
+        provider_index = {("default", "wasabi"): [{"spec": {}, "metadata": {}, "status": ready}]}
+        iampolicy_index = {("default", "read-only"): [{"metadata": {"name": "read-only"}, "status": ready}]}
+        provider_client = Mock()
+        provider_client.create_user.return_value = {"User": {"UserId": "AID1"}}
+        meta = {"name": "u", "namespace": "default", "generation": 1}
+        spec = {"name": "app-user", "providerRef": {"name": "wasabi"}, "policyRef": {"name": "read-only"}}
+        kopf_patch = MagicMock()
+        with patch.object(user, "get_k8s_client"), \
+                patch.object(user, "get_cached_provider_client", return_value=provider_client), \
+                patch.object(user, "emit_validate_succeeded"):
+            user.UserHandler().reconcile(
+                spec, meta, {}, kopf_patch,
+                provider_index=provider_index, iampolicy_index=iampolicy_index,
+            )
+
+        provider_client.create_user.assert_called_once()
+        provider_client.attach_managed_policy_to_user.assert_called_once_with("app-user", "read-only")
+        status_update = kopf_patch.status.update.call_args[0][0]
+        assert status_update["userId"] == "AID1"
+        assert status_update["conditions"][0]["status"] == "True"
+
+    def test_indexed_policy_skips_executor(self):
+        """Test that an IAMPolicy already in the index is not fetched on the pool."""
+        ready = {"conditions": [{"type": "Ready", "status": "True"}]}
+        provider_index = {("default", "wasabi"): [{"spec": {}, "metadata": {}, "status": ready}]}
+        iampolicy_index = {("default", "read-only"): [{"metadata": {"name": "read-only"}, "status": ready}]}
+        provider_client = Mock()
+        provider_client.create_user.return_value = {"User": {"UserId": "AID1"}}
+        meta = {"name": "u", "namespace": "default", "generation": 1}
+        spec = {"name": "app-user", "providerRef": {"name": "wasabi"}, "policyRef": {"name": "read-only"}}
+        with patch.object(user, "get_k8s_client"), \
+                patch.object(user, "get_cached_provider_client", return_value=provider_client), \
+                patch.object(user, "emit_validate_succeeded"), \
+                patch.object(user, "_fetch_executor") as executor:
+            user.UserHandler().reconcile(
+                spec, meta, {}, MagicMock(),
+                provider_index=provider_index, iampolicy_index=iampolicy_index,
+            )
+
+        executor.submit.assert_not_called()
+
+    def test_pending_fetch_cancelled_when_provider_not_ready(self):
+        """Test that the IAMPolicy fetch is cancelled when reconcile bails out early."""
+        meta = {"name": "u", "namespace": "default", "generation": 1}
+        spec = {"name": "app-user", "providerRef": {"name": "wasabi"}, "policyRef": {"name": "read-only"}}
+        handler = user.UserHandler()
+        with patch.object(user, "get_k8s_client"), \
+                patch.object(user, "get_provider_with_cache", return_value={"status": {}}), \
+                patch.object(user, "emit_validate_succeeded"), \
+                patch.object(user, "_fetch_executor") as executor, \
+                patch.object(handler, "handle_provider_not_ready", side_effect=RuntimeError("not ready")), \
+                pytest.raises(RuntimeError):
+            handler.reconcile(spec, meta, {}, MagicMock())
+
+        executor.submit.return_value.cancel.assert_called_once()